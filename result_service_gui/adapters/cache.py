@@ -0,0 +1,125 @@
+"""Module for in-process read-through caches used by adapters."""
+
+import copy
+import logging
+import time
+import weakref
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+
+class TtlCache:
+    """In-process cache with time to live, tag invalidation and hit/miss counters.
+
+    Values are deep-copied on both set and get, since callers enrich and mutate
+    the dicts they get from adapters. Set copy_values to False for immutable
+    values. Each tag has a generation, changed on invalidation - a value read
+    before an invalidation is not stored when set with its generation.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        copy_values: bool = True,
+        max_entries: int = 0,
+    ) -> None:
+        """Initialize an empty cache - ttl 0 disables caching, max 0 is unbounded."""
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.copy_values = copy_values
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._tags: dict[str, set[Hashable]] = {}
+        self._generations: dict[str, int] = {}
+        self._clears = 0
+        all_caches.add(self)
+
+    @property
+    def enabled(self) -> bool:
+        """Return true if the cache stores values."""
+        return self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return a copy of the cached value, None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            logging.debug(f"Cache {self.name} miss {key} - {self.stats()}")
+            return None
+        self.hits += 1
+        return copy.deepcopy(entry[1]) if self.copy_values else entry[1]
+
+    def generation(self, tags: Iterable[str]) -> tuple[int, ...]:
+        """Return generation of the tags - read before the value is fetched."""
+        return (self._clears, *(self._generations.get(tag, 0) for tag in tags))
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: Iterable[str] = (),
+        generation: tuple[int, ...] | None = None,
+    ) -> None:
+        """Store a copy of value, invalidated by ttl or any of the tags.
+
+        If generation is given, and any of the tags has been invalidated
+        since, the value may be stale and is not stored.
+        """
+        if not self.enabled:
+            return
+        tags = tuple(tags)
+        if generation is not None and generation != self.generation(tags):
+            logging.debug(f"Cache {self.name} skipped stale value {key}")
+            return
+        if (
+            self.max_entries
+            and key not in self._entries
+            and len(self._entries) >= self.max_entries
+        ):
+            self._evict()
+        self._entries[key] = (
+            time.monotonic() + self.ttl_seconds,
+            copy.deepcopy(value) if self.copy_values else value,
+        )
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+    def _evict(self) -> None:
+        """Remove expired values, and the oldest value if still full."""
+        now = time.monotonic()
+        for key in [key for key, entry in self._entries.items() if entry[0] < now]:
+            del self._entries[key]
+        if len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, tag: str) -> None:
+        """Remove all values stored with the given tag."""
+        for key in self._tags.pop(tag, set()):
+            self._entries.pop(key, None)
+        self._generations[tag] = self._generations.get(tag, 0) + 1
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._entries.clear()
+        self._tags.clear()
+        self._clears += 1
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Return hit/miss counters."""
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+# all caches, for metrics
+all_caches: weakref.WeakSet[TtlCache] = weakref.WeakSet()
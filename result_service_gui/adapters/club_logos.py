@@ -0,0 +1,84 @@
+"""Module for the in-memory club logo index."""
+
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from types import MappingProxyType
+
+PROJECT_ROOT = f"{Path.cwd()}/result_service_gui"
+CLUB_LOGO_FILE = Path(f"{PROJECT_ROOT}/config/sports_clubs.json")
+CLUB_LOGO_RELOAD_SECONDS = float(os.getenv("CLUB_LOGO_RELOAD_SECONDS", "0"))
+
+
+class ClubLogoIndex:
+    """Immutable mapping from club name (4 first chars) to logo url.
+
+    Loaded once from file. If reload_seconds is set, the file modification time
+    is checked at most that often and the mapping is reloaded when changed.
+    """
+
+    def __init__(self, config_file: Path, reload_seconds: float = 0) -> None:
+        """Initialize an empty index - loaded on first use."""
+        self.config_file = config_file
+        self.reload_seconds = reload_seconds
+        self._logo_urls: Mapping[str, str] | None = None
+        self._mtime = 0.0
+        self._next_reload_check = 0.0
+        self._missing: set[str] = set()
+
+    def load(self) -> None:
+        """Read club logo mapping from file - keep current mapping on error."""
+        try:
+            mtime = self.config_file.stat().st_mtime
+            with self.config_file.open() as json_file:
+                logo_urls = MappingProxyType(json.load(json_file))
+        except (OSError, ValueError):
+            logging.exception(f"Error loading club logos {self.config_file}")
+            if self._logo_urls is None:
+                self._logo_urls = MappingProxyType({})
+            return
+        self._logo_urls = logo_urls
+        self._mtime = mtime
+        self._missing = set()
+        logging.info(
+            f"Loaded {len(self._logo_urls)} club logos from {self.config_file}"
+        )
+
+    def _get_logo_urls(self) -> Mapping[str, str]:
+        """Return the mapping, load or reload from file if required."""
+        if self._logo_urls is None:
+            self.load()
+        elif self.reload_seconds > 0 and time.monotonic() > self._next_reload_check:
+            self._next_reload_check = time.monotonic() + self.reload_seconds
+            try:
+                if self.config_file.stat().st_mtime != self._mtime:
+                    self.load()
+            except Exception:
+                logging.exception(f"Error reloading club logos {self.config_file}")
+        return self._logo_urls or MappingProxyType({})
+
+    def get_logo_url(self, club_name: str) -> str:
+        """Get url to club logo - input is club name."""
+        return self.get_logo_urls([club_name]).get(club_name, "")
+
+    def get_logo_urls(self, clubs: Iterable[str]) -> dict[str, str]:
+        """Get url to club logo for each club - empty string if not found."""
+        logo_urls = self._get_logo_urls()
+        result = {}
+        for club_name in clubs:
+            if club_name in result:
+                continue
+            logo_url = ""
+            if club_name:
+                logo_url = logo_urls.get(club_name[:4].ljust(4), "")
+                if not logo_url and club_name not in self._missing:
+                    self._missing.add(club_name)
+                    logging.error(f"Club logo not found - {club_name}")
+            result[club_name] = logo_url
+        return result
+
+
+club_logo_index = ClubLogoIndex(CLUB_LOGO_FILE, CLUB_LOGO_RELOAD_SECONDS)
@@ -6,9 +6,13 @@ import os
 from http import HTTPStatus
 from pathlib import Path
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from multidict import MultiDict
 
+from .http_client import pooled_session
+from .request_memo import request_memoized
+from .singleflight import singleflight
+
 COMPETITION_FORMAT_HOST_SERVER = os.getenv(
     "COMPETITION_FORMAT_HOST_SERVER", "localhost"
 )
@@ -32,7 +36,7 @@ class CompetitionFormatAdapter:
         )
         url = f"{COMPETITION_FORMAT_SERVICE_URL}/competition-formats"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(url, headers=headers, json=request_body) as resp,
         ):
             res = resp.status
@@ -60,7 +64,7 @@ class CompetitionFormatAdapter:
         )
         url = f"{COMPETITION_FORMAT_SERVICE_URL}/competition-formats/{my_id}"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(url, headers=headers) as resp,
         ):
             res = resp.status
@@ -78,6 +82,8 @@ class CompetitionFormatAdapter:
                 )
         return f"Slettet competition format {resp.status}."
 
+    @request_memoized
+    @singleflight
     async def get_competition_formats(self, token: str) -> list:
         """Get competition_formats function."""
         competition_formats = []
@@ -89,7 +95,7 @@ class CompetitionFormatAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{COMPETITION_FORMAT_SERVICE_URL}/competition-formats", headers=headers
             ) as resp,
@@ -152,7 +158,7 @@ class CompetitionFormatAdapter:
             f"{COMPETITION_FORMAT_SERVICE_URL}/competition-formats/{request_body['id']}"
         )
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.put(url, headers=headers, json=request_body) as resp,
         ):
             res = resp.status
@@ -181,7 +187,7 @@ class CompetitionFormatAdapter:
         )
         url = f"{COMPETITION_FORMAT_SERVICE_URL}/race-configs"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(url, headers=headers, json=request_body) as resp,
         ):
             res = resp.status
@@ -209,7 +215,7 @@ class CompetitionFormatAdapter:
         )
         url = f"{COMPETITION_FORMAT_SERVICE_URL}/race-configs/{my_id}"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(url, headers=headers) as resp,
         ):
             res = resp.status
@@ -238,7 +244,7 @@ class CompetitionFormatAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{COMPETITION_FORMAT_SERVICE_URL}/race-configs", headers=headers
             ) as resp,
@@ -270,7 +276,7 @@ class CompetitionFormatAdapter:
         )
         url = f"{COMPETITION_FORMAT_SERVICE_URL}/race-configs/{request_body['id']}"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.put(url, headers=headers, json=request_body) as resp,
         ):
             res = resp.status
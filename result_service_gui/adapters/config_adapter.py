@@ -5,20 +5,25 @@ import json
 import logging
 import os
 from http import HTTPStatus
-from pathlib import Path
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from multidict import MultiDict
 
+from .global_settings import GLOBAL_SETTINGS_FILE, get_global_settings
+from .http_client import pooled_session
+from .request_memo import request_memoized
+from .singleflight import singleflight
+
 PHOTOS_HOST_SERVER = os.getenv("PHOTOS_HOST_SERVER", "localhost")
 PHOTOS_HOST_PORT = os.getenv("PHOTOS_HOST_PORT", "8092")
 PHOTO_SERVICE_URL = f"http://{PHOTOS_HOST_SERVER}:{PHOTOS_HOST_PORT}"
-PROJECT_ROOT = f"{Path.cwd()}/result_service_gui"
 
 
 class ConfigAdapter:
     """Class representing config."""
 
+    @request_memoized
+    @singleflight
     async def get_config(self, token: str, event_id: str, key: str) -> str:
         """Get config by key function."""
         config = {}
@@ -31,7 +36,7 @@ class ConfigAdapter:
         servicename = "get_config"
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{PHOTO_SERVICE_URL}/config?key={key}&eventId={event_id}",
                 headers=headers,
@@ -44,15 +49,15 @@ class ConfigAdapter:
                 raise Exception(informasjon)
             elif resp.status == HTTPStatus.NOT_FOUND:
                 # config not found - find default value
-                config_file = Path(f"{PROJECT_ROOT}/config/global_settings.json")
-                with config_file.open() as json_file:
-                    settings = json.load(json_file)
-                    if key in settings:
-                        value = settings[key]
-                        # create config
-                        await self.create_config(token, event_id, key, value)
-                        return value
-                informasjon = f"Config {key} not found in config file {config_file}."
+                settings = get_global_settings().values
+                if key in settings:
+                    value = settings[key]
+                    # create config
+                    await self.create_config(token, event_id, key, value)
+                    return value
+                informasjon = (
+                    f"Config {key} not found in config file {GLOBAL_SETTINGS_FILE}."
+                )
                 logging.error(informasjon)
                 raise web.HTTPBadRequest(reason=informasjon)
             else:
@@ -62,6 +67,8 @@ class ConfigAdapter:
                 raise web.HTTPBadRequest(reason=informasjon)
         return config["value"]
 
+    @request_memoized
+    @singleflight
     async def get_all_configs(self, token: str, event_id: str) -> list:
         """Get config by google id function."""
         config = []
@@ -78,7 +85,7 @@ class ConfigAdapter:
             url = f"{PHOTO_SERVICE_URL}/configs"
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 url,
                 headers=headers,
@@ -155,7 +162,7 @@ class ConfigAdapter:
         request_body = copy.deepcopy(config)
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{PHOTO_SERVICE_URL}/config",
                 headers=headers,
@@ -211,7 +218,7 @@ class ConfigAdapter:
         }
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.put(
                 f"{PHOTO_SERVICE_URL}/config",
                 headers=headers,
@@ -223,15 +230,15 @@ class ConfigAdapter:
                 logging.debug(f"update config - got response {resp}")
             elif resp.status == HTTPStatus.NOT_FOUND:
                 # config not found - find default value
-                config_file = Path(f"{PROJECT_ROOT}/config/global_settings.json")
-                with config_file.open() as json_file:
-                    settings = json.load(json_file)
-                    if key in settings:
-                        value = settings[key]
-                        # create config
-                        await self.create_config(token, event_id, key, value)
-                        return value
-                informasjon = f"Config {key} not found in config file {config_file}."
+                settings = get_global_settings().values
+                if key in settings:
+                    value = settings[key]
+                    # create config
+                    await self.create_config(token, event_id, key, value)
+                    return value
+                informasjon = (
+                    f"Config {key} not found in config file {GLOBAL_SETTINGS_FILE}."
+                )
                 logging.error(informasjon)
                 raise web.HTTPBadRequest(reason=informasjon)
             elif resp.status == HTTPStatus.UNAUTHORIZED:
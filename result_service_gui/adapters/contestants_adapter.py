@@ -8,9 +8,12 @@ from datetime import datetime
 from http import HTTPStatus
 from typing import Any
 
-from aiohttp import ClientSession, FormData, hdrs, web
+from aiohttp import FormData, hdrs, web
 from multidict import MultiDict
 
+from .http_client import pooled_session
+from .request_memo import request_memoized
+from .singleflight import singleflight
 from .start_adapter import StartAdapter
 
 EVENTS_HOST_SERVER = os.getenv("EVENTS_HOST_SERVER", "localhost")
@@ -48,7 +51,7 @@ class ContestantsAdapter:
         if start_bib:
             url += f"?start-bib={start_bib}"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(url, headers=headers) as resp,
         ):
             res = resp.status
@@ -87,7 +90,7 @@ class ContestantsAdapter:
         # Exclude values that are empty or None - this allows for partial updates
         request_body = {k: v for k, v in request_body.items() if v not in ("", None)}
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/contestants",
                 headers=headers,
@@ -121,7 +124,7 @@ class ContestantsAdapter:
             content_type="text/csv",
         )
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/contestants/file",
                 headers=headers,
@@ -166,7 +169,7 @@ class ContestantsAdapter:
         }
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/contestants",
                 headers=headers,
@@ -209,7 +212,7 @@ class ContestantsAdapter:
             hdrs.AUTHORIZATION: f"Bearer {token}",
         }
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/contestants/{contestant['id']}",
                 headers=headers,
@@ -230,6 +233,8 @@ class ContestantsAdapter:
                 )
         return str(res)
 
+    @request_memoized
+    @singleflight
     async def get_all_contestants(self, token: str, event_id: str) -> list:
         """Get all contestants function."""
         headers = MultiDict(
@@ -240,7 +245,7 @@ class ContestantsAdapter:
         )
         contestants = []
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/contestants", headers=headers
             ) as resp,
@@ -271,7 +276,7 @@ class ContestantsAdapter:
         ageclass_name_url = urllib.parse.quote(ageclass_name, safe="")
         query_param = f"ageclass={ageclass_name_url}"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/contestants?{query_param}",
                 headers=headers,
@@ -289,6 +294,8 @@ class ContestantsAdapter:
                 )
         return contestants
 
+    @request_memoized
+    @singleflight
     async def get_all_contestants_by_raceclass(
         self, token: str, event_id: str, raceclass_name: str
     ) -> list:
@@ -302,7 +309,7 @@ class ContestantsAdapter:
         contestants = []
         raceclass_name_url = urllib.parse.quote(raceclass_name, safe="")
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/contestants?raceclass={raceclass_name_url}",
                 headers=headers,
@@ -334,7 +341,7 @@ class ContestantsAdapter:
         )
         contestant = []
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/contestants?bib={bib}",
                 headers=headers,
@@ -367,7 +374,7 @@ class ContestantsAdapter:
         contestants = []
         raceclass_url = urllib.parse.quote(raceclass, safe="")
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/contestants?raceclass={raceclass_url}",
                 headers=headers,
@@ -397,7 +404,7 @@ class ContestantsAdapter:
         )
         contestant = {}
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/contestants/{contestant_id}",
                 headers=headers,
@@ -429,7 +436,7 @@ class ContestantsAdapter:
             ]
         )
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/contestants/search",
                 headers=headers,
@@ -479,7 +486,7 @@ class ContestantsAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.put(url, headers=headers, json=request_body) as resp,
         ):
             res = resp.status
@@ -2,17 +2,21 @@
 
 import copy
 import datetime
-import json
 import logging
 import os
+from collections.abc import Iterable
 from http import HTTPStatus
-from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from multidict import MultiDict
 
+from .club_logos import club_logo_index
 from .competition_format_adapter import CompetitionFormatAdapter
+from .global_settings import GLOBAL_SETTINGS_FILE, get_global_settings
+from .http_client import pooled_session
+from .request_memo import request_memoized
+from .singleflight import singleflight
 
 EVENTS_HOST_SERVER = os.getenv("EVENTS_HOST_SERVER", "localhost")
 EVENTS_HOST_PORT = os.getenv("EVENTS_HOST_PORT", "8082")
@@ -32,7 +36,7 @@ class EventsAdapter:
         )
         url = f"{EVENT_SERVICE_URL}/events/{event_id}/generate-raceclasses"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(url, headers=headers) as resp,
         ):
             res = resp.status
@@ -50,6 +54,8 @@ class EventsAdapter:
                 )
         return "Opprettet klasser."
 
+    @request_memoized
+    @singleflight
     async def get_all_events(self, token: str) -> list:
         """Get all events function."""
         events = []
@@ -61,7 +67,7 @@ class EventsAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(f"{EVENT_SERVICE_URL}/events", headers=headers) as resp,
         ):
             logging.debug(f"get_all_events - got response {resp.status}")
@@ -76,6 +82,8 @@ class EventsAdapter:
                 logging.error(f"Error {resp.status} getting events: {resp} ")
         return events
 
+    @request_memoized
+    @singleflight
     async def get_event(self, token: str, my_id: str) -> dict:
         """Get event function."""
         event = {}
@@ -87,7 +95,7 @@ class EventsAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(f"{EVENT_SERVICE_URL}/events/{my_id}", headers=headers) as resp,
         ):
             logging.debug(f"get_event {my_id} - got response {resp.status}")
@@ -108,17 +116,12 @@ class EventsAdapter:
         return event
 
     def get_global_setting(self, param_name: str) -> str:
-        """Get global settings from .env file."""
-        config_file = Path(
-            f"{Path.cwd()}/result_service_gui/config/global_settings.json"
-        )
+        """Get global settings from config file - loaded once at startup."""
         try:
-            with config_file.open() as json_file:
-                settings = json.load(json_file)
-                global_setting = settings[param_name]
+            global_setting = get_global_settings().get(param_name)
         except Exception as e:
             logging.exception(
-                f"Global setting {param_name} not found. File path {config_file}"
+                f"Global setting {param_name} not found. File path {GLOBAL_SETTINGS_FILE}"
             )
             raise Exception from e
         return global_setting
@@ -143,6 +146,14 @@ class EventsAdapter:
             boolean_value = True
         return boolean_value
 
+    def get_date_patterns(self) -> tuple[str, ...]:
+        """Get DATE_PATTERNS global setting, split into a tuple of patterns."""
+        return get_global_settings().date_patterns
+
+    def get_time_zone_offset_g_photos(self) -> int:
+        """Get TIME_ZONE_OFFSET_G_PHOTOS global setting in hours."""
+        return get_global_settings().time_zone_offset_g_photos
+
     def get_local_datetime_now(self, event: dict) -> datetime.datetime:
         """Return local datetime object, time zone adjusted from event info."""
         time_zone = event["timezone"]
@@ -172,17 +183,11 @@ class EventsAdapter:
 
     def get_club_logo_url(self, club_name: str) -> str:
         """Get url to club logo - input is 4 first chars of club name."""
-        config_file = Path(f"{Path.cwd()}/result_service_gui/config/sports_clubs.json")
-        logo_url = ""
-        if club_name:
-            try:
-                club_name_short = club_name[:4].ljust(4)
-                with config_file.open() as json_file:
-                    logo_urls = json.load(json_file)
-                logo_url = logo_urls[club_name_short]
-            except Exception:
-                logging.exception(f"Club logo not found - {club_name}")
-        return logo_url
+        return club_logo_index.get_logo_url(club_name)
+
+    def get_club_logo_urls(self, clubs: Iterable[str]) -> dict[str, str]:
+        """Get url to club logo for many clubs in one pass - keyed by club name."""
+        return club_logo_index.get_logo_urls(clubs)
 
     async def create_event(self, token: str, event: dict) -> str:
         """Create new event function."""
@@ -214,7 +219,7 @@ class EventsAdapter:
         # Exclude values that are empty strings or None, as the event service will set default values for these
         request_body = {k: v for k, v in request_body.items() if v not in ["", None]}
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{EVENT_SERVICE_URL}/events", headers=headers, json=request_body
             ) as resp,
@@ -245,7 +250,7 @@ class EventsAdapter:
         )
         url = f"{EVENT_SERVICE_URL}/events/{my_id}"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(url, headers=headers) as resp,
         ):
             if resp.status == HTTPStatus.NO_CONTENT:
@@ -269,7 +274,7 @@ class EventsAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.put(
                 f"{EVENT_SERVICE_URL}/events/{my_id}",
                 headers=headers,
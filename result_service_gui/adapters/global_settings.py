@@ -0,0 +1,71 @@
+"""Module for global settings, loaded once from config file."""
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+PROJECT_ROOT = f"{Path.cwd()}/result_service_gui"
+GLOBAL_SETTINGS_FILE = Path(f"{PROJECT_ROOT}/config/global_settings.json")
+DEFAULT_DATE_PATTERNS = (
+    "%Y-%m-%dT%H:%M:%S;%Y:%m:%d %H:%M:%S;%d.%m.%Y %H:%M:%S;%Y%m%d %H:%M:%S"
+)
+
+
+@dataclass(frozen=True)
+class GlobalSettings:
+    """Immutable global settings with pre-parsed values for hot code paths."""
+
+    values: MappingProxyType
+    date_patterns: tuple[str, ...]
+    time_zone_offset_g_photos: int
+
+    @classmethod
+    def from_file(cls, config_file: Path) -> "GlobalSettings":
+        """Read settings from json file."""
+        with config_file.open() as json_file:
+            return cls.from_values(json.load(json_file))
+
+    @classmethod
+    def from_values(cls, values: dict) -> "GlobalSettings":
+        """Create settings, with defaults for pre-parsed values not given."""
+        return cls(
+            values=MappingProxyType(values),
+            date_patterns=tuple(
+                values.get("DATE_PATTERNS", DEFAULT_DATE_PATTERNS).split(";")
+            ),
+            time_zone_offset_g_photos=int(values.get("TIME_ZONE_OFFSET_G_PHOTOS", 0)),
+        )
+
+    def get(self, param_name: str) -> Any:
+        """Get setting value - raise KeyError if not found."""
+        return self.values[param_name]
+
+
+_global_settings: GlobalSettings | None = None
+
+
+def load_global_settings() -> GlobalSettings:
+    """Load global settings from file - called at startup.
+
+    If the file can not be read, the error is logged and defaults are used.
+    Settings without a default are then not found.
+    """
+    global _global_settings  # noqa: PLW0603
+    try:
+        _global_settings = GlobalSettings.from_file(GLOBAL_SETTINGS_FILE)
+    except (OSError, ValueError):
+        logging.exception(f"Error loading global settings {GLOBAL_SETTINGS_FILE}")
+        _global_settings = GlobalSettings.from_values({})
+    else:
+        logging.info(f"Loaded global settings from {GLOBAL_SETTINGS_FILE}")
+    return _global_settings
+
+
+def get_global_settings() -> GlobalSettings:
+    """Return global settings - loaded on first use if not loaded at startup."""
+    if _global_settings is None:
+        return load_global_settings()
+    return _global_settings
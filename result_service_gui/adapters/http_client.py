@@ -0,0 +1,139 @@
+"""Module for the shared http client used by all adapters."""
+
+import asyncio
+import logging
+import os
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+    TraceRequestStartParams,
+    hdrs,
+    web,
+)
+
+from .request_memo import clear_request_memo
+from .request_stats import (
+    on_upstream_request_end,
+    on_upstream_request_exception,
+    on_upstream_request_start,
+)
+
+HTTP_CLIENT_LIMIT = int(os.getenv("HTTP_CLIENT_LIMIT", "100"))
+HTTP_CLIENT_LIMIT_PER_HOST = int(os.getenv("HTTP_CLIENT_LIMIT_PER_HOST", "20"))
+HTTP_CLIENT_DNS_CACHE_SECONDS = int(os.getenv("HTTP_CLIENT_DNS_CACHE_SECONDS", "300"))
+HTTP_CLIENT_KEEPALIVE_SECONDS = float(os.getenv("HTTP_CLIENT_KEEPALIVE_SECONDS", "30"))
+HTTP_CLIENT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CLIENT_TIMEOUT_SECONDS", "300"))
+HTTP_CLIENT_MAX_CONCURRENT_PER_REQUEST = int(
+    os.getenv("HTTP_CLIENT_MAX_CONCURRENT_PER_REQUEST", "8")
+)
+
+client_session_key = web.AppKey("client_session", ClientSession)
+
+_session: ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+_closing_tasks: set[asyncio.Task] = set()
+
+
+def create_client_session() -> ClientSession:
+    """Create a client session with a pooled, keep-alive connector."""
+    connector = TCPConnector(
+        limit=HTTP_CLIENT_LIMIT,
+        limit_per_host=HTTP_CLIENT_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_CLIENT_DNS_CACHE_SECONDS,
+        use_dns_cache=True,
+        keepalive_timeout=HTTP_CLIENT_KEEPALIVE_SECONDS,
+    )
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_start.append(on_upstream_request_start)
+    trace_config.on_request_end.append(on_upstream_request_end)
+    trace_config.on_request_exception.append(on_upstream_request_exception)
+    return ClientSession(
+        connector=connector,
+        timeout=ClientTimeout(total=HTTP_CLIENT_TIMEOUT_SECONDS),
+        trace_configs=[trace_config],
+    )
+
+
+async def on_request_start(
+    _client_session: ClientSession, _context: Any, params: TraceRequestStartParams
+) -> None:
+    """Clear memoized reads in current request when data is changed."""
+    if params.method not in (hdrs.METH_GET, hdrs.METH_HEAD):
+        clear_request_memo()
+
+
+def get_client_session() -> ClientSession:
+    """Return the shared client session - created on first use."""
+    global _session, _session_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        if _session is not None and not _session.closed:
+            close_stale_session(_session, _session_loop)
+        _session = create_client_session()
+        _session_loop = loop
+        logging.debug("Created shared client session")
+    return _session
+
+
+def close_stale_session(
+    session: ClientSession, session_loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Close session from another event loop - on its own loop if not closed.
+
+    Connections of a closed loop are gone with it, the session is then
+    closed on the running loop, to release it without warnings.
+    """
+    if session_loop is not None and not session_loop.is_closed():
+        asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+        return
+    task = asyncio.get_running_loop().create_task(session.close())
+    _closing_tasks.add(task)
+    task.add_done_callback(_closing_tasks.discard)
+    logging.debug("Closed client session from closed event loop")
+
+
+@asynccontextmanager
+async def pooled_session() -> AsyncIterator[ClientSession]:
+    """Yield the shared client session without closing it on exit."""
+    yield get_client_session()
+
+
+async def client_session_ctx(app: web.Application) -> AsyncIterator[None]:
+    """Create the shared client session on startup and close it on shutdown."""
+    app[client_session_key] = get_client_session()
+    logging.info(
+        f"Shared client session - limit: {HTTP_CLIENT_LIMIT}, "
+        f"limit per host: {HTTP_CLIENT_LIMIT_PER_HOST}"
+    )
+    yield
+    await close_client_session()
+
+
+async def close_client_session() -> None:
+    """Close the shared client session - a new one is created on next use."""
+    global _session, _session_loop  # noqa: PLW0603
+    if _session is not None:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+async def gather_bounded[T](
+    aws: Iterable[Awaitable[T]],
+    limit: int = HTTP_CLIENT_MAX_CONCURRENT_PER_REQUEST,
+) -> list[T]:
+    """Await all awaitables concurrently, max limit in flight, results in order."""
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def run_bounded(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run_bounded(aw) for aw in aws))
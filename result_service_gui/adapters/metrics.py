@@ -0,0 +1,275 @@
+"""Module for request, upstream and cache metrics, aggregated across workers."""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Callable, Iterable
+from pathlib import Path
+
+from aiohttp import web
+
+from .cache import all_caches
+from .singleflight import upstream_reads
+
+METRICS_DIR = Path(
+    os.getenv("METRICS_DIR") or f"{tempfile.gettempdir()}/result-service-gui-metrics"
+)
+METRICS_WRITE_SECONDS = float(os.getenv("METRICS_WRITE_SECONDS", "5"))
+EVENT_LOOP_LAG_INTERVAL_SECONDS = 1.0
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+type Labels = tuple[tuple[str, str], ...]
+type MetricKey = tuple[str, Labels]
+
+
+class Metrics:
+    """Counters, gauges and latency histograms for one worker.
+
+    Each worker writes its metrics to a file in METRICS_DIR. The /metrics
+    endpoint adds up the files of all workers: counters and histograms are
+    summed, gauges are summed or use the max, see gauge_max.
+    """
+
+    def __init__(self, metrics_dir: Path) -> None:
+        """Initialize empty metrics - written to a file pr process id."""
+        self.metrics_dir = metrics_dir
+        self.help: dict[str, tuple[str, str]] = {}
+        self.counters: dict[MetricKey, float] = {}
+        self.gauges: dict[MetricKey, float] = {}
+        self.gauge_max: set[str] = set()
+        # bucket counts, then sum and count
+        self.histograms: dict[MetricKey, list[float]] = {}
+        self.collectors: list[Callable[[], None]] = []
+
+    def describe(self, name: str, metric_type: str, text: str) -> None:
+        """Add type and help text for metric."""
+        self.help[name] = (metric_type, text)
+
+    def inc(self, name: str, labels: Labels = (), value: float = 1) -> None:
+        """Increase counter."""
+        key = (name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_counter(self, name: str, labels: Labels, value: float) -> None:
+        """Set counter kept elsewhere, like cache hits."""
+        self.counters[(name, labels)] = value
+
+    def set_gauge(self, name: str, labels: Labels, value: float) -> None:
+        """Set gauge to value."""
+        self.gauges[(name, labels)] = value
+
+    def add_gauge(self, name: str, labels: Labels, value: float) -> None:
+        """Add value to gauge - negative to decrease."""
+        key = (name, labels)
+        self.gauges[key] = self.gauges.get(key, 0) + value
+
+    def observe(self, name: str, labels: Labels, seconds: float) -> None:
+        """Add observation to latency histogram."""
+        key = (name, labels)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = [0.0] * (len(LATENCY_BUCKETS) + 2)
+            self.histograms[key] = histogram
+        index = bisect_left(LATENCY_BUCKETS, seconds)
+        if index < len(LATENCY_BUCKETS):
+            histogram[index] += 1
+        histogram[-2] += seconds
+        histogram[-1] += 1
+
+    def snapshot(self) -> dict:
+        """Return metrics of this worker as json serializable dict."""
+        for collect in self.collectors:
+            collect()
+        return {
+            "written": time.time(),
+            "counters": [[n, labels, v] for (n, labels), v in self.counters.items()],
+            "gauges": [[n, labels, v] for (n, labels), v in self.gauges.items()],
+            "histograms": [
+                [n, labels, v] for (n, labels), v in self.histograms.items()
+            ],
+        }
+
+    def write(self) -> None:
+        """Write metrics of this worker to its file."""
+        path = self.metrics_dir / f"worker-{os.getpid()}.json"
+        try:
+            self.metrics_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self.snapshot()))
+            tmp_path.replace(path)
+        except OSError:
+            logging.exception(f"Could not write metrics to {path}")
+
+    def read_all(self) -> list[dict]:
+        """Return snapshots of all workers - own snapshot is always fresh."""
+        self.write()
+        snapshots = []
+        for path in sorted(self.metrics_dir.glob("worker-*.json")):
+            try:
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                logging.exception(f"Could not read metrics from {path}")
+        return snapshots or [self.snapshot()]
+
+    def render(self) -> str:
+        """Return metrics of all workers in Prometheus text format."""
+        counters: dict[MetricKey, float] = {}
+        gauges: dict[MetricKey, float] = {}
+        histograms: dict[MetricKey, list[float]] = {}
+        stale_before = time.time() - 3 * METRICS_WRITE_SECONDS
+        for snapshot in self.read_all():
+            for name, labels, value in snapshot["counters"]:
+                key = (name, to_labels(labels))
+                counters[key] = counters.get(key, 0) + value
+            # gauges of stopped workers are no longer valid
+            if snapshot["written"] >= stale_before:
+                for name, labels, value in snapshot["gauges"]:
+                    key = (name, to_labels(labels))
+                    if key not in gauges:
+                        gauges[key] = value
+                    elif name in self.gauge_max:
+                        gauges[key] = max(gauges[key], value)
+                    else:
+                        gauges[key] += value
+            for name, labels, values in snapshot["histograms"]:
+                key = (name, to_labels(labels))
+                total = histograms.setdefault(key, [0.0] * len(values))
+                for i, value in enumerate(values):
+                    total[i] += value
+
+        lines: list[str] = []
+        # ratio from the sum of all workers
+        for (name, labels), hits in list(counters.items()):
+            if name == "cache_hits_total":
+                misses = counters.get(("cache_misses_total", labels), 0)
+                if hits + misses > 0:
+                    gauges[("cache_hit_ratio", labels)] = hits / (hits + misses)
+        self._render_samples(lines, counters)
+        self._render_samples(lines, gauges)
+        for name in sorted({name for name, _ in histograms}):
+            self._render_help(lines, name)
+            for (key_name, labels), values in sorted(histograms.items()):
+                if key_name != name:
+                    continue
+                cumulative = 0.0
+                for bucket, count in zip(LATENCY_BUCKETS, values, strict=False):
+                    cumulative += count
+                    bucket_labels = (*labels, ("le", str(bucket)))
+                    lines.append(
+                        f"{name}_bucket{format_labels(bucket_labels)} {cumulative:g}"
+                    )
+                inf_labels = (*labels, ("le", "+Inf"))
+                lines.append(f"{name}_bucket{format_labels(inf_labels)} {values[-1]:g}")
+                lines.append(f"{name}_sum{format_labels(labels)} {values[-2]:.6f}")
+                lines.append(f"{name}_count{format_labels(labels)} {values[-1]:g}")
+        return "\n".join(lines) + "\n"
+
+    def _render_help(self, lines: list[str], name: str) -> None:
+        """Add HELP and TYPE lines for metric."""
+        metric_type, text = self.help.get(name, ("untyped", ""))
+        lines.append(f"# HELP {name} {text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+    def _render_samples(
+        self, lines: list[str], samples: dict[MetricKey, float]
+    ) -> None:
+        """Add samples grouped by metric name."""
+        for name in sorted({name for name, _ in samples}):
+            self._render_help(lines, name)
+            lines.extend(
+                f"{name}{format_labels(labels)} {value:g}"
+                for (key_name, labels), value in sorted(samples.items())
+                if key_name == name
+            )
+
+
+def to_labels(labels: Iterable[Iterable[str]]) -> Labels:
+    """Return labels read from json as hashable tuple."""
+    return tuple((str(key), str(value)) for key, value in labels)
+
+
+def format_labels(labels: Labels) -> str:
+    """Return labels in Prometheus text format."""
+    if not labels:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+metrics = Metrics(METRICS_DIR)
+metrics.describe("http_requests_total", "counter", "Requests pr route and status.")
+metrics.describe(
+    "http_request_duration_seconds", "histogram", "Request latency pr route."
+)
+metrics.describe("http_requests_in_flight", "gauge", "Requests being handled.")
+metrics.describe(
+    "upstream_requests_total", "counter", "Backend calls pr adapter method and status."
+)
+metrics.describe(
+    "upstream_request_duration_seconds",
+    "histogram",
+    "Backend call latency until response headers, pr adapter method.",
+)
+metrics.describe("event_loop_lag_seconds", "gauge", "Max event loop delay of workers.")
+metrics.gauge_max.add("event_loop_lag_seconds")
+metrics.describe("cache_hits_total", "counter", "Cache hits pr in-process cache.")
+metrics.describe("cache_misses_total", "counter", "Cache misses pr in-process cache.")
+metrics.describe("cache_hit_ratio", "gauge", "Hits of all cache reads, all workers.")
+metrics.describe(
+    "upstream_reads_collapsed_total",
+    "counter",
+    "Reads that shared an identical backend call in flight.",
+)
+
+
+def collect_cache_stats() -> None:
+    """Copy counters from caches and coalesced reads."""
+    for cache in list(all_caches):
+        labels = (("cache", cache.name),)
+        metrics.set_counter("cache_hits_total", labels, cache.hits)
+        metrics.set_counter("cache_misses_total", labels, cache.misses)
+    metrics.set_counter("upstream_reads_collapsed_total", (), upstream_reads.collapsed)
+
+
+metrics.collectors.append(collect_cache_stats)
+
+
+def clear_metrics_dir(metrics_dir: Path = METRICS_DIR) -> None:
+    """Remove metrics files of earlier runs - called once when server starts."""
+    for path in metrics_dir.glob("worker-*.json"):
+        path.unlink(missing_ok=True)
+
+
+async def monitor_event_loop_lag() -> None:
+    """Measure how much later than scheduled the event loop wakes up."""
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(EVENT_LOOP_LAG_INTERVAL_SECONDS)
+        lag = time.perf_counter() - started - EVENT_LOOP_LAG_INTERVAL_SECONDS
+        metrics.set_gauge("event_loop_lag_seconds", (), max(lag, 0.0))
+
+
+async def write_metrics_periodically() -> None:
+    """Write metrics of this worker to file, so other workers can serve them."""
+    while True:
+        await asyncio.sleep(METRICS_WRITE_SECONDS)
+        metrics.write()
+
+
+async def metrics_ctx(_app: web.Application) -> AsyncIterator[None]:
+    """Run event loop lag monitor and metrics writer while app is running."""
+    tasks = [
+        asyncio.create_task(monitor_event_loop_lag()),
+        asyncio.create_task(write_metrics_periodically()),
+    ]
+    yield
+    for task in tasks:
+        task.cancel()
+    metrics.write()
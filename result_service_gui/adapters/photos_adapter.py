@@ -5,9 +5,11 @@ import logging
 import os
 from http import HTTPStatus
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from multidict import MultiDict
 
+from .http_client import pooled_session
+
 PHOTOS_HOST_SERVER = os.getenv("PHOTOS_HOST_SERVER", "localhost")
 PHOTOS_HOST_PORT = os.getenv("PHOTOS_HOST_PORT", "8092")
 PHOTO_SERVICE_URL = f"http://{PHOTOS_HOST_SERVER}:{PHOTOS_HOST_PORT}"
@@ -34,7 +36,7 @@ class PhotosAdapter:
             url += f"&limit={limit}"
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(url, headers=headers) as resp,
         ):
             if resp.status == HTTPStatus.OK:
@@ -59,7 +61,7 @@ class PhotosAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(f"{PHOTO_SERVICE_URL}/photos/{my_id}", headers=headers) as resp,
         ):
             logging.debug(f"get_photo {my_id} - got response {resp.status}")
@@ -97,7 +99,7 @@ class PhotosAdapter:
             url += f"&limit={limit}"
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(url, headers=headers) as resp,
         ):
             if resp.status == HTTPStatus.OK:
@@ -133,7 +135,7 @@ class PhotosAdapter:
             url += f"&limit={limit}"
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(url, headers=headers) as resp,
         ):
             logging.debug(f"get_photos_by_raceclass - got response {resp.status}")
@@ -158,7 +160,7 @@ class PhotosAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{PHOTO_SERVICE_URL}/photos?gBaseUrl={g_base_url}", headers=headers
             ) as resp,
@@ -193,7 +195,7 @@ class PhotosAdapter:
         request_body = copy.deepcopy(photo)
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{PHOTO_SERVICE_URL}/photos", headers=headers, json=request_body
             ) as resp,
@@ -224,7 +226,7 @@ class PhotosAdapter:
         )
         url = f"{PHOTO_SERVICE_URL}/photos/{my_id}"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(url, headers=headers) as resp,
         ):
             logging.debug(f"Delete photo: {my_id} - res {resp.status}")
@@ -247,7 +249,7 @@ class PhotosAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.put(
                 f"{PHOTO_SERVICE_URL}/photos/{my_id}",
                 headers=headers,
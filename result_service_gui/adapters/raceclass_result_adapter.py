@@ -5,9 +5,11 @@ import os
 import random
 import urllib.parse
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from multidict import MultiDict
 
+from .http_client import pooled_session
+
 EVENTS_HOST_SERVER = os.getenv("EVENTS_HOST_SERVER", "localhost")
 EVENTS_HOST_PORT = os.getenv("EVENTS_HOST_PORT", "8082")
 EVENT_SERVICE_URL = f"http://{EVENTS_HOST_SERVER}:{EVENTS_HOST_PORT}"
@@ -28,7 +30,7 @@ class RaceclassResultsAdapter:
                 (hdrs.AUTHORIZATION, f"Bearer {token}"),
             ]
         )
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.post(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/results",
                 headers=headers,
@@ -60,7 +62,7 @@ class RaceclassResultsAdapter:
         }
         raceclass_url = urllib.parse.quote(raceclass, safe="")
 
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.delete(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/results/{raceclass_url}",
                 headers=headers,
@@ -89,7 +91,7 @@ class RaceclassResultsAdapter:
         servicename = "get_raceclass_result"
         raceclass_result = {}
         raceclass_url = urllib.parse.quote(raceclass, safe="")
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.get(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/results/{raceclass_url}",
                 headers=headers,
@@ -132,7 +134,7 @@ class RaceclassResultsAdapter:
                 (hdrs.CONTENT_TYPE, "application/json"),
             ]
         )
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.get(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/results", headers=headers
             ) as resp:
@@ -5,9 +5,13 @@ import os
 import urllib.parse
 from http import HTTPStatus
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from multidict import MultiDict
 
+from .http_client import pooled_session
+from .request_memo import request_memoized
+from .singleflight import singleflight
+
 EVENTS_HOST_SERVER = os.getenv("EVENTS_HOST_SERVER", "localhost")
 EVENTS_HOST_PORT = os.getenv("EVENTS_HOST_PORT", "8082")
 EVENT_SERVICE_URL = f"http://{EVENTS_HOST_SERVER}:{EVENTS_HOST_PORT}"
@@ -30,7 +34,7 @@ class RaceclassesAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/raceclasses",
                 headers=headers,
@@ -60,7 +64,7 @@ class RaceclassesAdapter:
         }
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/raceclasses",
                 headers=headers,
@@ -91,7 +95,7 @@ class RaceclassesAdapter:
         }
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/raceclasses/{raceclass_id}",
                 headers=headers,
@@ -112,6 +116,8 @@ class RaceclassesAdapter:
                 )
         return str(res)
 
+    @request_memoized
+    @singleflight
     async def get_raceclass(self, token: str, event_id: str, raceclass_id: str) -> dict:
         """Get all raceclass function."""
         headers = MultiDict(
@@ -122,7 +128,7 @@ class RaceclassesAdapter:
         )
         raceclass = {}
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/raceclasses/{raceclass_id}",
                 headers=headers,
@@ -140,6 +146,8 @@ class RaceclassesAdapter:
                 )
         return raceclass
 
+    @request_memoized
+    @singleflight
     async def get_raceclass_by_name(self, token: str, event_id: str, name: str) -> dict:
         """Get raceclass by name function."""
         headers = MultiDict(
@@ -151,7 +159,7 @@ class RaceclassesAdapter:
         raceclass = {}
         name_url = urllib.parse.quote(name, safe="")
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/raceclasses?name={name_url}",
                 headers=headers,
@@ -171,6 +179,8 @@ class RaceclassesAdapter:
                 )
         return raceclass
 
+    @request_memoized
+    @singleflight
     async def get_raceclasses(self, token: str, event_id: str) -> list:
         """Get all raceclasses function."""
         raceclasses = []
@@ -181,7 +191,7 @@ class RaceclassesAdapter:
             ]
         )
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/raceclasses", headers=headers
             ) as resp,
@@ -218,7 +228,7 @@ class RaceclassesAdapter:
             ]
         )
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.put(
                 f"{EVENT_SERVICE_URL}/events/{event_id}/raceclasses/{my_id}",
                 headers=headers,
@@ -3,14 +3,103 @@
 import datetime
 import logging
 import os
+from bisect import bisect_right
+from collections.abc import Mapping
+from dataclasses import dataclass
 from http import HTTPStatus
+from itertools import accumulate
+from types import MappingProxyType
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from multidict import MultiDict
 
+from .cache import TtlCache
+from .http_client import gather_bounded, pooled_session
+from .request_memo import request_memoized
+from .singleflight import singleflight
+
 RACE_HOST_SERVER = os.getenv("RACE_HOST_SERVER", "localhost")
 RACE_HOST_PORT = os.getenv("RACE_HOST_PORT", "8088")
 RACE_SERVICE_URL = f"http://{RACE_HOST_SERVER}:{RACE_HOST_PORT}"
+RACEPLAN_CACHE_TTL_SECONDS = float(os.getenv("RACEPLAN_CACHE_TTL_SECONDS", "5"))
+
+races_cache = TtlCache("races", RACEPLAN_CACHE_TTL_SECONDS)
+race_index_cache = TtlCache(
+    "race_order_index", RACEPLAN_CACHE_TTL_SECONDS, copy_values=False
+)
+
+
+# event of each race read, to invalidate one event on writes pr race
+_race_event_ids: dict[str, str] = {}
+
+
+def invalidate_races_cache(event_id: str = "") -> None:
+    """Invalidate cached races for one event - all events if not known."""
+    if event_id:
+        races_cache.invalidate(event_id)
+        race_index_cache.invalidate(event_id)
+    else:
+        races_cache.clear()
+        race_index_cache.clear()
+
+
+def invalidate_races_cache_for_race(race_id: str) -> None:
+    """Invalidate cached races for the event of a race - all if race not read."""
+    invalidate_races_cache(_race_event_ids.get(race_id, ""))
+
+
+def remember_race_events(races: list) -> None:
+    """Remember the event of each race, for invalidation by race id."""
+    for race in races:
+        if race.get("event_id"):
+            _race_event_ids[race["id"]] = race["event_id"]
+
+
+@dataclass(frozen=True)
+class RaceOrderIndex:
+    """Immutable lookup index for the races in one event, in raceplan order."""
+
+    races: tuple[Mapping, ...]
+    race_by_order: Mapping[int, Mapping]
+    latest_start_times: tuple[str, ...]
+
+    @classmethod
+    def from_races(cls, races: list) -> "RaceOrderIndex":
+        """Build index from a list of races - only key attributes are kept."""
+        index_races = tuple(
+            MappingProxyType(
+                {
+                    "id": race["id"],
+                    "order": race["order"],
+                    "raceclass": race["raceclass"],
+                    "round": race["round"],
+                    "start_time": race["start_time"],
+                }
+            )
+            for race in races
+        )
+        race_by_order: dict[int, Mapping] = {}
+        for race in index_races:
+            race_by_order.setdefault(race["order"], race)
+        return cls(
+            races=index_races,
+            race_by_order=MappingProxyType(race_by_order),
+            # running max, to find first race starting after a given time by bisect
+            latest_start_times=tuple(
+                accumulate((race["start_time"] for race in index_races), max)
+            ),
+        )
+
+    def get_race(self, race_order: int) -> Mapping:
+        """Return race with given order, empty if not found."""
+        return self.race_by_order.get(race_order, {})
+
+    def get_next_race_on_start(self, time_now: str) -> Mapping:
+        """Return first race in raceplan starting after time_now, empty if none."""
+        i = bisect_right(self.latest_start_times, time_now)
+        if i < len(self.races):
+            return self.races[i]
+        return {}
 
 
 class RaceplansAdapter:
@@ -23,7 +112,7 @@ class RaceplansAdapter:
             hdrs.AUTHORIZATION: f"Bearer {token}",
         }
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(
                 f"{RACE_SERVICE_URL}/races/{race_id}",
                 headers=headers,
@@ -31,6 +120,7 @@ class RaceplansAdapter:
         ):
             res = resp.status
             logging.debug(f"delete_race result - got response {resp}")
+            invalidate_races_cache_for_race(race_id)
             if res == HTTPStatus.NO_CONTENT:
                 pass
             elif resp.status == HTTPStatus.UNAUTHORIZED:
@@ -55,7 +145,7 @@ class RaceplansAdapter:
         }
         logging.info(f"delete raceplans, id: {raceplan['id']}")
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(
                 f"{RACE_SERVICE_URL}/raceplans/{raceplan['id']}",
                 headers=headers,
@@ -63,6 +153,7 @@ class RaceplansAdapter:
         ):
             res = resp.status
             logging.debug(f"delete raceplan result - got response {resp}")
+            invalidate_races_cache(event_id)
             if res == HTTPStatus.NO_CONTENT:
                 pass
             elif resp.status == HTTPStatus.UNAUTHORIZED:
@@ -87,11 +178,12 @@ class RaceplansAdapter:
         request_body = {"event_id": event_id}
         url = f"{RACE_SERVICE_URL}/raceplans/generate-raceplan-for-event"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(url, headers=headers, json=request_body) as resp,
         ):
             res = resp.status
             logging.debug(f"generate_raceplan result - got response {resp}")
+            invalidate_races_cache(event_id)
             if res == HTTPStatus.CREATED:
                 pass
             elif resp.status == HTTPStatus.UNAUTHORIZED:
@@ -105,6 +197,8 @@ class RaceplansAdapter:
                 )
         return res
 
+    @request_memoized
+    @singleflight
     async def get_all_raceplans(self, token: str, event_id: str) -> list:
         """Get all raceplans for event function."""
         headers = MultiDict(
@@ -114,7 +208,7 @@ class RaceplansAdapter:
         )
         raceplans = []
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{RACE_SERVICE_URL}/raceplans?eventId={event_id}", headers=headers
             ) as resp,
@@ -135,8 +229,16 @@ class RaceplansAdapter:
                 )
         return raceplans
 
+    @request_memoized
+    @singleflight
     async def get_all_races(self, token: str, event_id: str) -> list:
         """Get all races for event function."""
+        cache_key = ("races", event_id, "")
+        cached_races = races_cache.get(cache_key)
+        if cached_races is not None:
+            return cached_races
+        # not stored if races are changed while read
+        generation = races_cache.generation([event_id])
         headers = MultiDict(
             [
                 (hdrs.AUTHORIZATION, f"Bearer {token}"),
@@ -144,7 +246,7 @@ class RaceplansAdapter:
         )
         races = []
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{RACE_SERVICE_URL}/races?eventId={event_id}", headers=headers
             ) as resp,
@@ -169,8 +271,48 @@ class RaceplansAdapter:
                 break
             race["round"] = "F"
             race["index"] = ""
+        remember_race_events(races)
+        races_cache.set(cache_key, races, tags=[event_id], generation=generation)
         return races
 
+    async def get_all_races_detailed(
+        self,
+        token: str,
+        event_id: str,
+        raceclass: str = "",
+        skip_rounds: tuple[str, ...] = (),
+    ) -> list:
+        """Get all races for event (or raceclass) read one by one from race-service.
+
+        Race lists carry start entries and results too - use this where the
+        race itself must be read, as get_race_by_id did pr race. Details are
+        fetched concurrently, except for races in skip_rounds, and the list is
+        cached until ttl or invalidation of the event.
+        """
+        cache_key = ("races_detailed", event_id, raceclass, skip_rounds)
+        cached_races = races_cache.get(cache_key)
+        if cached_races is not None:
+            return cached_races
+        # not stored if races are changed while read
+        generation = races_cache.generation([event_id])
+        if raceclass:
+            races = await RaceplansAdapter().get_races_by_racesclass(
+                token, event_id, raceclass
+            )
+        else:
+            races = await RaceplansAdapter().get_all_races(token, event_id)
+        races_detailed = await gather_bounded(
+            RaceplansAdapter().get_race_by_id(token, race["id"])
+            for race in races
+            if race["round"] not in skip_rounds
+        )
+        races_cache.set(
+            cache_key, races_detailed, tags=[event_id], generation=generation
+        )
+        return races_detailed
+
+    @request_memoized
+    @singleflight
     async def get_race_by_id(self, token: str, race_id: str) -> dict:
         """Get one race for event function."""
         headers = MultiDict(
@@ -180,7 +322,7 @@ class RaceplansAdapter:
         )
         race = {}
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(f"{RACE_SERVICE_URL}/races/{race_id}", headers=headers) as resp,
         ):
             logging.debug(f"get_race_by_id - got response {resp.status}")
@@ -203,19 +345,18 @@ class RaceplansAdapter:
         else:
             race["round"] = "F"
             race["index"] = ""
+        remember_race_events([race])
         return race
 
     async def get_race_by_order(
         self, token: str, event_id: str, race_order: int
     ) -> dict:
         """Get one race for event function."""
-        logging.info("TODO: BE OPTIMISED issue #220")
-        all_races = await RaceplansAdapter().get_all_races(token, event_id)
+        race_index = await RaceplansAdapter().get_race_order_index(token, event_id)
         race = {}
-        for _race in all_races:
-            if _race["order"] == race_order:
-                race = await RaceplansAdapter().get_race_by_id(token, _race["id"])
-                break
+        race_id = race_index.get_race(race_order).get("id")
+        if race_id:
+            race = await RaceplansAdapter().get_race_by_id(token, race_id)
         # ensure that round always exists by setting F(inal) if missing
         if "round" in race:
             pass
@@ -225,10 +366,31 @@ class RaceplansAdapter:
             race["id"] = ""
         return race
 
+    async def get_race_order_index(self, token: str, event_id: str) -> RaceOrderIndex:
+        """Get order index for all races in event - built from cached races."""
+        cache_key = ("race_order_index", event_id)
+        race_index = race_index_cache.get(cache_key)
+        if race_index is None:
+            generation = race_index_cache.generation([event_id])
+            all_races = await RaceplansAdapter().get_all_races(token, event_id)
+            race_index = RaceOrderIndex.from_races(all_races)
+            race_index_cache.set(
+                cache_key, race_index, tags=[event_id], generation=generation
+            )
+        return race_index
+
+    @request_memoized
+    @singleflight
     async def get_races_by_racesclass(
         self, token: str, event_id: str, valgt_klasse: str
     ) -> list:
         """Get all get_races_by_racesclass function."""
+        cache_key = ("races", event_id, valgt_klasse)
+        cached_races = races_cache.get(cache_key)
+        if cached_races is not None:
+            return cached_races
+        # not stored if races are changed while read
+        generation = races_cache.generation([event_id])
         headers = MultiDict(
             [
                 (hdrs.AUTHORIZATION, f"Bearer {token}"),
@@ -236,7 +398,7 @@ class RaceplansAdapter:
         )
         races = []
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{RACE_SERVICE_URL}/races?eventId={event_id}&raceclass={valgt_klasse}",
                 headers=headers,
@@ -262,6 +424,8 @@ class RaceplansAdapter:
                 break
             race["round"] = "F"
             race["index"] = ""
+        remember_race_events(races)
+        races_cache.set(cache_key, races, tags=[event_id], generation=generation)
         return races
 
     async def update_order(self, token: str, race_id: str, new_order: int) -> str:
@@ -283,7 +447,7 @@ class RaceplansAdapter:
             ]
         )
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.put(
                 f"{RACE_SERVICE_URL}/raceplans/{my_id}",
                 headers=headers,
@@ -292,6 +456,7 @@ class RaceplansAdapter:
         ):
             returncode = resp.status
             logging.debug(f"update_raceplan - got response {resp.status}")
+            invalidate_races_cache(new_data.get("event_id", ""))
             if resp.status == HTTPStatus.NO_CONTENT:
                 pass
             elif resp.status == HTTPStatus.UNAUTHORIZED:
@@ -316,7 +481,7 @@ class RaceplansAdapter:
             ]
         )
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.put(
                 f"{RACE_SERVICE_URL}/races/{my_id}",
                 headers=headers,
@@ -325,6 +490,7 @@ class RaceplansAdapter:
         ):
             returncode = resp.status
             logging.debug(f"update_race - got response {resp.status}")
+            invalidate_races_cache(new_data.get("event_id", ""))
             if resp.status == HTTPStatus.NO_CONTENT:
                 pass
             elif resp.status == HTTPStatus.UNAUTHORIZED:
@@ -357,7 +523,7 @@ class RaceplansAdapter:
         logging.info(f"New data - update time: {new_data}")
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.put(
                 f"{RACE_SERVICE_URL}/raceplans/update-start-time/{event_id}",
                 headers=headers,
@@ -366,6 +532,7 @@ class RaceplansAdapter:
         ):
             returncode = resp.status
             logging.debug(f"update_race_start_time - got response {resp.status}")
+            invalidate_races_cache(event_id)
             if resp.status == HTTPStatus.NO_CONTENT:
                 pass
             elif resp.status == HTTPStatus.UNAUTHORIZED:
@@ -425,7 +592,7 @@ class RaceplansAdapter:
             ]
         )
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{RACE_SERVICE_URL}/raceplans/{raceplan_id}/validate",
                 headers=headers,
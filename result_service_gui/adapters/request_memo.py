@@ -0,0 +1,69 @@
+"""Module for request-scoped memoization of adapter reads."""
+
+import asyncio
+import copy
+import functools
+import logging
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any
+
+from aiohttp import web
+
+_request_memo: ContextVar[dict | None] = ContextVar("request_memo", default=None)
+
+
+@web.middleware
+async def request_memo_middleware(request: web.Request, handler: Any) -> Any:
+    """Give each request its own memo for adapter reads."""
+    token = _request_memo.set({})
+    try:
+        return await handler(request)
+    finally:
+        _request_memo.reset(token)
+
+
+def clear_request_memo() -> None:
+    """Forget memoized reads in current request - called on writes."""
+    memo = _request_memo.get()
+    if memo:
+        logging.debug(f"Request memo cleared - {len(memo)} reads")
+        memo.clear()
+
+
+def request_memoized[**P, T](
+    func: Callable[P, Awaitable[T]],
+) -> Callable[P, Awaitable[T]]:
+    """Execute identical adapter reads once per request.
+
+    The memo key is the method name and all arguments except self, including
+    the token. Concurrent identical calls share one in-flight task. Outside a
+    request, or with unhashable arguments, the method is called as usual.
+    Each caller gets its own copy of the result, since callers mutate them.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        memo = _request_memo.get()
+        key = (func.__qualname__, args[1:], tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            memo = None
+        if memo is None:
+            return await func(*args, **kwargs)
+
+        task = memo.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            memo[key] = task
+        try:
+            # shield - a cancelled caller must not cancel the shared read
+            result = await asyncio.shield(task)
+        except Exception:
+            if memo.get(key) is task:
+                del memo[key]
+            raise
+        return copy.deepcopy(result)
+
+    return wrapper
@@ -0,0 +1,245 @@
+"""Module for timing requests and accounting for upstream calls pr request."""
+
+import logging
+import os
+import re
+import sys
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+    TraceRequestStartParams,
+    web,
+)
+from yarl import URL
+
+from .metrics import metrics
+
+REQUEST_MAX_UPSTREAM_CALLS = int(os.getenv("REQUEST_MAX_UPSTREAM_CALLS", "30"))
+REQUEST_SLOW_SECONDS = float(os.getenv("REQUEST_SLOW_SECONDS", "2"))
+# health checks, static files and long-lived event streams are not timed
+UNTIMED_PATHS = ("/ping", "/ready", "/metrics", "/static/", "/files/", "/live/stream")
+SERVICE_NAMES = {
+    (
+        os.getenv("COMPETITION_FORMAT_HOST_SERVER", "localhost"),
+        os.getenv("COMPETITION_FORMAT_HOST_PORT", "8094"),
+    ): "competition-format-service",
+    (
+        os.getenv("EVENTS_HOST_SERVER", "localhost"),
+        os.getenv("EVENTS_HOST_PORT", "8082"),
+    ): "event-service",
+    (
+        os.getenv("PHOTOS_HOST_SERVER", "localhost"),
+        os.getenv("PHOTOS_HOST_PORT", "8092"),
+    ): "photo-service",
+    (
+        os.getenv("RACE_HOST_SERVER", "localhost"),
+        os.getenv("RACE_HOST_PORT", "8088"),
+    ): "race-service",
+    (os.getenv("USERS_HOST_SERVER"), os.getenv("USERS_HOST_PORT")): "user-service",
+}
+# path segments that are ids - uuids, numbers and hex strings
+ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{8,})$")
+# modules that wrap adapter methods, skipped when looking up the caller
+ADAPTER_WRAPPERS = ("http_client", "request_memo", "request_stats", "singleflight")
+
+
+@dataclass
+class UpstreamCall:
+    """One call to a backend service."""
+
+    service: str
+    adapter_method: str
+    method: str
+    path: str
+    status: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class RequestStats:
+    """Time spent in one request, on rendering and on upstream calls."""
+
+    started: float = field(default_factory=time.perf_counter)
+    render_seconds: float = 0.0
+    upstream_calls: list[UpstreamCall] = field(default_factory=list)
+
+    def upstream_seconds(self) -> dict[str, tuple[int, float]]:
+        """Return number of calls and total latency pr service."""
+        result: dict[str, tuple[int, float]] = {}
+        for call in self.upstream_calls:
+            count, seconds = result.get(call.service, (0, 0.0))
+            result[call.service] = (count + 1, seconds + call.seconds)
+        return result
+
+    def server_timing(self, total_seconds: float) -> str:
+        """Return value for the Server-Timing header, durations in ms."""
+        metrics = [
+            f"total;dur={total_seconds * 1000:.1f}",
+            f"render;dur={self.render_seconds * 1000:.1f}",
+        ]
+        for service, (count, seconds) in self.upstream_seconds().items():
+            metrics.append(f'{service};dur={seconds * 1000:.1f};desc="{count} calls"')
+        return ", ".join(metrics)
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def get_request_stats() -> RequestStats | None:
+    """Return stats for current request - None outside a request."""
+    return _request_stats.get()
+
+
+def add_render_time(seconds: float) -> None:
+    """Add template render time to current request."""
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.render_seconds += seconds
+
+
+def get_path_template(url: URL) -> str:
+    """Return url path with ids replaced by {id}."""
+    return "/".join(
+        "{id}" if ID_SEGMENT.match(segment) else segment
+        for segment in url.path.split("/")
+    )
+
+
+def get_adapter_method() -> str:
+    """Return qualified name of the adapter method making the current call."""
+    frame = sys._getframe(1)  # noqa: SLF001
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("result_service_gui.adapters.") and (
+            module.rsplit(".", 1)[-1] not in ADAPTER_WRAPPERS
+        ):
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+    return "unknown"
+
+
+async def on_upstream_request_start(
+    _client_session: ClientSession, context: Any, params: TraceRequestStartParams
+) -> None:
+    """Start timing upstream call - counted in current request, if any."""
+    context.upstream_call = UpstreamCall(
+        service=SERVICE_NAMES.get(
+            (params.url.host, str(params.url.port)), str(params.url.host)
+        ),
+        adapter_method=get_adapter_method(),
+        method=params.method,
+        path=get_path_template(params.url),
+    )
+    context.started = time.perf_counter()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.upstream_calls.append(context.upstream_call)
+
+
+async def on_upstream_request_end(
+    _client_session: ClientSession, context: Any, params: TraceRequestEndParams
+) -> None:
+    """Record status and latency until response headers are received."""
+    call = context.upstream_call
+    call.status = params.response.status
+    call.seconds = time.perf_counter() - context.started
+    observe_upstream_call(call)
+
+
+async def on_upstream_request_exception(
+    _client_session: ClientSession,
+    context: Any,
+    _params: TraceRequestExceptionParams,
+) -> None:
+    """Record latency of failed upstream call, status is 0."""
+    call = context.upstream_call
+    call.seconds = time.perf_counter() - context.started
+    observe_upstream_call(call)
+
+
+def observe_upstream_call(call: UpstreamCall) -> None:
+    """Add upstream call to metrics."""
+    labels = (("service", call.service), ("adapter_method", call.adapter_method))
+    metrics.inc("upstream_requests_total", (*labels, ("status", str(call.status))))
+    metrics.observe("upstream_request_duration_seconds", labels, call.seconds)
+
+
+@web.middleware
+async def request_stats_middleware(request: web.Request, handler: Any) -> Any:
+    """Time request and log summary with upstream calls.
+
+    Adds a Server-Timing header, unless the response is already sent. Requests
+    with more than REQUEST_MAX_UPSTREAM_CALLS upstream calls, or slower than
+    REQUEST_SLOW_SECONDS, are logged as warnings.
+    """
+    if request.path.startswith(UNTIMED_PATHS):
+        return await handler(request)
+    stats = RequestStats()
+    token = _request_stats.set(stats)
+    status = 500
+    metrics.add_gauge("http_requests_in_flight", (), 1)
+    try:
+        response = await handler(request)
+        status = response.status
+    except web.HTTPException as e:
+        status = e.status
+        raise
+    finally:
+        _request_stats.reset(token)
+        metrics.add_gauge("http_requests_in_flight", (), -1)
+        log_request_stats(request, status, stats)
+    if not response.prepared:
+        response.headers["Server-Timing"] = stats.server_timing(
+            time.perf_counter() - stats.started
+        )
+    return response
+
+
+def get_route(request: web.Request) -> str:
+    """Return route of request - path template, not the requested path."""
+    route = request.match_info.route
+    if route.resource is None:
+        return "unmatched"
+    return route.resource.canonical
+
+
+def log_request_stats(request: web.Request, status: int, stats: RequestStats) -> None:
+    """Log one summary line for request, and add it to metrics."""
+    total_seconds = time.perf_counter() - stats.started
+    route = get_route(request)
+    metrics.inc(
+        "http_requests_total",
+        (("route", route), ("method", request.method), ("status", str(status))),
+    )
+    metrics.observe("http_request_duration_seconds", (("route", route),), total_seconds)
+    calls = len(stats.upstream_calls)
+    upstream = ", ".join(
+        f"{service} {count} calls {seconds * 1000:.0f}ms"
+        for service, (count, seconds) in stats.upstream_seconds().items()
+    )
+    summary = (
+        f"Request {request.method} {request.path} {status} - "
+        f"total {total_seconds * 1000:.0f}ms, "
+        f"render {stats.render_seconds * 1000:.0f}ms, "
+        f"upstream {calls} calls ({upstream})"
+    )
+    if calls > REQUEST_MAX_UPSTREAM_CALLS:
+        # same adapter method called many times - typically a read pr race
+        by_method: dict[str, int] = {}
+        for call in stats.upstream_calls:
+            key = f"{call.adapter_method} {call.method} {call.path}"
+            by_method[key] = by_method.get(key, 0) + 1
+        top = sorted(by_method.items(), key=lambda item: item[1], reverse=True)[:3]
+        logging.warning(f"Too many upstream calls. {summary} - top: {top}")
+    elif total_seconds > REQUEST_SLOW_SECONDS:
+        logging.warning(f"Slow request. {summary}")
+    else:
+        logging.info(summary)
@@ -3,9 +3,12 @@
 import logging
 import os
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from multidict import MultiDict
 
+from .http_client import pooled_session
+from .raceplans_adapter import invalidate_races_cache_for_race
+
 RACE_HOST_SERVER = os.getenv("RACE_HOST_SERVER", "localhost")
 RACE_HOST_PORT = os.getenv("RACE_HOST_PORT", "8088")
 RACE_SERVICE_URL = f"http://{RACE_HOST_SERVER}:{RACE_HOST_PORT}"
@@ -24,7 +27,7 @@ class ResultAdapter:
         url = f"{RACE_SERVICE_URL}/races/{race_id}/race-results?idsOnly={ids_only}"
         results = []
         finish_results = {}
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.get(url, headers=headers) as resp:
                 logging.debug(f"get_race_results - got response {resp.status}")
                 if resp.status == 200:
@@ -55,7 +58,7 @@ class ResultAdapter:
         url = (
             f"{RACE_SERVICE_URL}/races/{race_id}/race-results/{new_race_results['id']}"
         )
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.put(url, headers=headers, json=new_race_results) as resp:
                 res = resp.status
                 logging.debug(f"update_race_results - got response {resp}")
@@ -69,6 +72,7 @@ class ResultAdapter:
                     raise web.HTTPBadRequest(
                         reason=f"Error - {resp.status}: {body['detail']}."
                     )
+        invalidate_races_cache_for_race(race_id)
         return str(res)
 
     async def update_result_status(
@@ -0,0 +1,90 @@
+"""Module for coalescing identical in-flight upstream reads across requests."""
+
+import asyncio
+import copy
+import functools
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class _Flight:
+    """One upstream read in progress and the number of callers waiting on it."""
+
+    task: asyncio.Future
+    followers: int = 0
+
+
+class SingleFlight:
+    """Execute identical concurrent calls once, all callers share the result.
+
+    A call is identical if the key is equal. The key is removed when the call
+    completes, so results are never reused after that - use a cache for that.
+    If more than one caller shared a result, each caller gets its own copy.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize without calls in flight."""
+        self.name = name
+        self.calls = 0
+        self.collapsed = 0
+        self._in_flight: dict[Hashable, _Flight] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Return result of func, shared with concurrent calls with same key."""
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(func()))
+            self._in_flight[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self.calls += 1
+        else:
+            flight.followers += 1
+            self.collapsed += 1
+            logging.debug(f"Singleflight {self.name} collapsed {key} - {self.stats()}")
+        # shield - a cancelled caller must not cancel the shared call
+        result = await asyncio.shield(flight.task)
+        if flight.followers > 0:
+            return copy.deepcopy(result)
+        return result
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        """Remove completed call - new callers will start a new one."""
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+
+    def stats(self) -> dict:
+        """Return call counters."""
+        return {
+            "name": self.name,
+            "in_flight": len(self._in_flight),
+            "calls": self.calls,
+            "collapsed": self.collapsed,
+        }
+
+
+upstream_reads = SingleFlight("upstream_reads")
+
+
+def singleflight[**P, T](
+    func: Callable[P, Awaitable[T]],
+) -> Callable[P, Awaitable[T]]:
+    """Share one upstream read between concurrent identical adapter calls.
+
+    The key is the method name and all arguments except self. The token is
+    part of the arguments, so results are only shared within the same auth
+    scope. With unhashable arguments the method is called as usual.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        key = (func.__qualname__, args[1:], tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return await func(*args, **kwargs)
+        return await upstream_reads.do(key, lambda: func(*args, **kwargs))
+
+    return wrapper
@@ -4,11 +4,18 @@ import logging
 import os
 from http import HTTPStatus
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from multidict import MultiDict
 
+from .http_client import pooled_session
 from .raceclasses_adapter import RaceclassesAdapter
-from .raceplans_adapter import RaceplansAdapter
+from .raceplans_adapter import (
+    RaceplansAdapter,
+    invalidate_races_cache,
+    invalidate_races_cache_for_race,
+)
+from .request_memo import request_memoized
+from .singleflight import singleflight
 
 RACE_HOST_SERVER = os.getenv("RACE_HOST_SERVER", "localhost")
 RACE_HOST_PORT = os.getenv("RACE_HOST_PORT", "8088")
@@ -29,7 +36,7 @@ class StartAdapter:
         )
         request_body = {"event_id": event_id}
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{RACE_SERVICE_URL}/startlists/generate-startlist-for-event",
                 headers=headers,
@@ -53,6 +60,7 @@ class StartAdapter:
         # shuffle urangerte - this function is intended to be moved to race-service
         informasjon += await shuffle_round2(token, event_id)
 
+        invalidate_races_cache(event_id)
         return informasjon
 
     async def delete_start_entry(
@@ -65,7 +73,7 @@ class StartAdapter:
         }
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(
                 f"{RACE_SERVICE_URL}/races/{race_id}/start-entries/{start_entry_id}",
                 headers=headers,
@@ -84,16 +92,19 @@ class StartAdapter:
                 raise web.HTTPBadRequest(
                     reason=f"Error - {resp.status}: {body['detail']}."
                 )
+        invalidate_races_cache_for_race(race_id)
         return str(res)
 
-    async def delete_start_list(self, token: str, start_list_id: str) -> str:
-        """Delete one start_list function."""
+    async def delete_start_list(
+        self, token: str, start_list_id: str, event_id: str = ""
+    ) -> str:
+        """Delete one start_list function - event_id to invalidate cached races."""
         servicename = "delete_start_list"
         headers = {
             hdrs.AUTHORIZATION: f"Bearer {token}",
         }
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(
                 f"{RACE_SERVICE_URL}/startlists/{start_list_id}",
                 headers=headers,
@@ -112,8 +123,11 @@ class StartAdapter:
                 raise web.HTTPBadRequest(
                     reason=f"{servicename} failed - {body['detail']}."
                 )
+        invalidate_races_cache(event_id)
         return str(res)
 
+    @request_memoized
+    @singleflight
     async def get_start_entries_by_race_id(self, token: str, race_id: str) -> list:
         """Get one start_entry - lap time or heat place function."""
         headers = MultiDict(
@@ -123,7 +137,7 @@ class StartAdapter:
         )
         start_entries = []
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{RACE_SERVICE_URL}/races/{race_id}/start-entries",
                 headers=headers,
@@ -156,7 +170,7 @@ class StartAdapter:
         )
         start_entry = {}
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{RACE_SERVICE_URL}/races/{race_id}/start-entries/{start_id}",
                 headers=headers,
@@ -191,7 +205,7 @@ class StartAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{RACE_SERVICE_URL}/startlists?eventId={event_id}&bib={bib}",
                 headers=headers,
@@ -212,6 +226,8 @@ class StartAdapter:
             start_entries = startlists[0]["start_entries"]
         return start_entries
 
+    @request_memoized
+    @singleflight
     async def get_all_starts_by_event(self, token: str, event_id: str) -> list:
         """Get all starts function."""
         headers = MultiDict(
@@ -221,7 +237,7 @@ class StartAdapter:
         )
         starts = []
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{RACE_SERVICE_URL}/startlists?eventId={event_id}", headers=headers
             ) as resp,
@@ -247,7 +263,7 @@ class StartAdapter:
         }
         logging.debug(f"New start: {new_start}")
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{RACE_SERVICE_URL}/races/{new_start['race_id']}/start-entries",
                 headers=headers,
@@ -266,6 +282,7 @@ class StartAdapter:
                 raise web.HTTPBadRequest(
                     reason=f"{servicename} failed - {body['detail']}."
                 )
+        invalidate_races_cache_for_race(new_start["race_id"])
         return resp.status
 
     async def update_start_entry(self, token: str, s_id: str, new_start: dict) -> int:
@@ -277,7 +294,7 @@ class StartAdapter:
         }
         logging.debug(f"New start: {new_start}")
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.put(
                 f"{RACE_SERVICE_URL}/races/{new_start['race_id']}/start-entries/{s_id}",
                 headers=headers,
@@ -296,6 +313,7 @@ class StartAdapter:
                 raise web.HTTPBadRequest(
                     reason=f"{servicename} failed - {body['detail']}."
                 )
+        invalidate_races_cache_for_race(new_start["race_id"])
         return resp.status
 
 
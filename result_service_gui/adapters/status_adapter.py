@@ -5,11 +5,12 @@ import logging
 import os
 from http import HTTPStatus
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from dotenv import load_dotenv
 from multidict import MultiDict
 
 from .events_adapter import EventsAdapter
+from .http_client import pooled_session
 
 # get base settings
 load_dotenv()
@@ -33,7 +34,7 @@ class StatusAdapter:
         servicename = "get_status"
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{PHOTO_SERVICE_URL}/status?count={count}&eventId={event_id}",
                 headers=headers,
@@ -65,7 +66,7 @@ class StatusAdapter:
         servicename = "get_status"
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{PHOTO_SERVICE_URL}/status?count={count}&eventId={event['id']}&type={status_type}",
                 headers=headers,
@@ -106,7 +107,7 @@ class StatusAdapter:
         request_body = copy.deepcopy(status_dict)
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{PHOTO_SERVICE_URL}/status", headers=headers, json=request_body
             ) as resp,
@@ -138,7 +139,7 @@ class StatusAdapter:
         )
         url = f"{PHOTO_SERVICE_URL}/status?eventId={event['id']}"
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.delete(
                 url,
                 headers=headers,
@@ -4,9 +4,14 @@ import copy
 import logging
 import os
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from multidict import MultiDict
 
+from .http_client import pooled_session
+from .raceplans_adapter import invalidate_races_cache
+from .request_memo import request_memoized
+from .singleflight import singleflight
+
 RACE_HOST_SERVER = os.getenv("RACE_HOST_SERVER", "localhost")
 RACE_HOST_PORT = os.getenv("RACE_HOST_PORT", "8088")
 RACE_SERVICE_URL = f"http://{RACE_HOST_SERVER}:{RACE_HOST_PORT}"
@@ -28,7 +33,7 @@ class TimeEventsAdapter:
 
         request_body = copy.deepcopy(time_event)
 
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.post(
                 f"{RACE_SERVICE_URL}/time-events", headers=headers, json=request_body
             ) as resp:
@@ -45,10 +50,11 @@ class TimeEventsAdapter:
                     error_message = f"{servicename} failed - {resp.status}-{err_msg} input data: {time_event}."
                     logging.error(error_message)
                     raise web.HTTPBadRequest(reason=error_message)
+        invalidate_races_cache(time_event.get("event_id", ""))
         return new_time_event
 
-    async def delete_time_event(self, token: str, t_id: str) -> int:
-        """Delete time_event function."""
+    async def delete_time_event(self, token: str, t_id: str, event_id: str = "") -> int:
+        """Delete time_event function - event_id to invalidate cached races."""
         servicename = "delete_time_event"
         headers = MultiDict(
             [
@@ -57,7 +63,7 @@ class TimeEventsAdapter:
             ]
         )
         url = f"{RACE_SERVICE_URL}/time-events/{t_id}"
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.delete(url, headers=headers) as resp:
                 if resp.status == 204:
                     logging.debug(f"result - got response {resp}")
@@ -68,6 +74,7 @@ class TimeEventsAdapter:
                     error_message = f"{servicename} failed - {resp.status}-{err_msg} input data: {id}."
                     logging.error(error_message)
                     raise web.HTTPBadRequest(reason=error_message)
+        invalidate_races_cache(event_id)
         return resp.status
 
     async def update_time_event(self, token: str, t_id: str, time_event: dict) -> int:
@@ -80,7 +87,7 @@ class TimeEventsAdapter:
             ]
         )
 
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.put(
                 f"{RACE_SERVICE_URL}/time-events/{t_id}",
                 headers=headers,
@@ -95,6 +102,7 @@ class TimeEventsAdapter:
                     error_message = f"{servicename} failed - {resp.status}-{err_msg} input data: {time_event}."
                     logging.error(error_message)
                     raise web.HTTPBadRequest(reason=error_message)
+        invalidate_races_cache(time_event.get("event_id", ""))
         return resp.status
 
     async def get_time_event_by_id(self, token: str, t_id: str) -> dict:
@@ -105,7 +113,7 @@ class TimeEventsAdapter:
             ]
         )
         time_event = {}
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.get(
                 f"{RACE_SERVICE_URL}/time-events/{t_id}", headers=headers
             ) as resp:
@@ -133,7 +141,7 @@ class TimeEventsAdapter:
             ]
         )
         time_events = []
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.get(
                 f"{RACE_SERVICE_URL}/time-events?eventId={event_id}&bib={bib}",
                 headers=headers,
@@ -154,6 +162,8 @@ class TimeEventsAdapter:
                     )
         return time_events
 
+    @request_memoized
+    @singleflight
     async def get_time_events_by_event_id(self, token: str, event_id: str) -> list:
         """Get all time_events - lap time or heat place function."""
         headers = MultiDict(
@@ -162,7 +172,7 @@ class TimeEventsAdapter:
             ]
         )
         time_events = []
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.get(
                 f"{RACE_SERVICE_URL}/time-events?eventId={event_id}", headers=headers
             ) as resp:
@@ -182,6 +192,8 @@ class TimeEventsAdapter:
                     )
         return time_events
 
+    @request_memoized
+    @singleflight
     async def get_time_events_by_event_id_and_timing_point(
         self, token: str, event_id: str, timing_point: str
     ) -> list:
@@ -192,7 +204,7 @@ class TimeEventsAdapter:
             ]
         )
         time_events = []
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.get(
                 f"{RACE_SERVICE_URL}/time-events?eventId={event_id}&timingPoint={timing_point}",
                 headers=headers,
@@ -213,6 +225,8 @@ class TimeEventsAdapter:
                     )
         return time_events
 
+    @request_memoized
+    @singleflight
     async def get_time_events_by_race_id(self, token: str, race_id: str) -> list:
         """Get time_events - lap time or heat place function."""
         headers = MultiDict(
@@ -221,7 +235,7 @@ class TimeEventsAdapter:
             ]
         )
         time_events = []
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.get(
                 f"{RACE_SERVICE_URL}/time-events?raceId={race_id}", headers=headers
             ) as resp:
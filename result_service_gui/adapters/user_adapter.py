@@ -4,10 +4,12 @@ import logging
 import os
 from http import HTTPStatus
 
-from aiohttp import ClientSession, hdrs, web
+from aiohttp import hdrs, web
 from aiohttp_session import Session
 from multidict import MultiDict
 
+from .http_client import pooled_session
+
 USERS_HOST_SERVER = os.getenv("USERS_HOST_SERVER")
 USERS_HOST_PORT = os.getenv("USERS_HOST_PORT")
 USER_SERVICE_URL = f"http://{USERS_HOST_SERVER}:{USERS_HOST_PORT}"
@@ -38,7 +40,7 @@ class UserAdapter:
             ],
         )
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{USER_SERVICE_URL}/users",
                 headers=headers,
@@ -67,7 +69,7 @@ class UserAdapter:
             ],
         )
         url = f"{USER_SERVICE_URL}/users/{w_id}"
-        async with ClientSession() as session:
+        async with pooled_session() as session:
             async with session.delete(url, headers=headers) as resp:
                 pass
             logging.info(f"Delete user: {w_id} - res {resp.status}")
@@ -91,7 +93,7 @@ class UserAdapter:
         )
 
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.get(
                 f"{USER_SERVICE_URL}/users",
                 headers=headers,
@@ -118,7 +120,7 @@ class UserAdapter:
             ],
         )
         async with (
-            ClientSession() as session,
+            pooled_session() as session,
             session.post(
                 f"{USER_SERVICE_URL}/login",
                 headers=headers,
@@ -3,6 +3,7 @@
 import base64
 import logging
 import os
+import time
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
@@ -13,15 +14,23 @@ from aiohttp_session import get_session, setup
 from aiohttp_session.cookie_storage import EncryptedCookieStorage
 from dotenv import load_dotenv
 
+from .adapters.club_logos import club_logo_index
+from .adapters.global_settings import load_global_settings
+from .adapters.http_client import client_session_ctx
+from .adapters.metrics import metrics_ctx
+from .adapters.request_memo import request_memo_middleware
+from .adapters.request_stats import add_render_time, request_stats_middleware
 from .views import (
     Config,
     Control,
     Corrections,
     CsvList,
     Live,
+    LiveStream,
     Login,
     Logout,
     Main,
+    Metrics,
     PhotoFinish,
     Photos,
     PhotosEdit,
@@ -40,6 +49,15 @@ from .views import (
     TimingInfo,
     VideoEvents,
 )
+from .views.compression import compression_middleware
+from .views.event_snapshot import stop_event_snapshots
+from .views.live_stream import close_live_streams
+from .views.page_cache import page_cache_middleware
+from .views.static_assets import (
+    STATIC_PRECOMPRESS,
+    get_static_cache_control,
+    static_assets,
+)
 
 load_dotenv()
 LOGGING_LEVEL = os.getenv("LOGGING_LEVEL", "INFO")
@@ -47,6 +65,14 @@ PROJECT_ROOT = f"{Path.cwd()}/result_service_gui"
 logging.info(f"PROJECT_ROOT: {PROJECT_ROOT}")
 ERROR_FILE = str(os.getenv("ERROR_FILE"))
 STATIC_CACHE_MAX_AGE_SECONDS = int(os.getenv("STATIC_CACHE_MAX_AGE_SECONDS", "3600"))
+TEMPLATE_BYTECODE_CACHE = os.getenv("TEMPLATE_BYTECODE_CACHE", "true") == "true"
+TEMPLATE_BYTECODE_CACHE_DIR = os.getenv("TEMPLATE_BYTECODE_CACHE_DIR") or None
+TEMPLATE_PRECOMPILE = os.getenv("TEMPLATE_PRECOMPILE", "true") == "true"
+CONFIG = os.getenv("CONFIG", "production")
+# templates are reloaded when changed in dev, unless set explicitly
+TEMPLATE_AUTO_RELOAD = (
+    os.getenv("TEMPLATE_AUTO_RELOAD", "true" if CONFIG == "dev" else "false") == "true"
+)
 
 
 async def add_static_cache_headers(request, response) -> None:
@@ -54,13 +80,37 @@ async def add_static_cache_headers(request, response) -> None:
 
     This avoids unnecessary image re-downloads on page refresh while keeping
     compatibility with aiohttp versions where add_static() has no max_age arg.
+    Fingerprinted urls from static_url are cached for a year.
     """
     if request.path.startswith("/static/"):
-        response.headers["Cache-Control"] = (
-            f"public, max-age={STATIC_CACHE_MAX_AGE_SECONDS}"
+        response.headers["Cache-Control"] = get_static_cache_control(
+            request, STATIC_CACHE_MAX_AGE_SECONDS
         )
 
 
+class TimedTemplate(jinja2.Template):
+    """Template that adds render time to the stats of the current request."""
+
+    async def render_async(self, *args, **kwargs) -> str:  # noqa: ANN002, ANN003
+        """Render template and record time spent."""
+        started = time.perf_counter()
+        try:
+            return await super().render_async(*args, **kwargs)
+        finally:
+            add_render_time(time.perf_counter() - started)
+
+
+def precompile_templates(env: jinja2.Environment) -> None:
+    """Compile all templates, so that first requests after deploy are not slow."""
+    started = time.perf_counter()
+    names = env.list_templates(extensions=["html"])
+    for name in names:
+        env.get_template(name)
+    logging.info(
+        f"Compiled {len(names)} templates in {time.perf_counter() - started:.2f}s"
+    )
+
+
 async def handler(request) -> web.Response:
     """Create a session handler."""
     session = await get_session(request)
@@ -70,13 +120,33 @@ async def handler(request) -> web.Response:
 
 async def create_app() -> web.Application:
     """Create an web application."""
-    app = web.Application()
+    # timing and upstream call summary, compression of the final response,
+    # and identical upstream reads are executed once per request
+    app = web.Application(
+        middlewares=[
+            request_stats_middleware,
+            compression_middleware,
+            request_memo_middleware,
+        ]
+    )
     app.on_response_prepare.append(add_static_cache_headers)
 
+    # shared, pooled http client for all adapters - closed on shutdown
+    app.cleanup_ctx.append(client_session_ctx)
+
+    # event loop lag, and metrics written to file for /metrics in any worker
+    app.cleanup_ctx.append(metrics_ctx)
+
+    # end live streams and background pollers, so that shutdown is not delayed
+    app.on_shutdown.append(close_live_streams)
+    app.on_shutdown.append(stop_event_snapshots)
+
     # sesson handling - secret_key must be 32 url-safe base64-encoded bytes
     fernet_key = os.getenv("FERNET_KEY", "23EHUWpP_tpleR_RjuX5hxndWqyc0vO-cjNUMSzbjN4=")
     secret_key = base64.urlsafe_b64decode(fernet_key)
     setup(app, EncryptedCookieStorage(secret_key))
+    # after session middleware - public pages for guests are rendered once
+    app.middlewares.append(page_cache_middleware)
     app.router.add_get("/secret", handler)
 
     # Set up logging - errors to separate file
@@ -90,14 +160,28 @@ async def create_app() -> web.Application:
     file_handler.setFormatter(formatter)
     logging.getLogger().addHandler(file_handler)
 
+    # load static lookup data once, not per request
+    club_logo_index.load()
+    load_global_settings()
+
     # Set up template path
     template_path = Path(PROJECT_ROOT) / "templates"
-    aiohttp_jinja2.setup(
+    # compiled templates are shared by workers and kept across restarts
+    bytecode_cache = None
+    if TEMPLATE_BYTECODE_CACHE:
+        bytecode_cache = jinja2.FileSystemBytecodeCache(TEMPLATE_BYTECODE_CACHE_DIR)
+    env = aiohttp_jinja2.setup(
         app,
         enable_async=True,
         loader=jinja2.FileSystemLoader(template_path),
+        bytecode_cache=bytecode_cache,
+        auto_reload=TEMPLATE_AUTO_RELOAD,
     )
+    env.template_class = TimedTemplate
+    env.globals["static_url"] = static_assets.static_url
     logging.debug(f"template_path: {template_path}")
+    if TEMPLATE_PRECOMPILE:
+        precompile_templates(env)
 
     app.add_routes(
         [
@@ -107,8 +191,10 @@ async def create_app() -> web.Application:
             web.view("/control", Control),
             web.view("/csv", CsvList),
             web.view("/live", Live),
+            web.view("/live/stream", LiveStream),
             web.view("/login", Login),
             web.view("/logout", Logout),
+            web.view("/metrics", Metrics),
             web.view("/ping", Ping),
             web.view("/photo_finish", PhotoFinish),
             web.view("/photos_edit", PhotosEdit),
@@ -131,6 +217,7 @@ async def create_app() -> web.Application:
 
     static_dir = Path(PROJECT_ROOT) / "static"
     logging.info(f"static_dir: {static_dir}")
+    static_assets.load(static_dir, precompress=STATIC_PRECOMPRESS)
     app.router.add_static("/static/", path=str(static_dir), name="static")
 
     files_dir = Path(PROJECT_ROOT) / "files"
@@ -10,6 +10,8 @@ from dotenv import load_dotenv
 from gunicorn import glogging
 from pythonjsonlogger.json import JsonFormatter
 
+from result_service_gui.adapters.metrics import clear_metrics_dir
+
 load_dotenv()
 
 HOST_PORT = env.get("HOST_PORT", "8080")
@@ -23,6 +25,12 @@ threads = 2 * multiprocessing.cpu_count()
 logging_level = str(LOGGING_LEVEL)
 accesslog = "-"
 
+
+def on_starting(_server: Any) -> None:
+    """Remove metrics files of earlier runs, before workers are started."""
+    clear_metrics_dir()
+
+
 # Need to override the logger to remove healthcheck (ping) form accesslog
 
 
@@ -229,16 +229,12 @@ def find_raceclass(ageclass: str, raceclasses: list) -> str:
 def format_time(timez: str, zulu: bool) -> str:
     """Convert to normalized time - string formats."""
     t2 = None
-    time_zone_offset_g_photos = EventsAdapter().get_global_setting(
-        "TIME_ZONE_OFFSET_G_PHOTOS"
-    )
-    date_patterns = EventsAdapter().get_global_setting("DATE_PATTERNS")
-    date_pattern_list = date_patterns.split(";")
-    for pattern in date_pattern_list:
+    time_zone_offset_g_photos = EventsAdapter().get_time_zone_offset_g_photos()
+    for pattern in EventsAdapter().get_date_patterns():
         try:
             t1 = datetime.datetime.strptime(timez, pattern)
             # calculate new time
-            delta_seconds = int(time_zone_offset_g_photos) * 3600
+            delta_seconds = time_zone_offset_g_photos * 3600
             if zulu:
                 t2 = t1 + datetime.timedelta(seconds=delta_seconds)
             else:
@@ -258,9 +254,7 @@ def get_seconds_diff(time1: str, time2: str) -> int:
     t1 = datetime.datetime.strptime("1", "%S")  # nitialize time to zero
     t2 = datetime.datetime.strptime("1", "%S")
 
-    date_patterns = EventsAdapter().get_global_setting("DATE_PATTERNS")
-    date_pattern_list = date_patterns.split(";")
-    for pattern in date_pattern_list:
+    for pattern in EventsAdapter().get_date_patterns():
         try:
             t1 = datetime.datetime.strptime(time1, pattern)
         except ValueError:
@@ -62,6 +62,7 @@ class RaceclassResultsService:
         """Extract timing events from finish and append club logo."""
         finish_rank = []
         finish_bibs = []
+        club_logos = get_club_logos_for_race(race)
         results = race["results"]
         if len(results) > 0:
             if "Finish" in results:
@@ -71,10 +72,8 @@ class RaceclassResultsService:
                         finish_ranks = finish_results["ranking_sequence"]
                         for rank_event in finish_ranks:
                             if rank_event["status"] == "OK":
-                                rank_event["club_logo"] = (
-                                    EventsAdapter().get_club_logo_url(
-                                        rank_event["club"]
-                                    )
+                                rank_event["club_logo"] = club_logos.get(
+                                    rank_event["club"], ""
                                 )
                                 finish_rank.append(rank_event)
                                 finish_bibs.append(rank_event["bib"])
@@ -88,7 +87,7 @@ class RaceclassResultsService:
                         "round": f"{race['round']}{race['index']}",
                         "name": start["name"],
                         "club": start["club"],
-                        "club_logo": EventsAdapter().get_club_logo_url(start["club"]),
+                        "club_logo": club_logos.get(start["club"], ""),
                         "ageclass": "",
                         "time_event": {},
                         "timing_point": "DNF",
@@ -98,6 +97,19 @@ class RaceclassResultsService:
         return finish_rank
 
 
+def get_club_logos_for_race(race: dict) -> dict:
+    """Get club logos for all start entries and finish results in one pass."""
+    clubs = [start.get("club", "") for start in race.get("start_entries") or []]
+    try:
+        clubs += [
+            rank_event.get("club", "")
+            for rank_event in race["results"]["Finish"]["ranking_sequence"]
+        ]
+    except (KeyError, TypeError):
+        logging.debug("No finish results for race")
+    return EventsAdapter().get_club_logo_urls(clubs)
+
+
 async def get_results_from_all_heats(
     token: str, event_id: str, valgt_klasse: str
 ) -> dict:
@@ -125,8 +137,9 @@ async def get_results_from_all_heats(
         "SC": [],
         "DNF": [],
     }
-    races = await RaceplansAdapter().get_races_by_racesclass(
-        token, event_id, valgt_klasse
+    # results from qualification are not used - skip them before fetching
+    races = await RaceplansAdapter().get_all_races_detailed(
+        token, event_id, valgt_klasse, skip_rounds=("Q",)
     )
     # first - extract all result-items
     for race in races:
@@ -136,7 +149,7 @@ async def get_results_from_all_heats(
                 return {}
         # skip results from qualification
         if race["round"] != "Q":
-            race_details = await RaceplansAdapter().get_race_by_id(token, race["id"])
+            race_details = race
             finish_results = RaceclassResultsService().get_finish_rank_for_race(
                 race_details, True
             )
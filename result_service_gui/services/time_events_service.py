@@ -1,6 +1,7 @@
 """Module for time event service."""
 
 import logging
+from collections.abc import Awaitable
 
 from aiohttp import web
 
@@ -11,69 +12,89 @@ from result_service_gui.adapters import (
     StartAdapter,
     TimeEventsAdapter,
 )
+from result_service_gui.adapters.http_client import gather_bounded
 
 
 class TimeEventsService:
     """Class representing service layer for time_events."""
 
     async def generate_next_race_templates(self, token: str, event: dict) -> str:
-        """Calculate next race for the entire team."""
-        informasjon = ""
-        i = 0
+        """Calculate next race for the entire team.
+
+        Existing templates are deleted and new ones created concurrently, at
+        most HTTP_CLIENT_MAX_CONCURRENT_PER_REQUEST at a time. Failed items
+        do not stop the others, and are reported in the returned text.
+        """
         time_stamp_now = EventsAdapter().get_local_time(event, "log")
-        time_event = {
-            "bib": 0,
-            "event_id": event["id"],
-            "race": "",
-            "race_id": "",
-            "timing_point": "Template",
-            "rank": 0,
-            "registration_time": time_stamp_now,
-            "next_race": "",
-            "next_race_id": "",
-            "next_race_position": 0,
-            "status": "OK",
-            "changelog": [],
-        }
         # 1. delete all existing Template time events
         current_templates = (
             await TimeEventsAdapter().get_time_events_by_event_id_and_timing_point(
                 token, event["id"], "Template"
             )
         )
-        for template in current_templates:
-            await TimeEventsAdapter().delete_time_event(token, template["id"])
+        delete_errors = await run_bounded_with_progress(
+            "Delete templates",
+            [
+                TimeEventsAdapter().delete_time_event(
+                    token, template["id"], event["id"]
+                )
+                for template in current_templates
+            ],
+        )
 
-        # 2. get list of all races and loop, except finals.
+        # 2. get list of all races and calculate templates, except finals.
         races = await RaceplansAdapter().get_all_races(token, event["id"])
         if len(races) == 0:
-            informasjon = f"{informasjon} Ingen kjøreplaner funnet."
-        else:
-            for race in races:
-                if race["round"] in ["Q", "S"]:
-                    time_event["race"] = (
-                        f"{race['raceclass']}-{race['round']}{race['index']}{race['heat']}"
+            return "Ingen kjøreplaner funnet."
+        races_by_raceclass: dict[str, list] = {}
+        for race in races:
+            races_by_raceclass.setdefault(race["raceclass"], []).append(race)
+        templates = []
+        for race in races:
+            if race["round"] in ["Q", "S"]:
+                # simulate result for pos 1 to 10
+                for x in range(1, race["max_no_of_contestants"] + 1):
+                    time_event = {
+                        "bib": 0,
+                        "event_id": event["id"],
+                        "race": f"{race['raceclass']}-{race['round']}{race['index']}{race['heat']}",
+                        "race_id": race["id"],
+                        "timing_point": "Template",
+                        "rank": x,
+                        "registration_time": time_stamp_now,
+                        "next_race": "",
+                        "next_race_id": "",
+                        "next_race_position": 0,
+                        "status": "OK",
+                        "changelog": [],
+                    }
+                    next_start_entry = get_next_start_entry(
+                        time_event, races_by_raceclass[race["raceclass"]]
                     )
-                    time_event["race_id"] = race["id"]
-
-                    # loop and simulate result for pos 1 to 10
-                    for x in range(1, race["max_no_of_contestants"] + 1):
-                        time_event["rank"] = x
-                        next_start_entry = get_next_start_entry(time_event, races)
-                        logging.debug(f"Time_event: {time_event}")
-                        logging.debug(f"Start_entry: {next_start_entry}")
-                        if len(next_start_entry) > 0:
-                            time_event["next_race"] = next_start_entry["race_round"]
-                            time_event["next_race_id"] = next_start_entry["race_id"]
-                            time_event["next_race_position"] = next_start_entry[
-                                "starting_position"
-                            ]
-                            new_t_e = await TimeEventsAdapter().create_time_event(
-                                token, time_event
-                            )
-                            logging.debug(f"Created template: {new_t_e['status']}")
-                            i += 1
-        return f"Suksess! Opprettet {i} templates. "
+                    if len(next_start_entry) > 0:
+                        time_event["next_race"] = next_start_entry["race_round"]
+                        time_event["next_race_id"] = next_start_entry["race_id"]
+                        time_event["next_race_position"] = next_start_entry[
+                            "starting_position"
+                        ]
+                        templates.append(time_event)
+
+        # 3. create templates
+        create_errors = await run_bounded_with_progress(
+            "Create templates",
+            [
+                TimeEventsAdapter().create_time_event(token, template)
+                for template in templates
+            ],
+        )
+        informasjon = f"Opprettet {len(templates) - len(create_errors)} templates. "
+        if not delete_errors and not create_errors:
+            return f"Suksess! {informasjon}"
+        if delete_errors:
+            informasjon += f"<br>{len(delete_errors)} av {len(current_templates)} gamle templates ble ikke slettet: {delete_errors[0]} "
+        if create_errors:
+            informasjon += f"<br>{len(create_errors)} av {len(templates)} templates feilet: {create_errors[0]} "
+        return f"Feil! {informasjon}"
 
     async def create_start_time_event(self, token: str, time_event: dict) -> str:
         """Validate, enrich and create new start time_event."""
@@ -96,7 +117,7 @@ class TimeEventsService:
                 if dns_time_event["timing_point"] == "DNS":
                     # delete
                     await TimeEventsAdapter().delete_time_event(
-                        token, dns_time_event["id"]
+                        token, dns_time_event["id"], time_event["event_id"]
                     )
                     informasjon += " Slettet DNS registrering. "
 
@@ -209,7 +230,9 @@ async def delete_result(user: dict, time_event_id: str) -> str:
                     )
                     informasjon = f"Slettet neste start ({time_event['bib']}). "
                     logging.debug(f"Deleted start - result {id}")
-        await TimeEventsAdapter().delete_time_event(user["token"], time_event_id)
+        await TimeEventsAdapter().delete_time_event(
+            user["token"], time_event_id, time_event.get("event_id", "")
+        )
         informasjon = f"Slettet passering ({time_event['bib']}). {informasjon}"
     except Exception:
         informasjon = "Time event allerede slettet."
@@ -218,6 +241,31 @@ async def delete_result(user: dict, time_event_id: str) -> str:
     return informasjon
 
 
+async def run_bounded_with_progress(name: str, aws: list[Awaitable]) -> list[str]:
+    """Await all concurrently, bounded - return error pr failed item.
+
+    Progress is logged for every 10 percent done.
+    """
+    done = 0
+    total = len(aws)
+
+    async def run_one(aw: Awaitable) -> str:
+        nonlocal done
+        try:
+            await aw
+            error = ""
+        except Exception as e:
+            error = str(getattr(e, "reason", "") or e)
+            logging.warning(f"{name} - item failed: {error}")
+        done += 1
+        if done == total or done % max(total // 10, 1) == 0:
+            logging.info(f"{name} - {done} of {total} done.")
+        return error
+
+    results = await gather_bounded(run_one(aw) for aw in aws)
+    return [error for error in results if error]
+
+
 def get_next_start_entry(time_event: dict, races: list) -> dict:
     """Generate start_entry - empty result if not qualified."""
     start_entry = {}
@@ -5,10 +5,12 @@ from .control import Control
 from .corrections import Corrections
 from .csv_list import CsvList
 from .live import Live
+from .live_stream import LiveStream
 from .liveness import Ping, Ready
 from .login import Login
 from .logout import Logout
 from .main import Main
+from .metrics import Metrics
 from .photo_finish import PhotoFinish
 from .photo_update import PhotoUpdate
 from .photos import Photos
@@ -0,0 +1,100 @@
+"""Module for compressing html and json responses."""
+
+import asyncio
+import gzip
+import logging
+import os
+import zlib
+
+from aiohttp import hdrs, web
+from aiohttp.helpers import ETag
+
+RESPONSE_COMPRESS = os.getenv("RESPONSE_COMPRESS", "true") == "true"
+RESPONSE_COMPRESS_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESS_MIN_BYTES", "1024"))
+RESPONSE_COMPRESS_EXECUTOR_MIN_BYTES = int(
+    os.getenv("RESPONSE_COMPRESS_EXECUTOR_MIN_BYTES", "65536")
+)
+RESPONSE_COMPRESS_LEVEL = 6
+COMPRESSED_CONTENT_TYPES = (
+    "application/javascript",
+    "application/json",
+    "image/svg+xml",
+)
+
+
+def is_compressible(response: web.StreamResponse) -> bool:
+    """Return true for complete text responses that are not already compressed."""
+    return (
+        type(response) is web.Response
+        and isinstance(response.body, bytes)
+        and hdrs.CONTENT_ENCODING not in response.headers
+        and (
+            response.content_type.startswith("text/")
+            or response.content_type in COMPRESSED_CONTENT_TYPES
+        )
+    )
+
+
+def get_coding(request: web.Request) -> str:
+    """Return gzip or deflate, the one preferred by client - empty if none.
+
+    Codings with q=0 are not acceptable, and * applies to codings not listed.
+    """
+    qvalues = {}
+    for item in request.headers.get(hdrs.ACCEPT_ENCODING, "").lower().split(","):
+        coding, _, params = item.partition(";")
+        qvalue = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        qvalues[coding.strip()] = qvalue
+
+    preferred, preferred_qvalue = "", 0.0
+    for coding in ("gzip", "deflate"):
+        qvalue = qvalues.get(coding, qvalues.get("*", 0.0))
+        if qvalue > preferred_qvalue:
+            preferred, preferred_qvalue = coding, qvalue
+    return preferred
+
+
+def compress(body: bytes, coding: str) -> bytes:
+    """Return body compressed with coding."""
+    if coding == "gzip":
+        return gzip.compress(body, compresslevel=RESPONSE_COMPRESS_LEVEL, mtime=0)
+    return zlib.compress(body, RESPONSE_COMPRESS_LEVEL)
+
+
+@web.middleware
+async def compression_middleware(request: web.Request, handler) -> web.StreamResponse:
+    """Compress text responses above RESPONSE_COMPRESS_MIN_BYTES.
+
+    Bodies above RESPONSE_COMPRESS_EXECUTOR_MIN_BYTES are compressed in a
+    thread, so that large pages do not block other requests. Set
+    RESPONSE_COMPRESS to false behind a proxy that compresses.
+    """
+    response = await handler(request)
+    if not RESPONSE_COMPRESS or not is_compressible(response):
+        return response
+    response.headers.add(hdrs.VARY, hdrs.ACCEPT_ENCODING)
+    body = response.body
+    coding = get_coding(request)
+    if not coding or len(body) < RESPONSE_COMPRESS_MIN_BYTES:
+        return response
+
+    if len(body) >= RESPONSE_COMPRESS_EXECUTOR_MIN_BYTES:
+        compressed = await asyncio.get_running_loop().run_in_executor(
+            None, compress, body, coding
+        )
+    else:
+        compressed = compress(body, coding)
+    logging.debug(f"Compressed {request.path} - {len(body)} to {len(compressed)}")
+    response.body = compressed
+    response.headers[hdrs.CONTENT_ENCODING] = coding
+    # compressed bytes differ from the identity representation
+    if response.etag is not None and not response.etag.is_weak:
+        response.etag = ETag(value=response.etag.value, is_weak=True)
+    return response
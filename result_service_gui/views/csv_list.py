@@ -1,163 +1,217 @@
-"""Resource module for csv export."""
-
-import csv
-import io
-
-from aiohttp import web
-
-from result_service_gui.adapters import (
-    ContestantsAdapter,
-    RaceclassResultsAdapter,
-    RaceplansAdapter,
-    StartAdapter,
-)
-
-from .utils import check_login_open
-
-
-class CsvList(web.View):
-    """Class representing csv file export resource."""
-
-    async def get(self) -> web.Response:
-        """Ready route function."""
-        informasjon = ""
-        fields = []
-        csvdata = []
-
-        try:
-            event_id = self.request.rel_url.query["event_id"]
-            action = self.request.rel_url.query["action"]
-        except Exception:
-            informasjon = "Ingen event eller action valgt. Kan ikke vise informasjon"
-            return web.HTTPSeeOther(location=f"/?informasjon={informasjon}")
-
-        user = await check_login_open(self)
-
-        if action == "raceplan":
-            csvdata = await RaceplansAdapter().get_all_races(user["token"], event_id)
-            fields = get_fields_raceplan()
-        elif action == "startlist":
-            try:
-                race_round = self.request.rel_url.query["round"]
-            except Exception:
-                race_round = ""
-            csvdata = await get_startlist_data(event_id, user, race_round)
-            fields = get_fields_startlist()
-        elif action == "contestants":
-            csvdata = await ContestantsAdapter().get_all_contestants(
-                user["token"], event_id
-            )
-            fields = get_fields_contestants()
-        elif action == "results":
-            try:
-                valgt_klasse = self.request.rel_url.query["klasse"]
-            except Exception:
-                valgt_klasse = ""
-            if valgt_klasse:
-                results = await RaceclassResultsAdapter().get_raceclass_result(
-                    event_id, valgt_klasse
-                )
-                if results:
-                    csvdata = results["ranking_sequence"]
-            else:
-                results = await RaceclassResultsAdapter().get_all_raceclass_results(
-                    event_id
-                )
-                if results:
-                    for raceclass in results:
-                        for entry in raceclass["ranking_sequence"]:
-                            entry["raceclass"] = raceclass["raceclass"]
-                            csvdata.append(entry)
-            fields = get_fields_results(user)
-
-        # convert to csv format
-        output = io.StringIO()
-        writer = csv.DictWriter(
-            output, fieldnames=fields, delimiter=";", extrasaction="ignore"
-        )
-        writer.writeheader()
-        writer.writerows(csvdata)
-        informasjon = output.getvalue()
-
-        return web.Response(text=informasjon)
-
-
-async def get_startlist_data(event_id: str, user: dict, race_round: str) -> list:
-    """Return list of start-entries, filtered on round."""
-    filtered_startlist = []
-    startlist = await StartAdapter().get_all_starts_by_event(user["token"], event_id)
-    if race_round:
-        races = await RaceplansAdapter().get_all_races(user["token"], event_id)
-        for race in races:
-            if race["round"] == race_round:
-                filtered_startlist.extend(
-                    start
-                    for start in startlist[0]["start_entries"]
-                    if start["race_id"] == race["id"]
-                )
-    else:
-        filtered_startlist = startlist[0]["start_entries"]
-    return filtered_startlist
-
-
-def get_fields_raceplan() -> list:
-    """Return field for display."""
-    return [
-        "raceclass",
-        "order",
-        "start_time",
-        "no_of_contestants",
-        "round",
-        "index",
-        "heat",
-        "rule",
-    ]
-
-
-def get_fields_startlist() -> list:
-    """Return field for display."""
-    return [
-        "bib",
-        "starting_position",
-        "scheduled_start_time",
-        "name",
-        "club",
-    ]
-
-
-def get_fields_contestants() -> list:
-    """Return field for display."""
-    return [
-        "bib",
-        "first_name",
-        "last_name",
-        "birth_date",
-        "gender",
-        "ageclass",
-        "club",
-        "team",
-        "region",
-        "email",
-        "minidrett_id",
-        "id",
-        "seeding_points",
-        "registration_date_time",
-    ]
-
-
-def get_fields_results(user: dict) -> list:
-    """Return field for result display."""
-    field_list = [
-        "rank",
-        "bib",
-        "name",
-        "club",
-        "raceclass",
-        "ageclass",
-        "round",
-        "time",
-    ]
-    if user["loggedin"]:
-        field_list.append("minidrett_id")
-
-    return field_list
+"""Resource module for csv export."""
+
+import csv
+import io
+import os
+from collections.abc import Iterator
+
+from aiohttp import hdrs, web
+
+from result_service_gui.adapters import (
+    ContestantsAdapter,
+    RaceclassResultsAdapter,
+    RaceplansAdapter,
+    StartAdapter,
+)
+
+from .compression import get_coding
+from .page_cache import CachedPage, export_cache, page_response
+from .utils import check_login_open
+
+EXPORT_STREAM_MIN_ROWS = int(os.getenv("EXPORT_STREAM_MIN_ROWS", "2000"))
+EXPORT_STREAM_COMPRESS = os.getenv("EXPORT_STREAM_COMPRESS", "true") == "true"
+EXPORT_CHUNK_ROWS = 500
+
+
+class CsvList(web.View):
+    """Class representing csv file export resource."""
+
+    async def get(self) -> web.StreamResponse:
+        """Ready route function."""
+        informasjon = ""
+
+        try:
+            event_id = self.request.rel_url.query["event_id"]
+            action = self.request.rel_url.query["action"]
+        except Exception:
+            informasjon = "Ingen event eller action valgt. Kan ikke vise informasjon"
+            return web.HTTPSeeOther(location=f"/?informasjon={informasjon}")
+
+        user = await check_login_open(self)
+        race_round = self.request.rel_url.query.get("round", "")
+        valgt_klasse = self.request.rel_url.query.get("klasse", "")
+
+        # generated once, until data is changed - clients revalidate with etag
+        key = (event_id, action, race_round, valgt_klasse, user["loggedin"])
+        export = export_cache.get(key)
+        if export is None:
+            fields, csvdata = await get_csv_data(
+                event_id, user, action, race_round, valgt_klasse
+            )
+            # large exports are streamed, not cached
+            if len(csvdata) >= EXPORT_STREAM_MIN_ROWS:
+                return await stream_csv(self.request, fields, csvdata)
+            export = CachedPage.from_body(
+                b"".join(iter_csv_chunks(fields, csvdata)), "text/plain", "utf-8"
+            )
+            export_cache.set(key, export, tags=[event_id])
+        return page_response(self.request, export)
+
+
+async def get_csv_data(
+    event_id: str, user: dict, action: str, race_round: str, valgt_klasse: str
+) -> tuple[list, list]:
+    """Return fields and rows to export for action."""
+    fields = []
+    csvdata = []
+    if action == "raceplan":
+        csvdata = await RaceplansAdapter().get_all_races(user["token"], event_id)
+        fields = get_fields_raceplan()
+    elif action == "startlist":
+        csvdata = await get_startlist_data(event_id, user, race_round)
+        fields = get_fields_startlist()
+    elif action == "contestants":
+        csvdata = await ContestantsAdapter().get_all_contestants(
+            user["token"], event_id
+        )
+        fields = get_fields_contestants()
+    elif action == "results":
+        if valgt_klasse:
+            results = await RaceclassResultsAdapter().get_raceclass_result(
+                event_id, valgt_klasse
+            )
+            if results:
+                csvdata = results["ranking_sequence"]
+        else:
+            results = await RaceclassResultsAdapter().get_all_raceclass_results(
+                event_id
+            )
+            if results:
+                for raceclass in results:
+                    for entry in raceclass["ranking_sequence"]:
+                        entry["raceclass"] = raceclass["raceclass"]
+                        csvdata.append(entry)
+        fields = get_fields_results(user)
+    return fields, csvdata
+
+
+def iter_csv_chunks(fields: list, csvdata: list) -> Iterator[bytes]:
+    """Yield csv header and rows as encoded chunks of EXPORT_CHUNK_ROWS rows."""
+    output = io.StringIO()
+    writer = csv.DictWriter(
+        output, fieldnames=fields, delimiter=";", extrasaction="ignore"
+    )
+    writer.writeheader()
+    for count, row in enumerate(csvdata, start=1):
+        writer.writerow(row)
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield output.getvalue().encode()
+            output.seek(0)
+            output.truncate()
+    yield output.getvalue().encode()
+
+
+async def stream_csv(
+    request: web.Request, fields: list, csvdata: list
+) -> web.StreamResponse:
+    """Stream large export in chunks - only one chunk of csv is held in memory.
+
+    Chunks are encoded while streamed, so there is no etag - a hash of the
+    body is not known until it is sent, and a cached one may not match it.
+    """
+    response = web.StreamResponse(headers={hdrs.CACHE_CONTROL: "no-cache"})
+    response.content_type = "text/plain"
+    response.charset = "utf-8"
+    response.enable_chunked_encoding()
+    if EXPORT_STREAM_COMPRESS:
+        response.headers.add(hdrs.VARY, hdrs.ACCEPT_ENCODING)
+        # coding preferred by client - aiohttp alone would ignore q-values
+        coding = get_coding(request)
+        if coding:
+            response.enable_compression(web.ContentCoding(coding))
+    await response.prepare(request)
+    for chunk in iter_csv_chunks(fields, csvdata):
+        await response.write(chunk)
+    await response.write_eof()
+    return response
+
+
+async def get_startlist_data(event_id: str, user: dict, race_round: str) -> list:
+    """Return list of start-entries, filtered on round."""
+    filtered_startlist = []
+    startlist = await StartAdapter().get_all_starts_by_event(user["token"], event_id)
+    if race_round:
+        races = await RaceplansAdapter().get_all_races(user["token"], event_id)
+        for race in races:
+            if race["round"] == race_round:
+                filtered_startlist.extend(
+                    start
+                    for start in startlist[0]["start_entries"]
+                    if start["race_id"] == race["id"]
+                )
+    else:
+        filtered_startlist = startlist[0]["start_entries"]
+    return filtered_startlist
+
+
+def get_fields_raceplan() -> list:
+    """Return field for display."""
+    return [
+        "raceclass",
+        "order",
+        "start_time",
+        "no_of_contestants",
+        "round",
+        "index",
+        "heat",
+        "rule",
+    ]
+
+
+def get_fields_startlist() -> list:
+    """Return field for display."""
+    return [
+        "bib",
+        "starting_position",
+        "scheduled_start_time",
+        "name",
+        "club",
+    ]
+
+
+def get_fields_contestants() -> list:
+    """Return field for display."""
+    return [
+        "bib",
+        "first_name",
+        "last_name",
+        "birth_date",
+        "gender",
+        "ageclass",
+        "club",
+        "team",
+        "region",
+        "email",
+        "minidrett_id",
+        "id",
+        "seeding_points",
+        "registration_date_time",
+    ]
+
+
+def get_fields_results(user: dict) -> list:
+    """Return field for result display."""
+    field_list = [
+        "rank",
+        "bib",
+        "name",
+        "club",
+        "raceclass",
+        "ageclass",
+        "round",
+        "time",
+    ]
+    if user["loggedin"]:
+        field_list.append("minidrett_id")
+
+    return field_list
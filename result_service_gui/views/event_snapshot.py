@@ -0,0 +1,232 @@
+"""Module for shared snapshots of public event data, refreshed in the background."""
+
+import asyncio
+import contextvars
+import logging
+import os
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from aiohttp import web
+
+from result_service_gui.adapters import (
+    EventsAdapter,
+    RaceclassesAdapter,
+    RaceclassResultsAdapter,
+    RaceplansAdapter,
+    TimeEventsAdapter,
+)
+
+from .utils import (
+    enrich_race_for_live,
+    format_race_for_print,
+    get_enrichced_startlist,
+    get_startlist_with_logos,
+)
+
+EVENT_SNAPSHOT_POLL_SECONDS = float(os.getenv("EVENT_SNAPSHOT_POLL_SECONDS", "5"))
+EVENT_SNAPSHOT_IDLE_SECONDS = float(os.getenv("EVENT_SNAPSHOT_IDLE_SECONDS", "300"))
+EVENT_SNAPSHOT_WAIT_SECONDS = float(os.getenv("EVENT_SNAPSHOT_WAIT_SECONDS", "5"))
+EVENT_SNAPSHOT_MAX_EVENTS = int(os.getenv("EVENT_SNAPSHOT_MAX_EVENTS", "20"))
+
+
+@dataclass(frozen=True)
+class EventSnapshot:
+    """Public data for one event with derived structures, shared by all viewers.
+
+    A snapshot is never changed after it is published. Races are returned as
+    shallow copies, nested lists and dicts must not be changed by views.
+    """
+
+    event: Mapping
+    raceclasses: tuple[Mapping, ...]
+    races: tuple[Mapping, ...]
+    raceclass_results: Mapping[str, Mapping]
+    print_races: tuple[Mapping, ...] = ()
+    created: float = field(default_factory=time.time)
+
+    def get_event(self) -> dict:
+        """Return copy of event."""
+        return dict(self.event)
+
+    def get_raceclasses(self) -> list:
+        """Return copy of raceclasses."""
+        return [dict(raceclass) for raceclass in self.raceclasses]
+
+    def get_races(self, raceclass: str = "") -> list:
+        """Return copy of races in raceplan order - all if raceclass is empty."""
+        return [
+            dict(race) for race in self.races if raceclass in ("", race["raceclass"])
+        ]
+
+    def get_print_races(self, raceclass: str = "", race_round: str = "") -> list:
+        """Return copy of races formatted for the live print list, filtered."""
+        return [
+            dict(race)
+            for race in self.print_races
+            if raceclass in ("", race["raceclass"])
+            and race_round in ("", race["round"])
+        ]
+
+    def get_raceclass_result(self, raceclass: str) -> dict:
+        """Return copy of published result for raceclass, empty if not published."""
+        return dict(self.raceclass_results.get(raceclass, {}))
+
+
+async def build_event_snapshot(event_id: str) -> EventSnapshot:
+    """Read public event data once and compute derived structures."""
+    token = ""
+    event = await EventsAdapter().get_event(token, event_id)
+    raceclasses = await RaceclassesAdapter().get_raceclasses(token, event_id)
+    races = await RaceplansAdapter().get_all_races(token, event_id)
+    try:
+        raceclass_results = await RaceclassResultsAdapter().get_all_raceclass_results(
+            event_id
+        )
+    except Exception:
+        logging.exception(f"Snapshot without raceclass results - {event_id}")
+        raceclass_results = []
+
+    # one read of all time events, instead of one pr race in the print list
+    time_events = await TimeEventsAdapter().get_time_events_by_event_id(token, event_id)
+    time_events_by_race: dict[str, list] = {}
+    for time_event in time_events:
+        time_events_by_race.setdefault(time_event.get("race_id", ""), []).append(
+            time_event
+        )
+
+    raceclass_names = {raceclass["name"] for raceclass in raceclasses}
+    print_races = []
+    for race in races:
+        enrich_race_for_live(race)
+        race["startliste"] = get_startlist_with_logos(race)
+        if race["raceclass"] in raceclass_names:
+            print_races.append(
+                await get_race_for_live_print(
+                    race, time_events_by_race.get(race["id"], [])
+                )
+            )
+    return EventSnapshot(
+        event=MappingProxyType(event),
+        raceclasses=tuple(MappingProxyType(raceclass) for raceclass in raceclasses),
+        races=tuple(MappingProxyType(race) for race in races),
+        raceclass_results=MappingProxyType(
+            {
+                result.get("raceclass_name", ""): MappingProxyType(result)
+                for result in raceclass_results
+            }
+        ),
+        print_races=tuple(MappingProxyType(race) for race in print_races),
+    )
+
+
+async def get_race_for_live_print(race: dict, time_events: list) -> dict:
+    """Return copy of race with start list or results, for the live print list."""
+    print_race = {
+        **race,
+        "start_entries": [dict(entry) for entry in race["start_entries"]],
+    }
+    format_race_for_print(print_race, "live")
+    if print_race["list_type"] == "start":
+        print_race["startliste"] = await get_enrichced_startlist(
+            {"token": ""}, print_race, time_events
+        )
+    return print_race
+
+
+class EventSnapshotPoller:
+    """Refresh the snapshot for one event while it is being read.
+
+    Polling starts on first read and stops when the snapshot has not been
+    read for EVENT_SNAPSHOT_IDLE_SECONDS.
+    """
+
+    def __init__(self, event_id: str) -> None:
+        """Initialize poller without snapshot."""
+        self.event_id = event_id
+        self.snapshot: EventSnapshot | None = None
+        self.last_read = time.monotonic()
+        self.first_poll_done = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    async def get_snapshot(self) -> EventSnapshot | None:
+        """Return latest snapshot - None if it could not be created in time."""
+        self.last_read = time.monotonic()
+        if self.task is None:
+            # own context - the poller must not use the request memo of a request
+            self.task = asyncio.create_task(self.run(), context=contextvars.Context())
+        try:
+            await asyncio.wait_for(
+                self.first_poll_done.wait(), timeout=EVENT_SNAPSHOT_WAIT_SECONDS
+            )
+        except TimeoutError:
+            logging.warning(
+                f"Event snapshot not ready, read directly - {self.event_id}"
+            )
+        return self.snapshot
+
+    def stop(self) -> None:
+        """Stop polling and forget poller."""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        if _pollers.get(self.event_id) is self:
+            del _pollers[self.event_id]
+
+    async def run(self) -> None:
+        """Poll event data until idle."""
+        logging.info(f"Event snapshot poller started - {self.event_id}")
+        while time.monotonic() - self.last_read < EVENT_SNAPSHOT_IDLE_SECONDS:
+            try:
+                self.snapshot = await build_event_snapshot(self.event_id)
+            except Exception:
+                # keep previous snapshot, views read directly if there is none
+                logging.exception(f"Event snapshot poll failed - {self.event_id}")
+            self.first_poll_done.set()
+            await asyncio.sleep(EVENT_SNAPSHOT_POLL_SECONDS)
+        logging.info(f"Event snapshot poller stopped, idle - {self.event_id}")
+        self.task = None
+        self.stop()
+
+
+_pollers: dict[str, EventSnapshotPoller] = {}
+
+
+async def get_event_snapshot(event_id: str, token: str) -> EventSnapshot | None:
+    """Return latest snapshot for event - None if disabled or not available.
+
+    Snapshots hold public data, read without login. Logged in users (with a
+    token) get None and read directly, with their own credentials. Polling
+    is only started for existing events, and for at most
+    EVENT_SNAPSHOT_MAX_EVENTS events at a time - others read directly.
+    """
+    if not event_id or token or EVENT_SNAPSHOT_POLL_SECONDS <= 0:
+        return None
+    poller = _pollers.get(event_id)
+    if poller is None:
+        if len(_pollers) >= EVENT_SNAPSHOT_MAX_EVENTS:
+            return None
+        # unknown event ids must not start polling
+        try:
+            event = await EventsAdapter().get_event("", event_id)
+        except Exception:
+            logging.debug(f"No event snapshot, event not found - {event_id}")
+            return None
+        if not event:
+            return None
+        # another request may have started polling meanwhile
+        poller = _pollers.get(event_id)
+        if poller is None:
+            if len(_pollers) >= EVENT_SNAPSHOT_MAX_EVENTS:
+                return None
+            poller = EventSnapshotPoller(event_id)
+            _pollers[event_id] = poller
+    return await poller.get_snapshot()
+
+
+async def stop_event_snapshots(_app: web.Application) -> None:
+    """Stop all snapshot pollers - called on shutdown."""
+    for poller in list(_pollers.values()):
+        poller.stop()
@@ -1,7 +1,7 @@
 """Resource module for live resources."""
 
 import logging
-from operator import itemgetter
+import os
 
 import aiohttp_jinja2
 from aiohttp import web
@@ -11,16 +11,16 @@ from result_service_gui.adapters import (
     RaceclassesAdapter,
     RaceplansAdapter,
 )
-from result_service_gui.services import (
-    RaceclassResultsService,
-)
 
+from .event_snapshot import get_event_snapshot
 from .utils import (
     check_login_open,
+    enrich_race_for_live,
     get_event,
-    get_qualification_text,
 )
 
+LIVE_STREAM_POLL_SECONDS = float(os.getenv("LIVE_STREAM_POLL_SECONDS", "5"))
+
 
 class Live(web.View):
     """Class representing the live view."""
@@ -41,7 +41,11 @@ class Live(web.View):
             informasjon = ""
         try:
             user = await check_login_open(self)
-            event = await get_event(user, event_id)
+            snapshot = await get_event_snapshot(event_id, user["token"])
+            if snapshot:
+                event = snapshot.get_event()
+            else:
+                event = await get_event(user, event_id)
             races = []
             colseparators = []
             colclass = "w3-third"
@@ -60,9 +64,12 @@ class Live(web.View):
             except Exception:
                 refresh = 120
 
-            raceclasses = await RaceclassesAdapter().get_raceclasses(
-                user["token"], event_id
-            )
+            if snapshot:
+                raceclasses = snapshot.get_raceclasses()
+            else:
+                raceclasses = await RaceclassesAdapter().get_raceclasses(
+                    user["token"], event_id
+                )
 
             if action == "now":
                 valgt_klasse = await get_klasse_for_now_view(user, event, valgt_klasse)
@@ -92,6 +99,10 @@ class Live(web.View):
                     "event": event,
                     "event_id": event_id,
                     "informasjon": informasjon,
+                    # races are updated in place, except for the now view
+                    "live_stream": bool(valgt_klasse)
+                    and action != "now"
+                    and LIVE_STREAM_POLL_SECONDS > 0,
                     "local_time_now": EventsAdapter().get_local_time(event, "HH:MM"),
                     "valgt_klasse": valgt_klasse,
                     "valgt_startnr": valgt_startnr,
@@ -109,24 +120,23 @@ class Live(web.View):
 
 async def get_klasse_for_now_view(user: dict, event: dict, gender: str) -> str:
     """Return races to display in live view."""
-    races = await RaceplansAdapter().get_all_races(user["token"], event["id"])
+    race_index = await RaceplansAdapter().get_race_order_index(
+        user["token"], event["id"]
+    )
     time_now = EventsAdapter().get_local_time(event, "log")
     # find next race on start
-    valgt_klasse = ""
-    for race in races:
-        if time_now < race["start_time"]:
-            valgt_klasse = race["raceclass"]
-            if gender == "K":
-                valgt_klasse = valgt_klasse.replace("M", "K")
-                valgt_klasse = valgt_klasse.replace("G", "J")
-            elif gender == "M":
-                valgt_klasse = valgt_klasse.replace("K", "M")
-                valgt_klasse = valgt_klasse.replace("J", "G")
-            break
-    else:
+    race = race_index.get_next_race_on_start(time_now)
+    if not race:
         # all races have already started
         return "Alle har startet"
 
+    valgt_klasse = race["raceclass"]
+    if gender == "K":
+        valgt_klasse = valgt_klasse.replace("M", "K")
+        valgt_klasse = valgt_klasse.replace("G", "J")
+    elif gender == "M":
+        valgt_klasse = valgt_klasse.replace("K", "M")
+        valgt_klasse = valgt_klasse.replace("J", "G")
     return valgt_klasse
 
 
@@ -175,31 +185,21 @@ async def get_races(
     races = []
 
     if valgt_klasse:
-        races = await get_races_for_live(
-            token, event_id, valgt_klasse, valgt_startnr, action
-        )
-        # sort start list by starting position and append club_logo
-        for race in races:
-            if len(race["start_entries"]) > 1:
-                race["start_entries"] = sorted(
-                    race["start_entries"], key=itemgetter("starting_position")
-                )
-                for entry in race["start_entries"]:
-                    entry["club_logo"] = EventsAdapter().get_club_logo_url(
-                        entry["club"]
-                    )
+        snapshot = await get_event_snapshot(event_id, token)
+        if snapshot:
+            _tmp_races = snapshot.get_races(valgt_klasse)
+        else:
+            _tmp_races = await RaceplansAdapter().get_races_by_racesclass(
+                token, event_id, valgt_klasse
+            )
+            for race in _tmp_races:
+                enrich_race_for_live(race)
+        races = select_races_for_live(_tmp_races, valgt_startnr, action)
     return races
 
 
-async def get_races_for_live(
-    token: str, event_id: str, valgt_klasse: str, valgt_startnr: int, action: str
-) -> list:
-    """Extract races with enriched content for live view."""
-    races = []
-    _tmp_races = await RaceplansAdapter().get_races_by_racesclass(
-        token, event_id, valgt_klasse
-    )
-    # first - get overview of races
+def get_live_selection(_tmp_races: list) -> tuple[int, bool]:
+    """Return overview of races that decides which heats to show in live view."""
     races_count_q = 0
     semi_results_registered = False
     for _tmp_race in _tmp_races:
@@ -208,11 +208,15 @@ async def get_races_for_live(
         elif _tmp_race["round"] == "S":
             if len(_tmp_race["results"]) > 0:
                 semi_results_registered = True
+    return races_count_q, semi_results_registered
+
+
+def select_races_for_live(_tmp_races: list, valgt_startnr: int, action: str) -> list:
+    """Select enriched races to show in live view."""
+    races = []
+    # first - get overview of races
+    races_count_q, semi_results_registered = get_live_selection(_tmp_races)
     for race in _tmp_races:
-        race["finish_results"] = RaceclassResultsService().get_finish_rank_for_race(
-            race, False
-        )
-        race["next_race"] = get_qualification_text(race)
         # append race if selected starter is inside or not selected
         # optimize heats to show if more than 4 quarter finals
         # avoid quarter finals or finals, depending on semi final status
@@ -0,0 +1,186 @@
+"""Resource module for the live stream - server-sent events with race updates."""
+
+import asyncio
+import contextlib
+import contextvars
+import json
+import logging
+import os
+
+import aiohttp_jinja2
+from aiohttp import hdrs, web
+
+from .live import LIVE_STREAM_POLL_SECONDS, get_live_selection, get_races
+
+LIVE_STREAM_KEEPALIVE_SECONDS = float(os.getenv("LIVE_STREAM_KEEPALIVE_SECONDS", "15"))
+LIVE_STREAM_QUEUE_SIZE = 10
+
+
+class RaceclassPoller:
+    """Poll races for one raceclass and publish changed races to subscribers.
+
+    One poller is shared by all live stream subscribers for the same event
+    and raceclass, so backend load does not grow with number of spectators.
+    The poller stops when the last subscriber leaves.
+    """
+
+    def __init__(self, event_id: str, raceclass: str) -> None:
+        """Initialize poller without subscribers."""
+        self.event_id = event_id
+        self.raceclass = raceclass
+        self.subscribers: set[asyncio.Queue] = set()
+        self.races: dict[str, dict] = {}
+        self.selection: tuple[int, bool] | None = None
+        self.first_poll_done = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    def subscribe(self) -> asyncio.Queue:
+        """Return a new subscriber queue, start polling if not started."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=LIVE_STREAM_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        if self.task is None:
+            # own context - the poller must not use the request memo of a request
+            self.task = asyncio.create_task(self.run(), context=contextvars.Context())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove subscriber queue, stop polling if no subscribers left."""
+        self.subscribers.discard(queue)
+        if not self.subscribers:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop polling and forget poller."""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        if _pollers.get((self.event_id, self.raceclass)) is self:
+            del _pollers[(self.event_id, self.raceclass)]
+
+    def publish(self, message: tuple) -> None:
+        """Send message to all subscribers - a slow subscriber must reload."""
+        for queue in self.subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(("reload", None))
+
+    async def run(self) -> None:
+        """Poll races until stopped."""
+        logging.info(f"Live stream poller started - {self.event_id} {self.raceclass}")
+        while True:
+            try:
+                await self.poll()
+            except Exception:
+                logging.exception(f"Live stream poll failed - {self.raceclass}")
+            await asyncio.sleep(LIVE_STREAM_POLL_SECONDS)
+
+    async def poll(self) -> None:
+        """Get races and publish the ones changed since last poll."""
+        races = await get_races("", self.event_id, self.raceclass, 0, "all")
+        new_races = {race["id"]: race for race in races}
+        selection = get_live_selection(races)
+        if self.first_poll_done.is_set() and (
+            new_races.keys() != self.races.keys() or selection != self.selection
+        ):
+            # raceplan or selection of heats is changed, page must be rendered again
+            self.publish(("reload", None))
+        elif self.first_poll_done.is_set():
+            for race_id, race in new_races.items():
+                if race != self.races[race_id]:
+                    self.publish(("race", race))
+        self.races = new_races
+        self.selection = selection
+        self.first_poll_done.set()
+
+
+_pollers: dict[tuple[str, str], RaceclassPoller] = {}
+
+
+def get_poller(event_id: str, raceclass: str) -> RaceclassPoller:
+    """Return the shared poller for event and raceclass."""
+    poller = _pollers.get((event_id, raceclass))
+    if poller is None:
+        poller = RaceclassPoller(event_id, raceclass)
+        _pollers[(event_id, raceclass)] = poller
+    return poller
+
+
+async def close_live_streams(_app: web.Application) -> None:
+    """Stop all pollers and end all live streams - called on shutdown."""
+    for poller in list(_pollers.values()):
+        poller.publish(("close", None))
+        poller.stop()
+
+
+class LiveStream(web.View):
+    """Class representing the live stream."""
+
+    async def get(self) -> web.StreamResponse:
+        """Get route function that streams updated races as server-sent events."""
+        event_id = self.request.rel_url.query.get("event_id", "")
+        valgt_klasse = self.request.rel_url.query.get("klasse", "")
+        try:
+            valgt_startnr = int(self.request.rel_url.query["startnr"])
+        except Exception:
+            valgt_startnr = 0
+        if not (event_id and valgt_klasse) or LIVE_STREAM_POLL_SECONDS <= 0:
+            raise web.HTTPNotFound(reason="Live stream not available.")
+
+        response = web.StreamResponse(
+            headers={
+                hdrs.CONTENT_TYPE: "text/event-stream",
+                hdrs.CACHE_CONTROL: "no-cache",
+                "X-Accel-Buffering": "no",
+            }
+        )
+        await response.prepare(self.request)
+        template = aiohttp_jinja2.get_env(self.request.app).get_template(
+            "live_race.html"
+        )
+        poller = get_poller(event_id, valgt_klasse)
+        queue = poller.subscribe()
+
+        async def write_event(event: str, race: dict | None) -> None:
+            data = {}
+            if race is not None:
+                html = await template.render_async(
+                    race=race,
+                    event_id=event_id,
+                    valgt_klasse=valgt_klasse,
+                    valgt_startnr=valgt_startnr,
+                )
+                data = {"id": race["id"], "html": html}
+            await response.write(
+                f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+            )
+
+        try:
+            # the page may be older than the poller - start with current races
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    poller.first_poll_done.wait(),
+                    timeout=LIVE_STREAM_KEEPALIVE_SECONDS,
+                )
+            for race in list(poller.races.values()):
+                await write_event("race", race)
+            while True:
+                try:
+                    event, race = await asyncio.wait_for(
+                        queue.get(), timeout=LIVE_STREAM_KEEPALIVE_SECONDS
+                    )
+                except TimeoutError:
+                    await response.write(b": keepalive\n\n")
+                    continue
+                if event == "close":
+                    break
+                await write_event(event, race)
+        except ConnectionResetError:
+            logging.debug("Live stream closed by client")
+        finally:
+            poller.unsubscribe(queue)
+        with contextlib.suppress(ConnectionResetError):
+            await response.write_eof()
+        return response
@@ -0,0 +1,15 @@
+"""Resource module for metrics resources."""
+
+from aiohttp import web
+
+from result_service_gui.adapters.metrics import metrics
+
+
+class Metrics(web.View):
+    """Class representing metrics resource, in Prometheus text format."""
+
+    async def get(self) -> web.Response:
+        """Metrics route function - sum of all workers."""
+        return web.Response(
+            text=metrics.render(), content_type="text/plain", charset="utf-8"
+        )
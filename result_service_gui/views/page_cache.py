@@ -0,0 +1,141 @@
+"""Module for caching rendered public pages and csv exports."""
+
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+
+from aiohttp import hdrs, web
+from aiohttp.helpers import ETAG_ANY
+from aiohttp_session import get_session
+
+from result_service_gui.adapters import UserAdapter
+from result_service_gui.adapters.cache import TtlCache
+
+PAGE_CACHE_TTL_SECONDS = float(os.getenv("PAGE_CACHE_TTL_SECONDS", "5"))
+PAGE_CACHE_MAX_ENTRIES = int(os.getenv("PAGE_CACHE_MAX_ENTRIES", "1000"))
+EXPORT_CACHE_TTL_SECONDS = float(os.getenv("EXPORT_CACHE_TTL_SECONDS", "30"))
+CACHED_PAGE_PATHS = ("/live", "/start", "/resultat", "/print_lists")
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """Rendered page body with content type, entity tag and time of creation."""
+
+    body: bytes
+    content_type: str
+    charset: str | None
+    etag: str
+    last_modified: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_body(
+        cls, body: bytes, content_type: str, charset: str | None
+    ) -> "CachedPage":
+        """Create page with entity tag from hash of the body."""
+        return cls(
+            body=body,
+            content_type=content_type,
+            charset=charset,
+            etag=hashlib.blake2b(body, digest_size=16).hexdigest(),
+        )
+
+
+page_cache = TtlCache(
+    "pages",
+    PAGE_CACHE_TTL_SECONDS,
+    copy_values=False,
+    max_entries=PAGE_CACHE_MAX_ENTRIES,
+)
+# exports are the same for all users with the same login status
+export_cache = TtlCache(
+    "exports",
+    EXPORT_CACHE_TTL_SECONDS,
+    copy_values=False,
+    max_entries=PAGE_CACHE_MAX_ENTRIES,
+)
+
+
+def invalidate_page_cache(event_id: str = "") -> None:
+    """Invalidate cached pages and exports for one event - all if not known."""
+    for cache in (page_cache, export_cache):
+        if event_id:
+            cache.invalidate(event_id)
+        else:
+            cache.clear()
+
+
+def get_page_key(request: web.Request) -> tuple:
+    """Return cache key - path and query with parameters in sorted order."""
+    return (request.path, tuple(sorted(request.rel_url.query.items())))
+
+
+async def is_anonymous(request: web.Request) -> bool:
+    """Return true if user is not logged in - same page for all guests."""
+    session = await get_session(request)
+    return not UserAdapter().isloggedin(session)
+
+
+def etag_matches(request: web.Request, etag: str) -> bool:
+    """Return true if If-None-Match contains the entity tag."""
+    return any(tag.value in (etag, ETAG_ANY) for tag in (request.if_none_match or ()))
+
+
+def is_not_modified(request: web.Request, page: CachedPage) -> bool:
+    """Return true if the conditional request matches the page version."""
+    if request.if_none_match is not None:
+        return etag_matches(request, page.etag)
+    if request.if_modified_since is not None:
+        return request.if_modified_since.timestamp() >= int(page.last_modified)
+    return False
+
+
+def page_response(request: web.Request, page: CachedPage) -> web.Response:
+    """Return page, or 304 Not Modified if the client has the same version."""
+    if is_not_modified(request, page):
+        response = web.Response(status=304)
+    else:
+        response = web.Response(
+            body=page.body, content_type=page.content_type, charset=page.charset
+        )
+    response.etag = page.etag
+    response.last_modified = page.last_modified
+    # browsers must revalidate - refresh then gets 304 until the page changes
+    response.headers[hdrs.CACHE_CONTROL] = "no-cache"
+    return response
+
+
+@web.middleware
+async def page_cache_middleware(request: web.Request, handler) -> web.StreamResponse:
+    """Serve public pages for anonymous users from the page cache.
+
+    Pages are cached pr path and query for PAGE_CACHE_TTL_SECONDS. Any
+    non-GET request changes data, and invalidates all cached pages.
+    """
+    if request.method != hdrs.METH_GET:
+        response = await handler(request)
+        if request.method != hdrs.METH_HEAD:
+            invalidate_page_cache()
+        return response
+    if (
+        not page_cache.enabled
+        or request.path not in CACHED_PAGE_PATHS
+        or not await is_anonymous(request)
+    ):
+        return await handler(request)
+
+    key = get_page_key(request)
+    page = page_cache.get(key)
+    if page is None:
+        response = await handler(request)
+        # errors are returned as redirects - only cache rendered pages
+        if type(response) is not web.Response or response.status != 200:
+            return response
+        body = response.body
+        if not isinstance(body, bytes):
+            return response
+        page = CachedPage.from_body(body, response.content_type, response.charset)
+        page_cache.set(key, page, tags=[request.rel_url.query.get("event_id", "")])
+        logging.debug(f"Page cached {key} - {page_cache.stats()}")
+    return page_response(request, page)
@@ -11,6 +11,7 @@ from result_service_gui.adapters import (
     RaceplansAdapter,
 )
 
+from .event_snapshot import get_event_snapshot
 from .utils import (
     check_login_open,
     get_event,
@@ -43,7 +44,14 @@ class PrintLists(web.View):
         try:
             user = await check_login_open(self)
             event_id = self.request.rel_url.query["event_id"]
-            event = await get_event(user, event_id)
+            # live lists are public - read from shared snapshot
+            snapshot = None
+            if action == "live":
+                snapshot = await get_event_snapshot(event_id, user["token"])
+            if snapshot:
+                event = snapshot.get_event()
+            else:
+                event = await get_event(user, event_id)
 
             races = []
             raceplan_summary = []
@@ -58,25 +66,31 @@ class PrintLists(web.View):
             except Exception:
                 valgt_runde = ""
 
-            raceclasses = await RaceclassesAdapter().get_raceclasses(
-                user["token"], event_id
-            )
-            if valgt_klasse:
-                _tmp_races = await RaceplansAdapter().get_races_by_racesclass(
-                    user["token"], event_id, valgt_klasse
-                )
+            _tmp_races = []
+            if snapshot:
+                # start and result lists are built by the snapshot poller
+                raceclasses = snapshot.get_raceclasses()
+                races = snapshot.get_print_races(valgt_klasse, valgt_runde)
             else:
-                _tmp_races = await RaceplansAdapter().get_all_races(
+                raceclasses = await RaceclassesAdapter().get_raceclasses(
                     user["token"], event_id
                 )
-            races = await get_races(
-                user,
-                action,
-                valgt_klasse,
-                valgt_runde,
-                _tmp_races,
-                raceclasses,
-            )
+                if valgt_klasse:
+                    _tmp_races = await RaceplansAdapter().get_races_by_racesclass(
+                        user["token"], event_id, valgt_klasse
+                    )
+                else:
+                    _tmp_races = await RaceplansAdapter().get_all_races(
+                        user["token"], event_id
+                    )
+                races = await get_races(
+                    user,
+                    action,
+                    valgt_klasse,
+                    valgt_runde,
+                    _tmp_races,
+                    raceclasses,
+                )
             if len(races) == 0:
                 informasjon = "Ingen kjøreplaner funnet."
 
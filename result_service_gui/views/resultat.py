@@ -11,6 +11,7 @@ from result_service_gui.adapters import (
     RaceclassResultsAdapter,
 )
 
+from .event_snapshot import get_event_snapshot
 from .utils import (
     check_login_open,
     get_event,
@@ -33,7 +34,11 @@ class Resultat(web.View):
 
         try:
             user = await check_login_open(self)
-            event = await get_event(user, event_id)
+            snapshot = await get_event_snapshot(event_id, user["token"])
+            if snapshot:
+                event = snapshot.get_event()
+            else:
+                event = await get_event(user, event_id)
 
             foto = []
             informasjon = ""
@@ -45,9 +50,12 @@ class Resultat(web.View):
             except Exception:
                 valgt_klasse = ""
 
-            raceclasses = await RaceclassesAdapter().get_raceclasses(
-                user["token"], event_id
-            )
+            if snapshot:
+                raceclasses = snapshot.get_raceclasses()
+            else:
+                raceclasses = await RaceclassesAdapter().get_raceclasses(
+                    user["token"], event_id
+                )
 
             if not valgt_klasse:
                 informasjon = "Velg klasse for å vise resultater"
@@ -56,9 +64,19 @@ class Resultat(web.View):
                 )
             else:
                 try:
-                    resultlist = await RaceclassResultsAdapter().get_raceclass_result(
-                        event_id, valgt_klasse
-                    )
+                    if snapshot:
+                        resultlist = snapshot.get_raceclass_result(valgt_klasse)
+                        if not resultlist:
+                            informasjon = (
+                                f"Resultater er ikke klare for {valgt_klasse}. "
+                                "Velg 'Live' i menyen for heat resultater"
+                            )
+                    else:
+                        resultlist = (
+                            await RaceclassResultsAdapter().get_raceclass_result(
+                                event_id, valgt_klasse
+                            )
+                        )
                 except Exception as e:
                     informasjon = f"{e} Velg 'Live' i menyen for heat resultater"
 
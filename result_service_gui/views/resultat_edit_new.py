@@ -13,6 +13,7 @@ from result_service_gui.adapters import (
     RaceclassesAdapter,
     RaceplansAdapter,
     ResultAdapter,
+    TimeEventsAdapter,
 )
 from result_service_gui.services import (
     PhotoTimingService,
@@ -108,9 +109,16 @@ class ResultatEditNew(web.View):
                     user["token"], race["id"]
                 )
                 race["next_race"] = get_qualification_text(race)
+                time_events = await TimeEventsAdapter().get_time_events_by_race_id(
+                    user["token"], race["id"]
+                )
                 # get start list detail
-                race["startliste"] = await get_enrichced_startlist(user, race)
-                race["finish_timings"] = await get_finish_timings(user, race["id"])
+                race["startliste"] = await get_enrichced_startlist(
+                    user, race, time_events
+                )
+                race["finish_timings"] = await get_finish_timings(
+                    user, race["id"], race, time_events
+                )
                 race["photo_finish"] = get_foto_finish_for_race(race, foto)
                 race["photo_start"] = get_foto_start_for_race(race, foto)
                 race["photo_bib_rank"] = get_finish_rank_from_photos(
@@ -248,21 +256,17 @@ async def get_starting_now(user: dict, event: dict, heat: int) -> ValgtRunde:
     """Analyse selected heat and determine raceclass and round."""
     valgt_runde = ValgtRunde()
     valgt_runde.race_order = heat
-    time_now = EventsAdapter().get_local_time(event, "log")
-    races = await RaceplansAdapter().get_all_races(user["token"], event["id"])
+    race_index = await RaceplansAdapter().get_race_order_index(
+        user["token"], event["id"]
+    )
     if heat == 0:
-        for race in races:
-            if time_now < race["start_time"]:
-                valgt_runde.klasse = race["raceclass"]
-                valgt_runde.runde = race["round"]
-
-                break
+        time_now = EventsAdapter().get_local_time(event, "log")
+        race = race_index.get_next_race_on_start(time_now)
     else:
-        for race in races:
-            if heat == race["order"]:
-                valgt_runde.klasse = race["raceclass"]
-                valgt_runde.runde = race["round"]
-                break
+        race = race_index.get_race(heat)
+    if race:
+        valgt_runde.klasse = race["raceclass"]
+        valgt_runde.runde = race["round"]
     return valgt_runde
 
 
@@ -114,7 +114,7 @@ async def create_event(user: dict, form: dict, action: str) -> str:
                 if dns_time_event["timing_point"] == "DNS":
                     # delete
                     await TimeEventsAdapter().delete_time_event(
-                        user["token"], dns_time_event["id"]
+                        user["token"], dns_time_event["id"], event_id
                     )
                     informasjon += " Slettet DNS registrering. "
 
@@ -128,13 +128,17 @@ async def create_event(user: dict, form: dict, action: str) -> str:
                 if time_event["race_id"] == form["race_id"]:
                     time_event_id = time_event["id"]
                     break
-        await TimeEventsAdapter().delete_time_event(user["token"], time_event_id)
+        await TimeEventsAdapter().delete_time_event(
+            user["token"], time_event_id, event_id
+        )
         informasjon = f" Nr {form['bib']} - {action} slettet. "
 
     # delete old entry if existing
     try:
         if form["old_id"]:
-            await TimeEventsAdapter().delete_time_event(user["token"], form["old_id"])
+            await TimeEventsAdapter().delete_time_event(
+                user["token"], form["old_id"], event_id
+            )
             informasjon += " Slettet gammel registrering."
     except Exception as e:
         logging.debug(f"Delete failed - ignoring {e}")
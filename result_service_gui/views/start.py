@@ -12,6 +12,7 @@ from result_service_gui.adapters import (
     RaceplansAdapter,
 )
 
+from .event_snapshot import get_event_snapshot
 from .utils import (
     check_login_open,
     get_display_style,
@@ -19,6 +20,7 @@ from .utils import (
     get_qualification_text,
     get_raceplan_summary,
     get_races_for_live_view,
+    get_races_from_next_on_start,
     get_startlist_with_logos,
 )
 
@@ -31,7 +33,11 @@ class Start(web.View):
         try:
             user = await check_login_open(self)
             event_id = self.request.rel_url.query["event_id"]
-            event = await get_event(user, event_id)
+            snapshot = await get_event_snapshot(event_id, user["token"])
+            if snapshot:
+                event = snapshot.get_event()
+            else:
+                event = await get_event(user, event_id)
 
             try:
                 informasjon = self.request.rel_url.query["informasjon"]
@@ -52,23 +58,31 @@ class Start(web.View):
             except Exception:
                 valgt_runde = ""
 
-            raceclasses = await RaceclassesAdapter().get_raceclasses(
-                user["token"], event_id
-            )
+            if snapshot:
+                raceclasses = snapshot.get_raceclasses()
+            else:
+                raceclasses = await RaceclassesAdapter().get_raceclasses(
+                    user["token"], event_id
+                )
             # get relevant races
             # get startlister for klasse
 
             if valgt_klasse == "now":
-                tmp_races = await RaceplansAdapter().get_all_races(
-                    user["token"], event_id
-                )
-                races = await get_races_for_live_view(user, event, tmp_races, 0, 9)
+                if snapshot:
+                    races = get_races_from_next_on_start(event, snapshot.get_races(), 9)
+                else:
+                    tmp_races = await RaceplansAdapter().get_all_races(
+                        user["token"], event_id
+                    )
+                    races = await get_races_for_live_view(user, event, tmp_races, 0, 9)
                 if len(races) > 6:
                     colseparators = [3, 6]
                     colclass = "w3-third"
                 elif len(races) > 3:
                     colseparators = [3]
                     colclass = "w3-half"
+            elif snapshot:
+                races = snapshot.get_races(valgt_klasse)
             elif valgt_klasse:
                 races = await RaceplansAdapter().get_races_by_racesclass(
                     user["token"], event_id, valgt_klasse
@@ -86,8 +100,9 @@ class Start(web.View):
                         race["display_color"] = get_display_style(
                             race["start_time"], event
                         )
-                        # get start list details
-                        race["startliste"] = get_startlist_with_logos(race)
+                        # get start list details, already in snapshot
+                        if "startliste" not in race:
+                            race["startliste"] = get_startlist_with_logos(race)
 
                     # filter on selected round
                     if valgt_runde:
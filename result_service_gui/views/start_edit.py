@@ -8,6 +8,7 @@ from aiohttp import web
 from result_service_gui.adapters import (
     RaceclassesAdapter,
     RaceplansAdapter,
+    TimeEventsAdapter,
 )
 
 from .utils import (
@@ -62,11 +63,23 @@ class StartEdit(web.View):
             except Exception:
                 action = ""
 
+            # get time events for all races in one call
+            time_events_by_race: dict[str, list] = {}
+            if all_races:
+                for time_event in await TimeEventsAdapter().get_time_events_by_event_id(
+                    user["token"], event_id
+                ):
+                    time_events_by_race.setdefault(
+                        time_event.get("race_id", ""), []
+                    ).append(time_event)
+
             # enrich data
             for race in all_races:
                 race["next_race"] = get_qualification_text(race)
                 # get start list detail
-                race["startliste"] = await get_enrichced_startlist(user, race)
+                race["startliste"] = await get_enrichced_startlist(
+                    user, race, time_events_by_race.get(race["id"], [])
+                )
                 next_races.append(race)
 
             if valgt_runde:
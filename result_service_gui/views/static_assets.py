@@ -0,0 +1,76 @@
+"""Module for fingerprinted urls to static assets."""
+
+import gzip
+import hashlib
+import logging
+import os
+from pathlib import Path
+from types import MappingProxyType
+
+from aiohttp import web
+
+STATIC_PRECOMPRESS = os.getenv("STATIC_PRECOMPRESS", "false") == "true"
+STATIC_IMMUTABLE_MAX_AGE_SECONDS = 365 * 24 * 3600
+PRECOMPRESSED_SUFFIXES = (".css", ".js", ".svg", ".json", ".html", ".txt")
+
+
+class StaticAssets:
+    """Immutable mapping from static file path to a hash of its content.
+
+    Loaded once at startup. Templates get fingerprinted urls from static_url,
+    with the hash as version parameter, so that browsers can cache assets
+    forever and still get a new url when a file is changed.
+    """
+
+    def __init__(self, url_prefix: str = "/static/") -> None:
+        """Initialize without assets - urls are not fingerprinted until load."""
+        self.url_prefix = url_prefix
+        self._versions: MappingProxyType[str, str] = MappingProxyType({})
+
+    def load(self, static_dir: Path, precompress: bool = False) -> None:
+        """Hash all files in static_dir, and write missing .gz files if set."""
+        versions = {}
+        for path in sorted(static_dir.rglob("*")):
+            if not path.is_file() or path.suffix == ".gz":
+                continue
+            content = path.read_bytes()
+            name = path.relative_to(static_dir).as_posix()
+            versions[name] = hashlib.blake2b(content, digest_size=6).hexdigest()
+            if precompress and path.suffix in PRECOMPRESSED_SUFFIXES:
+                write_gzip_file(path, content)
+        self._versions = MappingProxyType(versions)
+        logging.info(f"Fingerprinted {len(versions)} static assets in {static_dir}")
+
+    def static_url(self, name: str) -> str:
+        """Return url to static file - fingerprinted if the file is known."""
+        version = self._versions.get(name)
+        if version is None:
+            return f"{self.url_prefix}{name}"
+        return f"{self.url_prefix}{name}?v={version}"
+
+    def is_fingerprinted(self, request: web.BaseRequest) -> bool:
+        """Return true if request is for the current version of a static file."""
+        name = request.path.removeprefix(self.url_prefix)
+        version = request.rel_url.query.get("v")
+        return version is not None and self._versions.get(name) == version
+
+
+def write_gzip_file(path: Path, content: bytes) -> None:
+    """Write compressed copy next to file, served instead when accepted."""
+    gz_path = path.with_name(f"{path.name}.gz")
+    try:
+        if gz_path.exists() and gz_path.stat().st_mtime >= path.stat().st_mtime:
+            return
+        gz_path.write_bytes(gzip.compress(content, compresslevel=9, mtime=0))
+    except OSError:
+        logging.exception(f"Could not write precompressed {gz_path}")
+
+
+def get_static_cache_control(request: web.BaseRequest, max_age: int) -> str:
+    """Return Cache-Control for static file - immutable when fingerprinted."""
+    if static_assets.is_fingerprinted(request):
+        return f"public, max-age={STATIC_IMMUTABLE_MAX_AGE_SECONDS}, immutable"
+    return f"public, max-age={max_age}"
+
+
+static_assets = StaticAssets()
@@ -52,17 +52,17 @@ class TdReport(web.View):
                 {club_key(c["club"]) for c in all_contestants if c.get("club")}
             )
 
+            races_by_raceclass: dict[str, list] = {}
+            for race in await RaceplansAdapter().get_all_races_detailed(
+                user["token"], event_id
+            ):
+                races_by_raceclass.setdefault(race["raceclass"], []).append(race)
+
             raceclass_stats = []
             for raceclass in raceclasses:
                 dns_count = None
                 dnf_count = None
-                races = await RaceplansAdapter().get_races_by_racesclass(
-                    user["token"], event_id, raceclass["name"]
-                )
-                for race in races:
-                    race_details = await RaceplansAdapter().get_race_by_id(
-                        user["token"], race["id"]
-                    )
+                for race_details in races_by_raceclass.get(raceclass["name"], []):
                     results = race_details.get("results", {})
                     # DNS: registrert som egen timing_point i resultater
                     if results:
@@ -54,17 +54,12 @@ class Timing(web.View):
             )
             races = []
             if valgt_heat == 0:
-                # find race starting now
-                all_races = await RaceplansAdapter().get_all_races(
+                # find next race on start
+                race_index = await RaceplansAdapter().get_race_order_index(
                     user["token"], event_id
                 )
-                time_now = EventsAdapter().get_local_time(event, "HH:MM:SS")
-                # find next race on start
-                valgt_heat = 1
-                for tmp_race in all_races:
-                    if time_now < tmp_race["start_time"][-8:]:
-                        valgt_heat = tmp_race["order"]
-                        break
+                time_now = EventsAdapter().get_local_time(event, "log")
+                valgt_heat = race_index.get_next_race_on_start(time_now).get("order", 1)
             race = await RaceplansAdapter().get_race_by_order(
                 user["token"], event_id, valgt_heat
             )
@@ -2,6 +2,7 @@
 
 import datetime
 import logging
+from operator import itemgetter
 
 from aiohttp import web
 from aiohttp_session import get_session
@@ -14,6 +15,8 @@ from result_service_gui.adapters import (
     TimeEventsAdapter,
     UserAdapter,
 )
+from result_service_gui.adapters.http_client import gather_bounded
+from result_service_gui.adapters.raceplans_adapter import RaceOrderIndex
 from result_service_gui.services import (
     RaceclassResultsService,
 )
@@ -74,74 +77,123 @@ def get_startlist_with_logos(race: dict) -> list:
     """Enrich startlist information - including info if race result is registered."""
     startlist = []
     if race["start_entries"]:
+        club_logos = EventsAdapter().get_club_logo_urls(
+            start_entry["club"] for start_entry in race["start_entries"]
+        )
         for start_entry in race["start_entries"]:
-            start_entry["club_logo"] = EventsAdapter().get_club_logo_url(
-                start_entry["club"]
-            )
+            start_entry["club_logo"] = club_logos[start_entry["club"]]
             startlist.append(start_entry)
     return startlist
 
 
-async def get_enrichced_startlist(user: dict, race: dict) -> list:
-    """Enrich startlist information - including info if race result is registered."""
+def enrich_race_for_live(race: dict) -> None:
+    """Add finish results, qualification text and sorted start list to race."""
+    race["finish_results"] = RaceclassResultsService().get_finish_rank_for_race(
+        race, False
+    )
+    race["next_race"] = get_qualification_text(race)
+    # sort start list by starting position and append club_logo
+    if len(race["start_entries"]) > 1:
+        race["start_entries"] = sorted(
+            race["start_entries"], key=itemgetter("starting_position")
+        )
+        club_logos = EventsAdapter().get_club_logo_urls(
+            entry["club"] for entry in race["start_entries"]
+        )
+        for entry in race["start_entries"]:
+            entry["club_logo"] = club_logos[entry["club"]]
+
+
+async def get_enrichced_startlist(
+    user: dict, race: dict, time_events: list | None = None
+) -> list:
+    """Enrich startlist information - including info if race result is registered.
+
+    Time events for the race are fetched unless already given by the caller.
+    """
     startlist = []
-    i = 0
+    if not race["start_entries"]:
+        return startlist
     # get time-events registered
-    next_race_time_events = await TimeEventsAdapter().get_time_events_by_race_id(
-        user["token"], race["id"]
+    if time_events is None:
+        time_events = await TimeEventsAdapter().get_time_events_by_race_id(
+            user["token"], race["id"]
+        )
+    # one pass - last registered event wins, as when scanning all events
+    status_by_bib = {}
+    template_by_rank = {}
+    for time_event in time_events:
+        if time_event["timing_point"] == "Template":
+            template_by_rank[time_event["rank"]] = time_event
+        elif time_event["timing_point"] in ["Start", "DNS", "DNF"]:
+            status_by_bib[time_event["bib"]] = time_event
+
+    club_logos = EventsAdapter().get_club_logo_urls(
+        start_entry["club"] for start_entry in race["start_entries"]
     )
-    if race["start_entries"]:
-        for start_entry in race["start_entries"]:
-            start_entry["club_logo"] = EventsAdapter().get_club_logo_url(
-                start_entry["club"]
+    for i, start_entry in enumerate(race["start_entries"], start=1):
+        start_entry["club_logo"] = club_logos[start_entry["club"]]
+        # get next race info
+        template = template_by_rank.get(i)
+        if template:
+            next_race = template.get("next_race", "")
+            start_entry["next_race"] = (
+                "Ute" if next_race.startswith("Ute") else next_race
             )
-            i += 1
-            for time_event in next_race_time_events:
-                # get next race info
-                if time_event["timing_point"] == "Template":
-                    logging.debug(f"Time_event with error - {time_event}")
-                elif time_event["timing_point"] == "Template":
-                    if i == time_event["rank"]:
-                        if time_event["next_race"].startswith("Ute"):
-                            start_entry["next_race"] = "Ute"
-                        else:
-                            start_entry["next_race"] = time_event["next_race"]
-                # check if start, DNS or DNF is registered
-                elif time_event["timing_point"] in ["Start", "DNS", "DNF"]:
-                    if time_event["bib"] == start_entry["bib"]:
-                        start_entry["status"] = time_event["timing_point"]
-                        start_entry["status_id"] = time_event["id"]
-            startlist.append(start_entry)
+        # check if start, DNS or DNF is registered
+        status_event = status_by_bib.get(start_entry["bib"])
+        if status_event:
+            start_entry["status"] = status_event["timing_point"]
+            start_entry["status_id"] = status_event["id"]
+        startlist.append(start_entry)
     return startlist
 
 
-async def get_finish_timings(user: dict, race_id: str) -> list:
+async def get_finish_timings(
+    user: dict,
+    race_id: str,
+    race: dict | None = None,
+    time_events: list | None = None,
+) -> list:
     """Get finish events for race, Template event if no result is registered."""
-    finish_events = []
-    race = await RaceplansAdapter().get_race_by_id(user["token"], race_id)
+    if race is None:
+        race = await RaceplansAdapter().get_race_by_id(user["token"], race_id)
 
     # get time-events registered
-    time_events = await TimeEventsAdapter().get_time_events_by_race_id(
-        user["token"], race_id
-    )
+    if time_events is None:
+        time_events = await TimeEventsAdapter().get_time_events_by_race_id(
+            user["token"], race_id
+        )
+    return get_finish_timings_from_time_events(race, time_events)
+
+
+def get_finish_timings_from_time_events(race: dict, time_events: list) -> list:
+    """Return finish events in rank order, filled with Template or dummy events.
+
+    Ranks are filled from 1 to max number of contestants. A rank with more
+    than one finish event (same rank) fills the following missing ranks.
+    """
+    # bucket time events by rank in one pass, keep registration order
+    finish_events_by_rank: dict[int, list] = {}
+    template_by_rank: dict[int, dict] = {}
+    for time_event in time_events:
+        if time_event["timing_point"] == "Finish" and time_event["status"] == "OK":
+            finish_events_by_rank.setdefault(time_event["rank"], []).append(time_event)
+        elif time_event["timing_point"] == "Template":
+            template_by_rank.setdefault(time_event["rank"], time_event)
+
+    finish_events = []
     found_events = 0
     for i in range(1, race["max_no_of_contestants"] + 1):
-        for time_event in time_events:
-            if time_event["timing_point"] == "Finish" and time_event["status"] == "OK":
-                if i == time_event["rank"]:
-                    found_events += 1
-                    finish_events.append(time_event)
+        rank_events = finish_events_by_rank.get(i, [])
+        found_events += len(rank_events)
+        finish_events.extend(rank_events)
         if found_events == 0:
             if race["round"] == "F":
                 dummy_event = {"rank": i}
                 finish_events.append(dummy_event)
-            else:
-                for time_event in time_events:
-                    if (time_event["timing_point"] == "Template") and (
-                        i == time_event["rank"]
-                    ):
-                        finish_events.append(time_event)
-                        break
+            elif i in template_by_rank:
+                finish_events.append(template_by_rank[i])
         else:
             found_events = found_events - 1
     return finish_events
@@ -291,97 +343,146 @@ async def get_races_for_live_view(
     """Return races to display in live view."""
     filtered_racelist = []
     i = 0
-    time_now = EventsAdapter().get_local_time(event, "log")
     # find next race on start
     if valgt_heat == 0:
-        for race in races:
-            if time_now < race["start_time"]:
-                valgt_heat = race["order"]
-                break
-        else:
-            if valgt_heat == 0:
-                # all races have already started
-                valgt_heat = len(races) + 1
+        race_index = await RaceplansAdapter().get_race_order_index(
+            user["token"], event["id"]
+        )
+        time_now = EventsAdapter().get_local_time(event, "log")
+        next_race = race_index.get_next_race_on_start(time_now)
+        # len(races) + 1 if all races have already started
+        valgt_heat = next_race.get("order", len(races) + 1)
 
     for race in races:
         # from heat number (order) if selected
         if (race["order"] >= valgt_heat) and (i < number_of_races):
-            race_detailed = await RaceplansAdapter().get_race_by_id(
-                user["token"], race["id"]
-            )
-            filtered_racelist.append(race_detailed)
+            filtered_racelist.append(race)
             i += 1
 
-    return filtered_racelist
+    # fetch race details concurrently, order is preserved
+    return await gather_bounded(
+        RaceplansAdapter().get_race_by_id(user["token"], race["id"])
+        for race in filtered_racelist
+    )
+
+
+def get_races_from_next_on_start(
+    event: dict, races: list, number_of_races: int
+) -> list:
+    """Return races from next race on start - races are already detailed."""
+    time_now = EventsAdapter().get_local_time(event, "log")
+    next_race = RaceOrderIndex.from_races(races).get_next_race_on_start(time_now)
+    # len(races) + 1 if all races have already started
+    valgt_heat = next_race.get("order", len(races) + 1)
+    return [race for race in races if race["order"] >= valgt_heat][:number_of_races]
 
 
 async def get_races_for_print(
     user: dict, _tmp_races: list, raceclasses: list, valgt_klasse: str, action: str
 ) -> list:
     """Get races with lists - formatted for print."""
-    races = []
-    for race in _tmp_races:
-        for raceclass in raceclasses:
-            if race["raceclass"] == raceclass["name"]:
-                if (race["raceclass"] == valgt_klasse) or (valgt_klasse == ""):
-                    race = await RaceplansAdapter().get_race_by_id(
-                        user["token"], race["id"]
-                    )
-                    race["next_race"] = get_qualification_text(race)
-                    race["start_time"] = race["start_time"][-8:]
-                    # get start list details
-                    if action == "live":
-                        race["list_type"] = "start"
-                        if race["results"]:
-                            if "Finish" in race["results"]:
-                                race["list_type"] = "result"
-                    else:
-                        race["list_type"] = action
-
-                    if race["list_type"] == "start":
-                        race["startliste"] = await get_enrichced_startlist(user, race)
-                    else:
-                        race["finish_results"] = (
-                            RaceclassResultsService().get_finish_rank_for_race(
-                                race, False
-                            )
-                        )
-                    races.append(race)
+    raceclass_names = {raceclass["name"] for raceclass in raceclasses}
+    selected_races = [
+        race
+        for race in _tmp_races
+        if race["raceclass"] in raceclass_names
+        and ((race["raceclass"] == valgt_klasse) or (valgt_klasse == ""))
+    ]
+    races = await get_races_detailed(user, selected_races, valgt_klasse)
+    start_races = []
+    for race in races:
+        format_race_for_print(race, action)
+        if race["list_type"] == "start":
+            start_races.append(race)
+    await add_enriched_startlists(user, start_races)
     return races
 
 
+def format_race_for_print(race: dict, action: str) -> None:
+    """Set list type of race, and add finish results unless it is a start list."""
+    race["next_race"] = get_qualification_text(race)
+    race["start_time"] = race["start_time"][-8:]
+    if action == "live":
+        race["list_type"] = "start"
+        if race["results"]:
+            if "Finish" in race["results"]:
+                race["list_type"] = "result"
+    else:
+        race["list_type"] = action
+
+    if race["list_type"] != "start":
+        race["finish_results"] = RaceclassResultsService().get_finish_rank_for_race(
+            race, False
+        )
+
+
 async def get_races_for_round_result(
     user: dict, _tmp_races: list, valgt_runde: str, valgt_klasse: str, action: str
 ) -> list:
     """Get races for a given round - formatted for print."""
     races = []
+    start_races = []
     next_round = []
     if valgt_runde == "Q":
         next_round = ["S", "F"]
     elif valgt_runde == "S":
         next_round = ["F"]
 
-    for race in _tmp_races:
-        if race["raceclass"] == valgt_klasse:
-            race = await RaceplansAdapter().get_race_by_id(user["token"], race["id"])
-            race["start_time"] = race["start_time"][-8:]
-            if valgt_runde in ["", race["round"]]:
-                if action.count("result") > 0:
-                    race["next_race"] = get_qualification_text(race)
-                    race["list_type"] = "result"
-                    race["finish_results"] = (
-                        RaceclassResultsService().get_finish_rank_for_race(race, False)
-                    )
-                    races.append(race)
-            elif race["round"] in next_round:
-                if action.count("start") > 0:
-                    race["next_race"] = get_qualification_text(race)
-                    race["list_type"] = "start"
-                    race["startliste"] = await get_enrichced_startlist(user, race)
-                    races.append(race)
+    detailed_races = await get_races_detailed(
+        user,
+        [race for race in _tmp_races if race["raceclass"] == valgt_klasse],
+        valgt_klasse,
+    )
+    for race in detailed_races:
+        race["start_time"] = race["start_time"][-8:]
+        if valgt_runde in ["", race["round"]]:
+            if action.count("result") > 0:
+                race["next_race"] = get_qualification_text(race)
+                race["list_type"] = "result"
+                race["finish_results"] = (
+                    RaceclassResultsService().get_finish_rank_for_race(race, False)
+                )
+                races.append(race)
+        elif race["round"] in next_round:
+            if action.count("start") > 0:
+                race["next_race"] = get_qualification_text(race)
+                race["list_type"] = "start"
+                start_races.append(race)
+                races.append(race)
+    await add_enriched_startlists(user, start_races)
     return races
 
 
+async def get_races_detailed(user: dict, races: list, raceclass: str = "") -> list:
+    """Return the given races with details, in the same order.
+
+    Details are read from the bulk list for the event (or raceclass), races not
+    found there are fetched one by one.
+    """
+    if not races:
+        return []
+    races_detailed = await RaceplansAdapter().get_all_races_detailed(
+        user["token"], races[0]["event_id"], raceclass
+    )
+    race_by_id = {race["id"]: race for race in races_detailed}
+    missing_races = [race for race in races if race["id"] not in race_by_id]
+    for race in await gather_bounded(
+        RaceplansAdapter().get_race_by_id(user["token"], race["id"])
+        for race in missing_races
+    ):
+        race_by_id[race["id"]] = race
+    return [race_by_id[race["id"]] for race in races]
+
+
+async def add_enriched_startlists(user: dict, races: list) -> None:
+    """Add enriched start list to each race, fetched concurrently."""
+    startlists = await gather_bounded(
+        get_enrichced_startlist(user, race) for race in races
+    )
+    for race, startliste in zip(races, startlists, strict=True):
+        race["startliste"] = startliste
+
+
 async def create_start(user: dict, form: dict) -> str:
     """Extract form data and create one start."""
     bib = int(form["bib"])
@@ -505,11 +606,14 @@ async def get_race_kpis(
     all_races = await RaceplansAdapter().get_all_races(token, event["id"])
     raceplan_summary = get_raceplan_summary(all_races, raceclasses)
 
+    # race lists carry start entries and results - no need for race details
+    races_by_raceclass: dict[str, list] = {}
+    for race in all_races:
+        races_by_raceclass.setdefault(race["raceclass"], []).append(race)
+
     # enrich with race details
     for raceclass in raceplan_summary:
-        races = await RaceplansAdapter().get_races_by_racesclass(
-            token, event["id"], raceclass["name"]
-        )
+        races = races_by_raceclass.get(raceclass["name"], [])
         races_q = []
         races_s = []
         races_f = []
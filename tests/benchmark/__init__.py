@@ -0,0 +1,10 @@
+"""Benchmark test package.
+
+Modules:
+    event_generator
+    fake_services
+    harness
+    test_benchmark
+    test_event_generator
+    test_helpers_benchmark
+"""
@@ -0,0 +1,808 @@
+"""Generator of realistic sprint events, used to seed the fake backend services.
+
+Events are scaled from a kids' cup to a national cup with more than 3000
+racers. Clubs match the keys of the club logos, raceplans follow the
+qualification rules of individual sprint, and races that started before now
+have results, time events and photos. Write an event to a JSON fixture with:
+
+    uv run python -m tests.benchmark.event_generator national -o national.json
+"""
+
+import argparse
+import datetime
+import json
+import math
+import random
+import uuid
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from result_service_gui.services.time_events_service import get_next_start_entry
+
+TIME_ZONE = "Europe/Oslo"
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+MAX_IN_RACE = 10
+MAX_IN_FINAL = 8
+MAX_IN_SEMI_FINAL_A = 16
+DNS_RATE = 0.03
+DNF_RATE = 0.01
+# first 4 characters match the keys in config/sports_clubs.json
+CLUBS = (
+    "Asker Skiklubb",
+    "Bærums Skiklub",
+    "Bækkelagets SK",
+    "Bjerke IL",
+    "Birkebeineren Skilag",
+    "Brandbu IF",
+    "Bygdø IL",
+    "Dikemark IL",
+    "Driv IL",
+    "Drøbak-Frogn IL",
+    "Eidsvold IF",
+    "Eiker Skiklubb",
+    "Fet IL",
+    "Frogner IL",
+    "Fossum IF",
+    "Gjelleråsen IF",
+    "Gjerdrum IL",
+    "Gui Sportsklubb",
+    "Gulset IL",
+    "Hakadal IL",
+    "Haslum IL",
+    "Heming IL",
+    "Holmen IF",
+    "Høybråten og Stovner IL",
+    "IL Jardar",
+    "Ivrig IL",
+    "Jevnaker IF",
+    "Jutul IL",
+    "Kjelsås IL",
+    "Koll IL",
+    "Konnerud IL",
+    "Lier IL",
+    "Lillomarka Skiklubb",
+    "Lommedalens IL",
+    "Lyn Ski",
+    "Lørenskog Skiklubb",
+    "Mjøndalen IF",
+    "Nes Ski",
+    "Nesodden IF",
+    "Nittedal IL",
+    "Njård",
+    "Nydalens SK",
+    "Oppegård IL",
+    "Ready",
+    "Rustad IL",
+    "Rælingen Skiklubb",
+    "Røa IL",
+    "Skedsmo Skiklubb",
+    "Sørkedalens IF",
+    "Try IL",
+    "Ullensaker Skiklubb",
+    "Vestre Aker Skiklub",
+    "Årvoll IL",
+    "Ås IL",
+)
+REGIONS = ("Oslo", "Akershus", "Buskerud", "Innlandet", "Vestfold", "Østfold")
+FIRST_NAMES_BOYS = (
+    "Aksel",
+    "Elias",
+    "Emil",
+    "Filip",
+    "Henrik",
+    "Håkon",
+    "Isak",
+    "Jakob",
+    "Johannes",
+    "Kasper",
+    "Lucas",
+    "Magnus",
+    "Mathias",
+    "Noah",
+    "Oliver",
+    "Oskar",
+    "Sander",
+    "Sindre",
+    "Theodor",
+    "Vetle",
+)
+FIRST_NAMES_GIRLS = (
+    "Astrid",
+    "Ella",
+    "Emilie",
+    "Emma",
+    "Frida",
+    "Hedda",
+    "Ida",
+    "Ingrid",
+    "Kaja",
+    "Maja",
+    "Marte",
+    "Nora",
+    "Olivia",
+    "Sara",
+    "Selma",
+    "Silje",
+    "Sofie",
+    "Thea",
+    "Tiril",
+    "Vilde",
+)
+LAST_NAMES = (
+    "Andersen",
+    "Bakken",
+    "Berg",
+    "Dahl",
+    "Eriksen",
+    "Hagen",
+    "Halvorsen",
+    "Hansen",
+    "Haugen",
+    "Jensen",
+    "Johansen",
+    "Karlsen",
+    "Kristiansen",
+    "Larsen",
+    "Lund",
+    "Moen",
+    "Nilsen",
+    "Olsen",
+    "Pedersen",
+    "Solberg",
+    "Strand",
+    "Ødegård",
+)
+
+
+@dataclass(frozen=True)
+class EventScale:
+    """Size and schedule of a generated event."""
+
+    name: str
+    ages: tuple[int, ...]
+    contestants: int
+    seniors: bool = False
+    ranked_from_age: int = 11
+    seconds_between_heats: int = 120
+    seconds_between_rounds: int = 300
+    seconds_between_groups: int = 600
+
+
+SCALES = {
+    "kids_cup": EventScale("Barnas sprintcup", tuple(range(8, 13)), 120),
+    "regional": EventScale(
+        "Kretsmesterskap sprint",
+        tuple(range(11, 17)),
+        600,
+        seconds_between_heats=90,
+    ),
+    "national": EventScale(
+        "Norgescup sprint",
+        tuple(range(13, 17)),
+        3200,
+        seniors=True,
+        seconds_between_heats=60,
+        seconds_between_rounds=180,
+        seconds_between_groups=300,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class RoundConfig:
+    """Heats and qualification rule for one round of a raceclass."""
+
+    round: str
+    index: str
+    heats: int
+    rule: dict
+
+
+@dataclass
+class EventData:
+    """All backend data for one event, as returned by the services."""
+
+    event: dict
+    raceclasses: list[dict]
+    contestants: list[dict]
+    races: list[dict]
+    time_events: list[dict]
+    photos: list[dict]
+    raceclass_results: list[dict]
+
+    @cached_property
+    def race_by_id(self) -> dict[str, dict]:
+        """Return races by id."""
+        return {race["id"]: race for race in self.races}
+
+    @cached_property
+    def time_events_by_race_id(self) -> dict[str, list[dict]]:
+        """Return time events by race id, in registration order."""
+        time_events: dict[str, list[dict]] = {}
+        for time_event in self.time_events:
+            time_events.setdefault(time_event["race_id"], []).append(time_event)
+        return time_events
+
+    def get_race(self, race_id: str) -> dict:
+        """Return race with start entries and results, empty if not found."""
+        return self.race_by_id.get(race_id, {})
+
+    def get_startlist(self) -> dict:
+        """Return the start list for the event, with all start entries."""
+        start_entries = [
+            entry for race in self.races for entry in race["start_entries"]
+        ]
+        return {
+            "id": f"{self.event['id']}-startlist",
+            "event_id": self.event["id"],
+            "no_of_contestants": len(self.contestants),
+            "start_entries": start_entries,
+        }
+
+    def get_raceplan(self) -> dict:
+        """Return the raceplan for the event."""
+        return {
+            "id": f"{self.event['id']}-raceplan",
+            "event_id": self.event["id"],
+            "no_of_contestants": len(self.contestants),
+            "races": [race["id"] for race in self.races],
+        }
+
+
+def write_fixture(data: EventData, path: Path) -> None:
+    """Write event data to JSON fixture."""
+    path.write_text(json.dumps(asdict(data), ensure_ascii=False, indent=1))
+
+
+def read_fixture(path: Path) -> EventData:
+    """Read event data from JSON fixture."""
+    return EventData(**json.loads(path.read_text()))
+
+
+def get_race_config(no_of_contestants: int, ranked: bool) -> list[RoundConfig]:
+    """Return rounds for a raceclass, depending on the number of contestants.
+
+    Unranked raceclasses run two rounds where all contestants race twice.
+    Ranked raceclasses run quarterfinals, semifinals A and C if more than two
+    heats, and finals A, B and C.
+    """
+    heats = math.ceil(no_of_contestants / MAX_IN_RACE)
+    if not ranked:
+        return [RoundConfig("R1", "", heats, {}), RoundConfig("R2", "", heats, {})]
+    if heats == 1:
+        return [
+            RoundConfig("Q", "", 1, {"F": {"A": "ALL"}}),
+            RoundConfig("F", "A", 1, {}),
+        ]
+    if heats == 2:
+        per_final = MAX_IN_FINAL // heats
+        rounds = [
+            RoundConfig("Q", "", 2, {"F": {"A": per_final, "B": per_final}}),
+            RoundConfig("F", "A", 1, {}),
+            RoundConfig("F", "B", 1, {}),
+        ]
+        if no_of_contestants > 2 * MAX_IN_FINAL:
+            rounds[0].rule["F"]["C"] = "REST"
+            rounds.append(RoundConfig("F", "C", 1, {}))
+        return rounds
+
+    to_semi_a = math.ceil(MAX_IN_SEMI_FINAL_A / heats)
+    semi_a_heats = math.ceil(to_semi_a * heats / MAX_IN_RACE)
+    rest = no_of_contestants - to_semi_a * heats
+    if rest <= 2 * MAX_IN_RACE:
+        to_semi_c: int | str = "REST"
+        semi_c_heats = math.ceil(rest / MAX_IN_RACE)
+    else:
+        to_semi_c = max(MAX_IN_SEMI_FINAL_A // heats, 1)
+        semi_c_heats = math.ceil(to_semi_c * heats / MAX_IN_RACE)
+    to_final = math.ceil(MAX_IN_FINAL / semi_a_heats)
+    rounds = [
+        RoundConfig("Q", "", heats, {"S": {"A": to_semi_a, "C": to_semi_c}}),
+        RoundConfig("S", "A", semi_a_heats, {"F": {"A": to_final, "B": to_final}}),
+        RoundConfig(
+            "S", "C", semi_c_heats, {"F": {"C": math.ceil(MAX_IN_FINAL / semi_c_heats)}}
+        ),
+        RoundConfig("F", "A", 1, {}),
+        RoundConfig("F", "B", 1, {}),
+        RoundConfig("F", "C", 1, {}),
+    ]
+    if semi_c_heats == 0:
+        del rounds[0].rule["S"]["C"]
+        rounds = [r for r in rounds if f"{r.round}{r.index}" not in ("SC", "FC")]
+    return rounds
+
+
+class EventGenerator:
+    """Generate one event - random, but the same for the same seed."""
+
+    def __init__(self, scale: EventScale, seed: int, now: datetime.datetime) -> None:
+        """Initialize generator for event happening now."""
+        self.scale = scale
+        self.rnd = random.Random(seed)
+        self.now = now.strftime(TIME_FORMAT)
+        self.event_id = self.new_id()
+        self.data = EventData(
+            event={
+                "id": self.event_id,
+                "name": scale.name,
+                "competition_format": "Individual Sprint",
+                "date_of_event": now.strftime("%Y-%m-%d"),
+                "time_of_event": "",
+                "timezone": TIME_ZONE,
+                "organiser": self.rnd.choice(CLUBS),
+                "webpage": "",
+                "information": "",
+            },
+            raceclasses=[],
+            contestants=[],
+            races=[],
+            time_events=[],
+            photos=[],
+            raceclass_results=[],
+        )
+        # race ability pr bib, decides the finish order
+        self.ability: dict[int, float] = {}
+
+    def new_id(self) -> str:
+        """Return a new uuid, from the seeded random generator."""
+        return str(uuid.UUID(int=self.rnd.getrandbits(128), version=4))
+
+    def generate(self, progress: float) -> EventData:
+        """Generate event where progress (0 to 1) of the raceplan is started."""
+        self.add_raceclasses_and_contestants()
+        self.add_races()
+        self.schedule_races(progress)
+        races_by_raceclass: dict[str, list[dict]] = {}
+        for race in self.data.races:
+            races_by_raceclass.setdefault(race["raceclass"], []).append(race)
+
+        for race in self.data.races:
+            if race["start_entries"] and race["start_time"] <= self.now:
+                self.add_results(race)
+                self.add_photos(race)
+                self.add_next_round_start_entries(
+                    race, races_by_raceclass[race["raceclass"]]
+                )
+        for races in races_by_raceclass.values():
+            for race in races:
+                if race["round"] in ["Q", "S"]:
+                    self.add_templates(race, races)
+            self.add_raceclass_result(races)
+        self.data.event["time_of_event"] = self.data.races[0]["start_time"][-8:]
+        return self.data
+
+    def add_raceclasses_and_contestants(self) -> None:
+        """Add raceclasses pr age and gender, with contestants drawn in order."""
+        classes = [(gender, age) for age in self.scale.ages for gender in "GJ"]
+        if self.scale.seniors:
+            classes += [("G", 19), ("J", 19), ("M", 21), ("K", 21)]
+        weights = [self.rnd.uniform(0.5, 1.5) for _ in classes]
+        club_weights = [1 / (i + 1) ** 0.7 for i in range(len(CLUBS))]
+        bib = 1
+        for order, ((gender, age), weight) in enumerate(
+            zip(classes, weights, strict=True), start=1
+        ):
+            name, ageclass = get_raceclass_name(gender, age)
+            no_of_contestants = max(
+                round(self.scale.contestants * weight / sum(weights)), 1
+            )
+            self.data.raceclasses.append(
+                {
+                    "id": self.new_id(),
+                    "event_id": self.event_id,
+                    "name": name,
+                    "ageclasses": [ageclass],
+                    "group": (order + 1) // 2,
+                    "order": order,
+                    "no_of_contestants": no_of_contestants,
+                    "ranking": age >= self.scale.ranked_from_age,
+                    "seeding": False,
+                    "distance": "",
+                }
+            )
+            for _ in range(no_of_contestants):
+                club = self.rnd.choices(CLUBS, club_weights)[0]
+                self.data.contestants.append(
+                    self.new_contestant(bib, gender, age, ageclass, club)
+                )
+                self.ability[bib] = self.rnd.gauss(0, 1)
+                bib += 1
+
+    def new_contestant(
+        self, bib: int, gender: str, age: int, ageclass: str, club: str
+    ) -> dict:
+        """Return contestant with random name, born in the year of age."""
+        female = gender in ["J", "K"]
+        year = int(self.data.event["date_of_event"][:4]) - age
+        return {
+            "id": self.new_id(),
+            "event_id": self.event_id,
+            "bib": bib,
+            "first_name": self.rnd.choice(
+                FIRST_NAMES_GIRLS if female else FIRST_NAMES_BOYS
+            ),
+            "last_name": self.rnd.choice(LAST_NAMES),
+            "birth_date": f"{year}-{self.rnd.randint(1, 12):02}-{self.rnd.randint(1, 28):02}",
+            "gender": "K" if female else "M",
+            "ageclass": ageclass,
+            "club": club,
+            "team": "",
+            "region": self.rnd.choice(REGIONS),
+            "email": "",
+            "minidrett_id": str(self.rnd.randint(1000000, 9999999)),
+            "seeding_points": None,
+            "registration_date_time": f"{year + age}-01-0{self.rnd.randint(1, 9)}T12:00:00",
+        }
+
+    def add_races(self) -> None:
+        """Add races pr raceclass and round, and draw start in first round."""
+        for raceclass in self.data.raceclasses:
+            rounds = get_race_config(
+                raceclass["no_of_contestants"], raceclass["ranking"]
+            )
+            for round_config in rounds:
+                for heat in range(1, round_config.heats + 1):
+                    self.data.races.append(self.new_race(raceclass, round_config, heat))
+            first_round = [
+                race
+                for race in self.data.races
+                if race["raceclass"] == raceclass["name"]
+                and race["round"] == rounds[0].round
+            ]
+            contestants = [
+                contestant
+                for contestant in self.data.contestants
+                if contestant["ageclass"] == raceclass["ageclasses"][0]
+            ]
+            self.rnd.shuffle(contestants)
+            for i, contestant in enumerate(contestants):
+                race = first_round[i % len(first_round)]
+                add_start_entry(
+                    race, contestant, i // len(first_round) + 1, self.new_id()
+                )
+
+    def new_race(self, raceclass: dict, round_config: RoundConfig, heat: int) -> dict:
+        """Return race without start time, start entries and results."""
+        return {
+            "id": self.new_id(),
+            "event_id": self.event_id,
+            "raceclass": raceclass["name"],
+            "order": 0,
+            "start_time": "",
+            "no_of_contestants": 0,
+            "max_no_of_contestants": MAX_IN_RACE,
+            "raceplan_id": f"{self.event_id}-raceplan",
+            "round": round_config.round,
+            "index": round_config.index,
+            "heat": heat,
+            "rule": round_config.rule,
+            "datatype": "individual_sprint",
+            "start_entries": [],
+            "results": {},
+        }
+
+    def schedule_races(self, progress: float) -> None:
+        """Order races by group, round and raceclass, and set start times.
+
+        Start times are set so that progress of the raceplan is before now.
+        """
+        group_by_raceclass = {rc["name"]: rc["group"] for rc in self.data.raceclasses}
+        order_by_raceclass = {rc["name"]: rc["order"] for rc in self.data.raceclasses}
+        stages = {"Q": 0, "R1": 0, "S": 1, "F": 2, "R2": 2}
+        self.data.races.sort(
+            key=lambda race: (
+                group_by_raceclass[race["raceclass"]],
+                stages[race["round"]],
+                order_by_raceclass[race["raceclass"]],
+                race["index"],
+                race["heat"],
+            )
+        )
+        offsets = []
+        offset = 0
+        previous: dict = {}
+        for race in self.data.races:
+            if not previous:
+                pass
+            elif (
+                group_by_raceclass[race["raceclass"]]
+                != (group_by_raceclass[previous["raceclass"]])
+            ):
+                offset += self.scale.seconds_between_groups
+            elif stages[race["round"]] != stages[previous["round"]]:
+                offset += self.scale.seconds_between_rounds
+            else:
+                offset += self.scale.seconds_between_heats
+            offsets.append(offset)
+            previous = race
+        now = datetime.datetime.strptime(self.now, TIME_FORMAT)
+        first_start = now - datetime.timedelta(seconds=round(offset * progress))
+        for order, (race, race_offset) in enumerate(
+            zip(self.data.races, offsets, strict=True), start=1
+        ):
+            race["order"] = order
+            race["start_time"] = (
+                first_start + datetime.timedelta(seconds=race_offset)
+            ).strftime(TIME_FORMAT)
+            for entry in race["start_entries"]:
+                entry["scheduled_start_time"] = race["start_time"]
+
+    def add_results(self, race: dict) -> None:
+        """Register DNS, DNF and finish by ability, with time events."""
+        start_time = datetime.datetime.strptime(race["start_time"], TIME_FORMAT)
+        finishers = []
+        results: dict[str, list[dict]] = {"Finish": [], "DNS": [], "DNF": []}
+        for entry in race["start_entries"]:
+            draw = self.rnd.random()
+            if draw < DNS_RATE:
+                results["DNS"].append(self.new_time_event(race, "DNS", None, entry))
+            elif draw < DNS_RATE + DNF_RATE:
+                results["DNF"].append(self.new_time_event(race, "DNF", None, entry))
+            else:
+                finishers.append(entry)
+        finishers.sort(
+            key=lambda entry: self.ability[entry["bib"]] + self.rnd.gauss(0, 0.5)
+        )
+        finish_time = start_time + datetime.timedelta(seconds=self.rnd.uniform(30, 40))
+        for rank, entry in enumerate(finishers, start=1):
+            finish_time += datetime.timedelta(seconds=self.rnd.uniform(0.1, 1.5))
+            time_event = self.new_time_event(race, "Finish", rank, entry)
+            time_event["registration_time"] = finish_time.strftime(TIME_FORMAT)
+            results["Finish"].append(time_event)
+        self.data.time_events.extend(results["DNS"] + results["DNF"])
+        self.data.time_events.extend(results["Finish"])
+        race["results"] = {
+            timing_point: {
+                "id": self.new_id(),
+                "race_id": race["id"],
+                "timing_point": timing_point,
+                "no_of_contestants": len(ranking_sequence),
+                "ranking_sequence": ranking_sequence,
+                "status": 1,
+            }
+            for timing_point, ranking_sequence in results.items()
+            if ranking_sequence
+        }
+
+    def add_photos(self, race: dict) -> None:
+        """Add start photo, and finish photos of 1 to 3 contestants each."""
+        finish = race["results"].get("Finish", {}).get("ranking_sequence", [])
+        dns = race["results"].get("DNS", {}).get("ranking_sequence", [])
+        not_started = {time_event["bib"] for time_event in dns}
+        starters = [
+            entry["bib"]
+            for entry in race["start_entries"]
+            if entry["bib"] not in not_started
+        ]
+        photos = [(race["start_time"], starters, False)]
+        i = 0
+        while i < len(finish):
+            group = finish[i : i + self.rnd.randint(1, 3)]
+            photos.append(
+                (group[0]["registration_time"], [e["bib"] for e in group], True)
+            )
+            i += len(group)
+        clubs = {entry["bib"]: entry["club"] for entry in race["start_entries"]}
+        for creation_time, biblist, is_photo_finish in photos:
+            taken = datetime.datetime.strptime(creation_time, TIME_FORMAT)
+            name = (
+                f"{'Finish' if is_photo_finish else 'Start'}_"
+                f"{taken:%Y%m%d_%H%M%S}_{race['raceclass']}.jpg"
+            )
+            self.data.photos.append(
+                {
+                    "id": self.new_id(),
+                    "event_id": self.event_id,
+                    "race_id": race["id"],
+                    "raceclass": race["raceclass"],
+                    "name": name,
+                    "g_base_url": f"https://storage.googleapis.com/langrenn-sprint/{name}",
+                    "g_product_url": "",
+                    "creation_time": creation_time,
+                    "biblist": biblist,
+                    "clublist": sorted({clubs[bib] for bib in biblist}),
+                    "confidence": self.rnd.randint(60, 99),
+                    "is_photo_finish": is_photo_finish,
+                    "is_start_registration": not is_photo_finish,
+                    "starred": False,
+                    "ai_information": {},
+                }
+            )
+
+    def add_next_round_start_entries(self, race: dict, races: list[dict]) -> None:
+        """Add start entries to next round, when all heats in round have results.
+
+        Next race pr rank is found by the same rules as the time events service.
+        """
+        heats = [
+            r
+            for r in races
+            if (r["round"], r["index"]) == (race["round"], race["index"])
+        ]
+        if not all(r["results"] for r in heats) or race["round"] in ["F", "R2"]:
+            return
+        contestants = {c["bib"]: c for c in self.data.contestants}
+        race_by_id = {r["id"]: r for r in races}
+        for heat in heats:
+            finish = heat["results"].get("Finish", {}).get("ranking_sequence", [])
+            for time_event in finish:
+                if heat["round"] == "R1":
+                    next_race = get_second_round_race(heat, time_event, races)
+                    position = len(next_race["start_entries"]) + 1
+                else:
+                    start_entry = get_next_start_entry(
+                        {k: time_event[k] for k in ["race_id", "rank", "bib"]}, races
+                    )
+                    next_race = race_by_id.get(start_entry.get("race_id", ""), {})
+                    position = start_entry.get("starting_position", 0)
+                if next_race:
+                    time_event["next_race"] = get_race_round(next_race)
+                    time_event["next_race_id"] = next_race["id"]
+                    time_event["next_race_position"] = position
+                    add_start_entry(
+                        next_race,
+                        contestants[time_event["bib"]],
+                        position,
+                        self.new_id(),
+                    )
+                else:
+                    time_event["next_race"] = "Ute"
+        for r in races:
+            r["start_entries"].sort(key=lambda entry: entry["starting_position"])
+
+    def add_templates(self, race: dict, races: list[dict]) -> None:
+        """Add Template time events for qualified ranks, as the service does."""
+        for rank in range(1, race["max_no_of_contestants"] + 1):
+            start_entry = get_next_start_entry(
+                {"race_id": race["id"], "rank": rank, "bib": 0}, races
+            )
+            if start_entry:
+                time_event = self.new_time_event(race, "Template", rank, None)
+                time_event["next_race"] = start_entry["race_round"]
+                time_event["next_race_id"] = start_entry["race_id"]
+                time_event["next_race_position"] = start_entry["starting_position"]
+                self.data.time_events.append(time_event)
+
+    def add_raceclass_result(self, races: list[dict]) -> None:
+        """Publish result for ranked raceclass when all races have results.
+
+        Finals are ranked A, B, C, then contestants out of semifinals and
+        quarterfinals by rank in heat.
+        """
+        if races[0]["round"] == "R1" or not all(race["results"] for race in races):
+            return
+        ranking_sequence = []
+        ranked_bibs = set()
+        round_order = {"F": 0, "S": 1, "Q": 2}
+        for race in sorted(
+            races,
+            key=lambda r: (round_order[r["round"]], r["index"], 0),
+        ):
+            finish = race["results"].get("Finish", {}).get("ranking_sequence", [])
+            for time_event in sorted(finish, key=lambda e: e["rank"]):
+                if time_event["bib"] in ranked_bibs:
+                    continue
+                ranked_bibs.add(time_event["bib"])
+                ranking_sequence.append(
+                    {
+                        "rank": len(ranking_sequence) + 1,
+                        "bib": time_event["bib"],
+                        "name": time_event["name"],
+                        "club": time_event["club"],
+                        "ageclass": race["raceclass"],
+                        "round": f"{race['round']}{race['index']}",
+                        "time": time_event["registration_time"],
+                        "minidrett_id": "",
+                    }
+                )
+        self.data.raceclass_results.append(
+            {
+                "id": self.new_id(),
+                "event_id": self.event_id,
+                "raceclass": races[0]["raceclass"],
+                "timestamp": races[-1]["start_time"],
+                "ranking_sequence": ranking_sequence,
+            }
+        )
+
+    def new_time_event(
+        self, race: dict, timing_point: str, rank: int | None, entry: dict | None
+    ) -> dict:
+        """Return time event for race, for start entry if given."""
+        return {
+            "id": self.new_id(),
+            "event_id": self.event_id,
+            "race_id": race["id"],
+            "race": f"{race['raceclass']}-{race['round']}{race['index']}{race['heat']}",
+            "timing_point": timing_point,
+            "rank": rank,
+            "bib": entry["bib"] if entry else 0,
+            "name": entry["name"] if entry else "",
+            "club": entry["club"] if entry else "",
+            "registration_time": race["start_time"],
+            "next_race": "",
+            "next_race_id": "",
+            "next_race_position": 0,
+            "status": "OK",
+            "changelog": [],
+        }
+
+
+def get_raceclass_name(gender: str, age: int) -> tuple[str, str]:
+    """Return raceclass name and ageclass, e.g. G12 and G 12 år."""
+    if gender in ["M", "K"]:
+        return f"{gender}S", f"{'Menn' if gender == 'M' else 'Kvinner'} senior"
+    if age > 16:
+        return f"{gender}17-20", f"{'Gutter' if gender == 'G' else 'Jenter'} 17-20 år"
+    return f"{gender}{age}", f"{gender} {age} år"
+
+
+def get_race_round(race: dict) -> str:
+    """Return round of race as shown in time events, e.g. SA2 or FA."""
+    if race["round"] == "F":
+        return f"{race['round']}{race['index']}"
+    return f"{race['round']}{race['index']}{race['heat']}"
+
+
+def get_second_round_race(race: dict, time_event: dict, races: list[dict]) -> dict:
+    """Return race in round 2 - all continue, mixed across heats by rank."""
+    second_round = [r for r in races if r["round"] == "R2"]
+    heat = (race["heat"] + time_event["rank"] - 2) % len(second_round)
+    return second_round[heat]
+
+
+def add_start_entry(race: dict, contestant: dict, position: int, entry_id: str) -> None:
+    """Add start entry for contestant to race."""
+    race["start_entries"].append(
+        {
+            "id": entry_id,
+            "race_id": race["id"],
+            "startlist_id": f"{race['event_id']}-startlist",
+            "bib": contestant["bib"],
+            "name": f"{contestant['first_name']} {contestant['last_name']}",
+            "club": contestant["club"],
+            "starting_position": position,
+            "scheduled_start_time": race["start_time"],
+            "status": "",
+            "changelog": [],
+        }
+    )
+    race["no_of_contestants"] = len(race["start_entries"])
+
+
+def generate_event(
+    scale: str | EventScale = "kids_cup",
+    seed: int = 1,
+    progress: float = 0.5,
+    now: datetime.datetime | None = None,
+) -> EventData:
+    """Generate event of the given scale, progress (0 to 1) of it started now."""
+    if isinstance(scale, str):
+        scale = SCALES[scale]
+    if now is None:
+        now = datetime.datetime.now(ZoneInfo(TIME_ZONE)).replace(tzinfo=None)
+    return EventGenerator(scale, seed, now).generate(progress)
+
+
+def main() -> None:
+    """Generate event and write it to JSON fixture."""
+    parser = argparse.ArgumentParser(description="Generate sprint event fixture.")
+    parser.add_argument("scale", choices=SCALES)
+    parser.add_argument("-o", "--output", type=Path, required=True)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--progress", type=float, default=0.5)
+    args = parser.parse_args()
+
+    data = generate_event(args.scale, args.seed, args.progress)
+    write_fixture(data, args.output)
+    print(
+        f"{args.output}: {len(data.raceclasses)} raceclasses, "
+        f"{len(data.contestants)} contestants, {len(data.races)} races, "
+        f"{len(data.time_events)} time events, {len(data.photos)} photos"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""In-process fakes of the backend services, seeded from generated event data."""
+
+import asyncio
+import importlib
+import pkgutil
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import result_service_gui.adapters
+from result_service_gui.adapters import request_stats
+
+from .event_generator import EventData
+
+# adapter module settings that point to each service
+SERVICE_URL_SETTINGS = {
+    "COMPETITION_FORMAT_SERVICE_URL": "competition-format-service",
+    "EVENT_SERVICE_URL": "event-service",
+    "PHOTO_SERVICE_URL": "photo-service",
+    "RACE_SERVICE_URL": "race-service",
+    "USER_SERVICE_URL": "user-service",
+}
+CONFIGS = {
+    "INTEGRATION_SERVICE_AVAILABLE": "False",
+    "INTEGRATION_SERVICE_RUNNING": "False",
+    "INTEGRATION_SERVICE_START": "False",
+    "VIDEO_STORAGE_MODE": "pull_detections",
+}
+COMPETITION_FORMAT = {
+    "id": "individual-sprint",
+    "name": "Individual Sprint",
+    "datatype": "individual_sprint",
+    "starting_order": "draw",
+    "start_procedure": "heat_start",
+    "time_between_groups": "00:10:00",
+    "time_between_rounds": "00:05:00",
+    "time_between_heats": "00:02:00",
+    "max_no_of_contestants_in_raceclass": 80,
+    "max_no_of_contestants_in_race": 10,
+}
+
+type Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class FakeServices:
+    """Backend services for one event, answering from memory.
+
+    Every call is counted pr service, and delayed by latency_seconds to
+    simulate the network and the database of the real services.
+    """
+
+    def __init__(self, data: EventData, latency_seconds: float = 0.0) -> None:
+        """Initialize services with event data."""
+        self.data = data
+        self.latency_seconds = latency_seconds
+        self.calls: Counter[str] = Counter()
+
+    def create_apps(self) -> dict[str, web.Application]:
+        """Return one app pr service."""
+        return {
+            "competition-format-service": self.create_competition_format_service(),
+            "event-service": self.create_event_service(),
+            "photo-service": self.create_photo_service(),
+            "race-service": self.create_race_service(),
+            "user-service": self.create_user_service(),
+        }
+
+    def create_app(self, service: str) -> web.Application:
+        """Return app that counts and delays calls to service."""
+
+        @web.middleware
+        async def count_calls(request: web.Request, handler: Handler) -> Any:
+            self.calls[service] += 1
+            if self.latency_seconds:
+                await asyncio.sleep(self.latency_seconds)
+            return await handler(request)
+
+        return web.Application(middlewares=[count_calls])
+
+    def create_competition_format_service(self) -> web.Application:
+        """Return fake competition-format-service."""
+        app = self.create_app("competition-format-service")
+        app.router.add_get("/competition-formats", json_handler([COMPETITION_FORMAT]))
+        app.router.add_get("/race-configs", json_handler([]))
+        return app
+
+    def create_event_service(self) -> web.Application:
+        """Return fake event-service."""
+        data = self.data
+
+        async def get_events(_request: web.Request) -> web.Response:
+            return web.json_response([data.event])
+
+        async def get_event(request: web.Request) -> web.Response:
+            if request.match_info["event_id"] != data.event["id"]:
+                return not_found("Event")
+            return web.json_response(data.event)
+
+        async def get_raceclasses(request: web.Request) -> web.Response:
+            name = request.query.get("name")
+            return web.json_response(
+                [rc for rc in data.raceclasses if name in (None, rc["name"])]
+            )
+
+        async def get_contestants(request: web.Request) -> web.Response:
+            raceclass = request.query.get("raceclass")
+            bib = request.query.get("bib")
+            return web.json_response(
+                [
+                    c
+                    for c in data.contestants
+                    if raceclass in (None, c["ageclass"])
+                    and bib in (None, str(c["bib"]))
+                ]
+            )
+
+        async def get_results(_request: web.Request) -> web.Response:
+            return web.json_response(data.raceclass_results)
+
+        async def get_result(request: web.Request) -> web.Response:
+            raceclass = request.match_info["raceclass"]
+            for result in data.raceclass_results:
+                if result["raceclass"] == raceclass:
+                    return web.json_response(result)
+            return not_found("Result")
+
+        app = self.create_app("event-service")
+        app.router.add_get("/events", get_events)
+        app.router.add_get("/events/{event_id}", get_event)
+        app.router.add_get("/events/{event_id}/raceclasses", get_raceclasses)
+        app.router.add_get("/events/{event_id}/contestants", get_contestants)
+        app.router.add_get("/events/{event_id}/results", get_results)
+        app.router.add_get("/events/{event_id}/results/{raceclass}", get_result)
+        return app
+
+    def create_photo_service(self) -> web.Application:
+        """Return fake photo-service."""
+        data = self.data
+
+        async def get_photos(request: web.Request) -> web.Response:
+            race_id = request.query.get("raceId")
+            raceclass = request.query.get("raceclass")
+            return web.json_response(
+                [
+                    photo
+                    for photo in data.photos
+                    if race_id in (None, photo["race_id"])
+                    and raceclass in (None, photo["raceclass"])
+                ]
+            )
+
+        async def get_photo(request: web.Request) -> web.Response:
+            for photo in data.photos:
+                if photo["id"] == request.match_info["photo_id"]:
+                    return web.json_response(photo)
+            return not_found("Photo")
+
+        async def get_config(request: web.Request) -> web.Response:
+            key = request.query["key"]
+            if key not in CONFIGS:
+                return not_found("Config")
+            return web.json_response(
+                {"event_id": data.event["id"], "key": key, "value": CONFIGS[key]}
+            )
+
+        async def get_configs(_request: web.Request) -> web.Response:
+            return web.json_response(
+                [
+                    {"event_id": data.event["id"], "key": key, "value": value}
+                    for key, value in CONFIGS.items()
+                ]
+            )
+
+        app = self.create_app("photo-service")
+        app.router.add_get("/photos", get_photos)
+        app.router.add_get("/photos/{photo_id}", get_photo)
+        app.router.add_get("/config", get_config)
+        app.router.add_get("/configs", get_configs)
+        app.router.add_get("/status", json_handler([]))
+        return app
+
+    def create_race_service(self) -> web.Application:
+        """Return fake race-service."""
+        data = self.data
+
+        async def get_races(request: web.Request) -> web.Response:
+            raceclass = request.query.get("raceclass")
+            return web.json_response(
+                [race for race in data.races if raceclass in (None, race["raceclass"])]
+            )
+
+        async def get_race(request: web.Request) -> web.Response:
+            race = data.get_race(request.match_info["race_id"])
+            if not race:
+                return not_found("Race")
+            return web.json_response(race)
+
+        async def get_raceplans(_request: web.Request) -> web.Response:
+            return web.json_response([data.get_raceplan()])
+
+        async def get_startlists(request: web.Request) -> web.Response:
+            startlist = data.get_startlist()
+            bib = request.query.get("bib")
+            if bib is not None:
+                startlist["start_entries"] = [
+                    entry
+                    for entry in startlist["start_entries"]
+                    if str(entry["bib"]) == bib
+                ]
+            return web.json_response([startlist])
+
+        async def get_time_events(request: web.Request) -> web.Response:
+            race_id = request.query.get("raceId")
+            timing_point = request.query.get("timingPoint")
+            bib = request.query.get("bib")
+            time_events = (
+                data.time_events
+                if race_id is None
+                else data.time_events_by_race_id.get(race_id, [])
+            )
+            return web.json_response(
+                [
+                    time_event
+                    for time_event in time_events
+                    if timing_point in (None, time_event["timing_point"])
+                    and bib in (None, str(time_event["bib"]))
+                ]
+            )
+
+        app = self.create_app("race-service")
+        app.router.add_get("/races", get_races)
+        app.router.add_get("/races/{race_id}", get_race)
+        app.router.add_get("/raceplans", get_raceplans)
+        app.router.add_get("/startlists", get_startlists)
+        app.router.add_get("/time-events", get_time_events)
+        return app
+
+    def create_user_service(self) -> web.Application:
+        """Return fake user-service - any username and password is accepted."""
+
+        async def login(_request: web.Request) -> web.Response:
+            return web.json_response({"token": "benchmark-token"})
+
+        app = self.create_app("user-service")
+        app.router.add_post("/login", login)
+        app.router.add_get("/users", json_handler([]))
+        return app
+
+
+def json_handler(body: Any) -> Handler:
+    """Return handler that always responds with body."""
+
+    async def handler(_request: web.Request) -> web.Response:
+        return web.json_response(body)
+
+    return handler
+
+
+def not_found(name: str) -> web.Response:
+    """Return 404 with detail, as the services do."""
+    return web.json_response({"detail": f"{name} not found."}, status=404)
+
+
+def set_service_urls(urls: dict[str, str]) -> dict[tuple[str, str], Any]:
+    """Point all adapters to the given service urls - return previous settings."""
+    previous: dict[tuple[str, str], Any] = {}
+    for module_info in pkgutil.iter_modules(result_service_gui.adapters.__path__):
+        module = importlib.import_module(
+            f"{result_service_gui.adapters.__name__}.{module_info.name}"
+        )
+        for setting, service in SERVICE_URL_SETTINGS.items():
+            if hasattr(module, setting):
+                previous[(module.__name__, setting)] = getattr(module, setting)
+                setattr(module, setting, urls[service])
+    return previous
+
+
+def restore_service_urls(previous: dict[tuple[str, str], Any]) -> None:
+    """Restore settings returned by set_service_urls."""
+    for (module_name, setting), value in previous.items():
+        setattr(importlib.import_module(module_name), setting, value)
+
+
+@asynccontextmanager
+async def run_fake_services(services: FakeServices) -> AsyncIterator[dict[str, str]]:
+    """Start fake services on free ports and point the adapters to them."""
+    servers = {
+        service: TestServer(app, host="127.0.0.1")
+        for service, app in services.create_apps().items()
+    }
+    for server in servers.values():
+        await server.start_server()
+    urls = {
+        service: str(server.make_url("")).rstrip("/")
+        for service, server in servers.items()
+    }
+    previous = set_service_urls(urls)
+    service_names = request_stats.SERVICE_NAMES
+    request_stats.SERVICE_NAMES = {
+        (server.host, str(server.port)): service for service, server in servers.items()
+    }
+    try:
+        yield urls
+    finally:
+        request_stats.SERVICE_NAMES = service_names
+        restore_service_urls(previous)
+        for server in servers.values():
+            await server.close()
@@ -0,0 +1,223 @@
+"""Benchmark harness - drives key pages against fake backend services.
+
+Run from the project root, e.g.:
+
+    uv run poe benchmark --scale national --concurrency 20
+
+Each page is requested in turn, with the given concurrency, and latency
+percentiles, throughput and backend calls pr request are reported. Pages
+for anonymous users are served from the page cache, as in production - set
+PAGE_CACHE_TTL_SECONDS=0 to benchmark rendering.
+"""
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aiohttp import ClientSession, CookieJar
+from aiohttp.test_utils import TestServer
+
+from result_service_gui import create_app
+
+from .event_generator import SCALES, EventData, generate_event, read_fixture
+from .fake_services import FakeServices, run_fake_services
+
+BENCHMARK_USERNAME = "benchmark"
+
+
+@dataclass
+class Target:
+    """A page to benchmark - pages behind login are requested as logged in."""
+
+    name: str
+    path: str
+    login: bool = False
+
+
+@dataclass
+class TargetResult:
+    """Latencies and backend calls for all requests to one target."""
+
+    target: Target
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    seconds: float = 0.0
+    upstream_calls: Counter[str] = field(default_factory=Counter)
+
+    def percentile(self, percent: float) -> float:
+        """Return latency percentile in seconds, nearest rank."""
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        rank = max(round(percent / 100 * len(latencies)), 1)
+        return latencies[rank - 1]
+
+    def throughput(self) -> float:
+        """Return requests pr second."""
+        return len(self.latencies) / self.seconds if self.seconds else 0.0
+
+    def upstream_calls_per_request(self) -> float:
+        """Return average number of backend calls pr request."""
+        if not self.latencies:
+            return 0.0
+        return sum(self.upstream_calls.values()) / len(self.latencies)
+
+
+def get_targets(data: EventData) -> list[Target]:
+    """Return the key pages for the generated event, for largest ranked class."""
+    event_id = data.event["id"]
+    ranked = [rc for rc in data.raceclasses if rc["ranking"]] or data.raceclasses
+    klasse = max(ranked, key=lambda rc: rc["no_of_contestants"])["name"]
+    return [
+        Target("live", f"/live?event_id={event_id}&klasse={klasse}"),
+        Target("start", f"/start?event_id={event_id}&klasse={klasse}"),
+        Target(
+            "photo_finish",
+            f"/photo_finish?event_id={event_id}&klasse={klasse}&runde=Q",
+            login=True,
+        ),
+        Target("timing_dash", f"/timing_dash?event_id={event_id}", login=True),
+        Target(
+            "print_lists",
+            f"/print_lists?event_id={event_id}&action=live&klasse={klasse}",
+        ),
+        Target("csv", f"/csv?event_id={event_id}&action=startlist"),
+    ]
+
+
+async def run_target(
+    session: ClientSession,
+    base_url: str,
+    target: Target,
+    services: FakeServices,
+    requests: int,
+    concurrency: int,
+) -> TargetResult:
+    """Request target the given number of times, concurrency at a time."""
+    result = TargetResult(target)
+    remaining = iter(range(requests))
+    calls_before = services.calls.copy()
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            async with session.get(
+                f"{base_url}{target.path}", allow_redirects=False
+            ) as resp:
+                await resp.read()
+            result.latencies.append(time.perf_counter() - started)
+            if resp.status != 200:
+                result.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.seconds = time.perf_counter() - started
+    result.upstream_calls = services.calls - calls_before
+    return result
+
+
+async def run_benchmark(
+    data: EventData,
+    targets: list[Target],
+    requests: int = 100,
+    concurrency: int = 10,
+    latency_seconds: float = 0.0,
+    warmup: int = 1,
+) -> list[TargetResult]:
+    """Start app against fake services and benchmark targets one by one.
+
+    The first warmup requests to each target are not counted.
+    """
+    services = FakeServices(data, latency_seconds)
+    results = []
+    async with run_fake_services(services):
+        server = TestServer(await create_app(), host="127.0.0.1")
+        await server.start_server()
+        base_url = str(server.make_url("")).rstrip("/")
+        try:
+            async with (
+                ClientSession(cookie_jar=CookieJar(unsafe=True)) as anonymous,
+                ClientSession(cookie_jar=CookieJar(unsafe=True)) as logged_in,
+            ):
+                await login(logged_in, base_url)
+                for target in targets:
+                    session = logged_in if target.login else anonymous
+                    await run_target(session, base_url, target, services, warmup, 1)
+                    results.append(
+                        await run_target(
+                            session, base_url, target, services, requests, concurrency
+                        )
+                    )
+        finally:
+            await server.close()
+    return results
+
+
+async def login(session: ClientSession, base_url: str) -> None:
+    """Log in - the fake user-service accepts any password."""
+    async with session.post(
+        f"{base_url}/login",
+        data={"username": BENCHMARK_USERNAME, "password": "password"},
+        allow_redirects=False,
+    ) as resp:
+        if resp.status != 303:
+            err_msg = f"Login failed - {resp.status}"
+            raise RuntimeError(err_msg)
+
+
+def format_report(results: list[TargetResult]) -> str:
+    """Return results as a table, latencies in ms."""
+    lines = [
+        f"{'target':<14}{'requests':>9}{'errors':>8}{'p50':>9}{'p95':>9}"
+        f"{'p99':>9}{'req/s':>9}{'upstream':>10}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.target.name:<14}{len(result.latencies):>9}{result.errors:>8}"
+            f"{result.percentile(50) * 1000:>9.1f}"
+            f"{result.percentile(95) * 1000:>9.1f}"
+            f"{result.percentile(99) * 1000:>9.1f}"
+            f"{result.throughput():>9.1f}"
+            f"{result.upstream_calls_per_request():>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Generate event, run benchmark and print report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=SCALES, default="regional")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--fixture", type=Path, help="event fixture, overrides scale")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--targets", default="", help="comma separated names")
+    args = parser.parse_args()
+
+    if args.fixture:
+        data = read_fixture(args.fixture)
+    else:
+        data = generate_event(args.scale, args.seed)
+    targets = [
+        target
+        for target in get_targets(data)
+        if not args.targets or target.name in args.targets.split(",")
+    ]
+    results = asyncio.run(
+        run_benchmark(
+            data,
+            targets,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            latency_seconds=args.latency_ms / 1000,
+        )
+    )
+    print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
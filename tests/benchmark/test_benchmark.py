@@ -0,0 +1,32 @@
+"""Benchmark test cases for key pages against fake backend services."""
+
+import pytest
+
+from .event_generator import generate_event
+from .harness import format_report, get_targets, run_benchmark
+
+
+@pytest.mark.benchmark
+async def test_key_pages_benchmark() -> None:
+    """Should serve all key pages without errors and report latency."""
+    data = generate_event("kids_cup")
+
+    results = await run_benchmark(data, get_targets(data), requests=10, concurrency=2)
+
+    print(f"\n{format_report(results)}")
+    assert [result.target.name for result in results] == [
+        "live",
+        "start",
+        "photo_finish",
+        "timing_dash",
+        "print_lists",
+        "csv",
+    ]
+    for result in results:
+        assert result.errors == 0, result.target.name
+        assert len(result.latencies) == 10
+        assert result.percentile(50) <= result.percentile(99)
+    # logged in pages are not cached, and read from the backend services
+    by_name = {result.target.name: result for result in results}
+    assert by_name["photo_finish"].upstream_calls["race-service"] > 0
+    assert by_name["timing_dash"].upstream_calls["photo-service"] > 0
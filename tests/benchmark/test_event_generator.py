@@ -0,0 +1,62 @@
+"""Unit test cases for the event generator."""
+
+import json
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from result_service_gui.adapters.club_logos import CLUB_LOGO_FILE
+
+from .event_generator import CLUBS, generate_event, read_fixture, write_fixture
+
+
+@pytest.mark.benchmark
+def test_generate_event_is_deterministic() -> None:
+    """Should generate the same event for the same seed."""
+    first = generate_event("kids_cup", seed=7, progress=1.0)
+    second = generate_event("kids_cup", seed=7, progress=1.0)
+
+    assert first.event["id"] == second.event["id"]
+    assert [c["bib"] for c in first.contestants] == [
+        c["bib"] for c in second.contestants
+    ]
+    assert len(first.time_events) == len(second.time_events)
+
+
+@pytest.mark.benchmark
+def test_clubs_have_logos() -> None:
+    """Should use clubs with a logo in the club logo file."""
+    logo_keys = json.loads(CLUB_LOGO_FILE.read_text())
+
+    assert [club for club in CLUBS if club[:4] not in logo_keys] == []
+
+
+@pytest.mark.benchmark
+def test_national_event_is_qualified_by_rules() -> None:
+    """Should generate 3000+ racers, and qualify them to semifinals and finals."""
+    data = generate_event("national", progress=1.0)
+
+    assert len(data.contestants) >= 3000
+    assert len(data.raceclass_results) == len(data.raceclasses)
+    for raceclass in data.raceclasses:
+        races = [race for race in data.races if race["raceclass"] == raceclass["name"]]
+        rounds = Counter(f"{race['round']}{race['index']}" for race in races)
+        assert set(rounds) == {"Q", "SA", "SC", "FA", "FB", "FC"}
+        assert all(race["no_of_contestants"] <= 10 for race in races)
+        finals = [race for race in races if race["round"] == "F"]
+        assert all(race["start_entries"] for race in finals)
+    templates = [e for e in data.time_events if e["timing_point"] == "Template"]
+    assert {e["next_race"][:2] for e in templates} == {"SA", "SC", "FA", "FB", "FC"}
+    assert all(data.get_race(e["next_race_id"]) for e in templates if e["next_race_id"])
+
+
+@pytest.mark.benchmark
+def test_fixture_round_trip(tmp_path: Path) -> None:
+    """Should read the same event data from fixture as written."""
+    data = generate_event("kids_cup")
+    fixture = tmp_path / "kids_cup.json"
+
+    write_fixture(data, fixture)
+
+    assert read_fixture(fixture) == data
@@ -0,0 +1,236 @@
+"""Micro-benchmarks for the pure computation helpers, with scaled events.
+
+Run with pytest-benchmark, and compare to a saved run to catch regressions:
+
+    uv run pytest tests/benchmark/test_helpers_benchmark.py --benchmark-autosave
+    uv run pytest tests/benchmark/test_helpers_benchmark.py \
+        --benchmark-compare --benchmark-compare-fail=median:20%
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine, Iterator
+from typing import Any
+
+import pytest
+
+from result_service_gui.adapters import RaceplansAdapter, TimeEventsAdapter
+from result_service_gui.services.raceclass_result_service import (
+    get_results_from_all_heats,
+)
+from result_service_gui.services.time_events_service import (
+    calculate_next_start_entry,
+    get_next_start_entry,
+    next_race_template,
+    populate_next_race,
+)
+from result_service_gui.views.utils import (
+    get_passeringer,
+    get_qualification_text,
+    get_race_progress,
+    get_race_summary,
+    get_raceplan_summary,
+)
+
+from .event_generator import EventData, generate_event
+
+SCALES = ["kids_cup", "national"]
+
+
+@pytest.fixture(scope="module", params=SCALES)
+def data(request: pytest.FixtureRequest) -> EventData:
+    """Event at each scale, all races done."""
+    return generate_event(request.param, progress=1.0)
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Event loop for benchmarks of async helpers."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def ranked_races(data: EventData) -> list[dict]:
+    """Races for the largest ranked raceclass."""
+    ranked = [rc for rc in data.raceclasses if rc["ranking"]]
+    raceclass = max(ranked, key=lambda rc: rc["no_of_contestants"])["name"]
+    return [race for race in data.races if race["raceclass"] == raceclass]
+
+
+def run_async(
+    loop: asyncio.AbstractEventLoop,
+    func: Callable[..., Coroutine[Any, Any, Any]],
+    *args: Any,
+) -> Any:
+    """Run coroutine function to completion in loop."""
+    return loop.run_until_complete(func(*args))
+
+
+@pytest.mark.benchmark
+def test_get_raceplan_summary(benchmark, data: EventData) -> None:
+    """Benchmark raceplan summary for all raceclasses."""
+    summary = benchmark(get_raceplan_summary, data.races, data.raceclasses)
+
+    assert len(summary) == len(data.raceclasses)
+
+
+@pytest.mark.benchmark
+def test_get_race_summary(benchmark, data: EventData) -> None:
+    """Benchmark race summary for all races, as the timing dashboard."""
+
+    def get_race_summaries() -> list:
+        return [get_race_summary(data.event, race) for race in data.races]
+
+    summaries = benchmark(get_race_summaries)
+
+    assert {summary["progress"] for summary in summaries} <= {4, 5}
+
+
+@pytest.mark.benchmark
+def test_get_race_progress(benchmark, data: EventData) -> None:
+    """Benchmark race progress for all races."""
+    counts = [
+        (
+            race,
+            len(race["start_entries"]),
+            len(race["results"].get("DNS", {}).get("ranking_sequence", [])),
+            len(race["results"].get("DNF", {}).get("ranking_sequence", [])),
+            len(race["results"].get("Finish", {}).get("ranking_sequence", [])),
+        )
+        for race in data.races
+    ]
+
+    def get_race_progresses() -> list:
+        return [get_race_progress(data.event, *count) for count in counts]
+
+    progresses = benchmark(get_race_progresses)
+
+    assert len(progresses) == len(data.races)
+
+
+@pytest.mark.benchmark
+def test_get_qualification_text(benchmark, data: EventData) -> None:
+    """Benchmark qualification text for all races."""
+
+    def get_qualification_texts() -> list:
+        return [get_qualification_text(race) for race in data.races]
+
+    texts = benchmark(get_qualification_texts)
+
+    assert any("til finale A." in text for text in texts)
+
+
+@pytest.mark.benchmark
+def test_get_passeringer(
+    benchmark,
+    data: EventData,
+    loop: asyncio.AbstractEventLoop,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Benchmark filtering, heat marking and sorting of all time events."""
+
+    async def get_time_events_by_event_id(*_args) -> list:
+        return data.time_events
+
+    monkeypatch.setattr(
+        TimeEventsAdapter, "get_time_events_by_event_id", get_time_events_by_event_id
+    )
+
+    passeringer = benchmark(
+        run_async, loop, get_passeringer, "token", data.event["id"], "", ""
+    )
+
+    assert passeringer[0]["registration_time"] >= passeringer[-1]["registration_time"]
+
+
+@pytest.mark.benchmark
+def test_get_next_start_entry(benchmark, data: EventData, ranked_races: list) -> None:
+    """Benchmark next start entry for all ranks in Q and S, as for templates."""
+    time_events = [
+        {"race_id": race["id"], "rank": rank, "bib": 0}
+        for race in ranked_races
+        if race["round"] in ["Q", "S"]
+        for rank in range(1, race["max_no_of_contestants"] + 1)
+    ]
+
+    def get_next_start_entries() -> list:
+        return [
+            get_next_start_entry(time_event, data.races) for time_event in time_events
+        ]
+
+    start_entries = benchmark(get_next_start_entries)
+
+    assert any(start_entry.get("race_id") for start_entry in start_entries)
+
+
+@pytest.mark.benchmark
+def test_calculate_next_start_entry(
+    benchmark, data: EventData, ranked_races: list
+) -> None:
+    """Benchmark next race and position for the winners of Q and S heats."""
+    calculations = []
+    for race in ranked_races:
+        if race["round"] in ["Q", "S"]:
+            time_event = {"race_id": race["id"], "rank": 1, "bib": 0}
+            next_race = populate_next_race(time_event, data.races, next_race_template())
+            race_item = next(item for item in next_race if item["qualified"])
+            calculations.append((race_item, time_event | {"rank_qualified": 1}))
+
+    def calculate_next_start_entries() -> list:
+        return [
+            calculate_next_start_entry(race_item, time_event, data.races)
+            for race_item, time_event in calculations
+        ]
+
+    start_entries = benchmark(calculate_next_start_entries)
+
+    assert all(start_entry["race_id"] for start_entry in start_entries)
+
+
+@pytest.mark.benchmark
+def test_populate_next_race(benchmark, data: EventData, ranked_races: list) -> None:
+    """Benchmark rules matrix for all races in the largest ranked raceclass."""
+    time_events = [{"race_id": race["id"]} for race in ranked_races]
+
+    def populate_next_races() -> list:
+        return [
+            populate_next_race(time_event, data.races, next_race_template())
+            for time_event in time_events
+        ]
+
+    next_races = benchmark(populate_next_races)
+
+    assert next_races[0][2]["qualified"] or next_races[0][0]["qualified"]
+
+
+@pytest.mark.benchmark
+def test_get_results_from_all_heats(
+    benchmark,
+    data: EventData,
+    ranked_races: list,
+    loop: asyncio.AbstractEventLoop,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Benchmark ranking of the largest ranked raceclass from all heats."""
+
+    async def get_all_races_detailed(*_args, skip_rounds=()) -> list:
+        return [race for race in ranked_races if race["round"] not in skip_rounds]
+
+    monkeypatch.setattr(
+        RaceplansAdapter, "get_all_races_detailed", get_all_races_detailed
+    )
+
+    results = benchmark(
+        run_async,
+        loop,
+        get_results_from_all_heats,
+        "token",
+        data.event["id"],
+        ranked_races[0]["raceclass"],
+    )
+
+    ranks = [
+        result["rank"] for result in results["ranking_sequence"] if "rank" in result
+    ]
+    assert ranks == sorted(ranks)
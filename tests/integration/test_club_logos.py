@@ -0,0 +1,46 @@
+"""Integration test cases for the club logo index."""
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from result_service_gui.adapters.club_logos import ClubLogoIndex
+
+
+@pytest.mark.integration
+def test_get_logo_urls_by_club_name(tmp_path: Path) -> None:
+    """Should look up logos by the 4 first chars of the club name."""
+    config_file = tmp_path / "sports_clubs.json"
+    config_file.write_text(json.dumps({"Lyn ": "lyn.png", "Kjel": "kjelsaas.png"}))
+    club_logo_index = ClubLogoIndex(config_file)
+
+    club_logo_index.load()
+
+    assert club_logo_index.get_logo_urls(["Lyn", "Kjelsås IL", "Ukjent", ""]) == {
+        "Lyn": "lyn.png",
+        "Kjelsås IL": "kjelsaas.png",
+        "Ukjent": "",
+        "": "",
+    }
+
+
+@pytest.mark.integration
+def test_load_missing_or_invalid_file(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Should log error and use an empty index, not fail at startup."""
+    config_file = tmp_path / "sports_clubs.json"
+    club_logo_index = ClubLogoIndex(config_file)
+
+    with caplog.at_level(logging.ERROR):
+        club_logo_index.load()
+    assert "Error loading club logos" in caplog.text
+    assert club_logo_index.get_logo_url("Lyn") == ""
+
+    config_file.write_text(json.dumps({"Lyn ": "lyn.png"}))
+    club_logo_index.load()
+    config_file.write_text("{not json")
+    club_logo_index.load()
+    assert club_logo_index.get_logo_url("Lyn") == "lyn.png"
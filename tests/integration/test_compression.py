@@ -0,0 +1,76 @@
+"""Integration test cases for the response compression middleware."""
+
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+import pytest
+
+from result_service_gui.views import compression
+from result_service_gui.views.compression import compression_middleware
+
+PAGE = "<html>" + "<p>Løper</p>" * 2000 + "</html>"
+
+
+@pytest.fixture
+async def compressed_client(aiohttp_client: Any, monkeypatch: Any) -> Any:
+    """Start an app with a large and a small page."""
+
+    async def large(_request: web.Request) -> web.Response:
+        response = web.Response(text=PAGE, content_type="text/html")
+        response.etag = "abc"
+        return response
+
+    async def small(_request: web.Request) -> web.Response:
+        return web.Response(text="OK")
+
+    monkeypatch.setattr(compression, "RESPONSE_COMPRESS_EXECUTOR_MIN_BYTES", 1024)
+    app = web.Application(middlewares=[compression_middleware])
+    app.router.add_get("/large", large)
+    app.router.add_get("/small", small)
+    return await aiohttp_client(app)
+
+
+@pytest.mark.integration
+async def test_large_text_response_is_compressed(compressed_client: Any) -> None:
+    """Should compress large pages when accepted, and leave small pages."""
+    resp = await compressed_client.get(
+        "/large", headers={"Accept-Encoding": "gzip, deflate"}
+    )
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert int(resp.headers["Content-Length"]) < len(PAGE)
+    assert resp.headers["ETag"] == 'W/"abc"'
+    assert "Accept-Encoding" in resp.headers["Vary"]
+    assert await resp.text() == PAGE
+
+    resp = await compressed_client.get("/large", headers={"Accept-Encoding": ""})
+    assert "Content-Encoding" not in resp.headers
+    assert await resp.text() == PAGE
+
+    resp = await compressed_client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in resp.headers
+    assert await resp.text() == "OK"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("accept_encoding", "coding"),
+    [
+        ("gzip, deflate, br", "gzip"),
+        ("deflate", "deflate"),
+        ("gzip;q=0, deflate", "deflate"),
+        ("gzip;q=0.5, deflate;q=0.8", "deflate"),
+        ("GZIP;Q=0", ""),
+        ("*;q=0.1, gzip;q=0", "deflate"),
+        ("*", "gzip"),
+        ("identity, br", ""),
+        ("gzip;q=invalid", ""),
+    ],
+)
+def test_get_coding_respects_qvalues(accept_encoding: str, coding: str) -> None:
+    """Should return the preferred acceptable coding, none if q=0."""
+    request = make_mocked_request(
+        "GET", "/large", headers={"Accept-Encoding": accept_encoding}
+    )
+
+    assert compression.get_coding(request) == coding
@@ -0,0 +1,85 @@
+"""Integration test cases for cached csv exports with conditional get."""
+
+from typing import Any
+
+from aiohttp.test_utils import TestClient as _TestClient
+import pytest
+
+from result_service_gui.views import csv_list
+from result_service_gui.views.page_cache import export_cache
+
+
+@pytest.mark.integration
+async def test_csv_export_is_generated_once_and_revalidated(
+    client: _TestClient, monkeypatch: Any
+) -> None:
+    """Should generate export once, return 304 for matching etag."""
+    exports = []
+
+    async def get_csv_data(
+        event_id: str, user: dict, action: str, race_round: str, valgt_klasse: str
+    ) -> tuple[list, list]:
+        exports.append((event_id, action, race_round))
+        return ["raceclass", "order"], [{"raceclass": "G16", "order": 1}]
+
+    monkeypatch.setattr(csv_list, "get_csv_data", get_csv_data)
+    export_cache.clear()
+
+    first = await client.get("/csv?event_id=e1&action=raceplan")
+    assert first.status == 200
+    assert await first.text() == "raceclass;order\r\nG16;1\r\n"
+    etag = first.headers["ETag"]
+    assert "Last-Modified" in first.headers
+
+    not_modified = await client.get(
+        "/csv?event_id=e1&action=raceplan", headers={"If-None-Match": etag}
+    )
+    assert not_modified.status == 304
+    assert exports == [("e1", "raceplan", "")]
+
+    await client.get("/csv?event_id=e1&action=startlist&round=Q")
+    assert len(exports) == 2
+
+
+@pytest.mark.integration
+async def test_large_csv_export_is_streamed_in_chunks(
+    client: _TestClient, monkeypatch: Any
+) -> None:
+    """Should stream large export compressed, without etag and not cached."""
+    rows = [{"bib": bib, "name": f"Løper {bib}"} for bib in range(1, 1201)]
+    exports = []
+
+    async def get_csv_data(*args: Any) -> tuple[list, list]:
+        exports.append(args)
+        return ["bib", "name"], rows
+
+    monkeypatch.setattr(csv_list, "get_csv_data", get_csv_data)
+    monkeypatch.setattr(csv_list, "EXPORT_STREAM_MIN_ROWS", 1000)
+    export_cache.clear()
+
+    resp = await client.get(
+        "/csv?event_id=e1&action=contestants", headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Transfer-Encoding"] == "chunked"
+    lines = (await resp.text()).splitlines()
+    assert lines[0] == "bib;name"
+    assert lines[-1] == "1200;Løper 1200"
+    assert len(lines) == 1201
+
+    # the body is not known before it is sent - no etag to revalidate
+    assert "ETag" not in resp.headers
+    assert resp.headers["Cache-Control"] == "no-cache"
+    again = await client.get(
+        "/csv?event_id=e1&action=contestants", headers={"If-None-Match": "*"}
+    )
+    assert again.status == 200
+    assert len((await again.text()).splitlines()) == 1201
+    assert len(exports) == 2
+
+    identity = await client.get(
+        "/csv?event_id=e1&action=contestants", headers={"Accept-Encoding": "gzip;q=0"}
+    )
+    assert "Content-Encoding" not in identity.headers
+    assert "Accept-Encoding" in identity.headers["Vary"]
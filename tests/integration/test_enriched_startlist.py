@@ -0,0 +1,32 @@
+"""Integration test cases for enrichment of start lists."""
+
+import pytest
+
+from result_service_gui.views.utils import get_enrichced_startlist
+
+
+@pytest.mark.integration
+async def test_startlist_enriched_with_status_and_next_race() -> None:
+    """Should add status pr bib and next race pr position from time events."""
+    race = {
+        "id": "r1",
+        "start_entries": [
+            {"bib": 11, "club": "Lyn"},
+            {"bib": 12, "club": "Lyn"},
+            {"bib": 13, "club": "Lyn"},
+        ],
+    }
+    time_events = [
+        {"id": "t1", "timing_point": "Start", "bib": 12, "rank": None},
+        {"id": "t2", "timing_point": "DNS", "bib": 12, "rank": None},
+        {"id": "t3", "timing_point": "Template", "rank": 1, "next_race": "SA1"},
+        {"id": "t4", "timing_point": "Template", "rank": 2, "next_race": "Ute - 5"},
+    ]
+
+    startlist = await get_enrichced_startlist({"token": ""}, race, time_events)
+
+    assert [entry.get("next_race") for entry in startlist] == ["SA1", "Ute", None]
+    assert startlist[1]["status"] == "DNS"
+    assert startlist[1]["status_id"] == "t2"
+    assert "status" not in startlist[0]
+    assert all("club_logo" in entry for entry in startlist)
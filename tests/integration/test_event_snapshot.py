@@ -0,0 +1,215 @@
+"""Integration test cases for shared event snapshots."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from types import MappingProxyType
+from typing import Any
+
+from aiohttp import web
+import pytest
+
+from result_service_gui.adapters import (
+    EventsAdapter,
+    RaceclassesAdapter,
+    RaceclassResultsAdapter,
+    RaceplansAdapter,
+    TimeEventsAdapter,
+)
+from result_service_gui.views import event_snapshot
+from result_service_gui.views.event_snapshot import EventSnapshot, get_event_snapshot
+
+
+@pytest.fixture(autouse=True)
+async def stop_pollers(monkeypatch: Any) -> AsyncIterator[None]:
+    """Stop snapshot pollers after each test - all events exist."""
+
+    async def get_event(_self: Any, _token: str, event_id: str) -> dict:
+        return {"id": event_id}
+
+    monkeypatch.setattr(EventsAdapter, "get_event", get_event)
+    yield
+    await event_snapshot.stop_event_snapshots(None)
+
+
+@pytest.mark.integration
+async def test_event_snapshot_is_shared_by_concurrent_readers(
+    monkeypatch: Any,
+) -> None:
+    """Should build snapshot once for concurrent readers and return copies."""
+    builds = []
+
+    async def build_event_snapshot(event_id: str) -> EventSnapshot:
+        builds.append(event_id)
+        await asyncio.sleep(0.01)
+        race = {"id": "r1", "raceclass": "G16", "order": 1}
+        return EventSnapshot(
+            event=MappingProxyType({"id": event_id}),
+            raceclasses=(MappingProxyType({"name": "G16"}),),
+            races=(MappingProxyType(race),),
+            raceclass_results=MappingProxyType({}),
+        )
+
+    monkeypatch.setattr(event_snapshot, "build_event_snapshot", build_event_snapshot)
+    monkeypatch.setattr(event_snapshot, "EVENT_SNAPSHOT_POLL_SECONDS", 60)
+
+    first, second = await asyncio.gather(
+        get_event_snapshot("e1", ""), get_event_snapshot("e1", "")
+    )
+
+    assert builds == ["e1"]
+    assert first is second
+    races = first.get_races("G16")
+    races[0]["display_color"] = "red"  # views may change their copy
+    assert "display_color" not in first.get_races()[0]
+    assert first.get_races("J16") == []
+    assert first.get_raceclass_result("G16") == {}
+
+
+@pytest.mark.integration
+async def test_event_snapshot_only_for_anonymous_users(monkeypatch: Any) -> None:
+    """Should not give snapshot to logged in users, they read directly."""
+    builds = []
+
+    async def build_event_snapshot(event_id: str) -> EventSnapshot:
+        builds.append(event_id)
+        raise AssertionError
+
+    monkeypatch.setattr(event_snapshot, "build_event_snapshot", build_event_snapshot)
+
+    assert await get_event_snapshot("e1", "token") is None
+    assert builds == []
+
+
+@pytest.mark.integration
+async def test_event_snapshot_wait_is_bounded(monkeypatch: Any) -> None:
+    """Should return None if first snapshot is not ready in time."""
+
+    async def build_event_snapshot(event_id: str) -> EventSnapshot:
+        await asyncio.sleep(60)
+        raise AssertionError
+
+    monkeypatch.setattr(event_snapshot, "build_event_snapshot", build_event_snapshot)
+    monkeypatch.setattr(event_snapshot, "EVENT_SNAPSHOT_WAIT_SECONDS", 0.01)
+
+    assert await get_event_snapshot("e1", "") is None
+
+
+@pytest.mark.integration
+async def test_event_snapshot_not_polled_for_unknown_event(monkeypatch: Any) -> None:
+    """Should not start polling for event ids that are not found."""
+    builds = []
+
+    async def get_event(_self: Any, _token: str, event_id: str) -> dict:
+        raise web.HTTPBadRequest(reason="Error - 404: Event not found.")
+
+    async def build_event_snapshot(event_id: str) -> EventSnapshot:
+        builds.append(event_id)
+        raise AssertionError
+
+    monkeypatch.setattr(EventsAdapter, "get_event", get_event)
+    monkeypatch.setattr(event_snapshot, "build_event_snapshot", build_event_snapshot)
+
+    assert await get_event_snapshot("bogus", "") is None
+    assert event_snapshot._pollers == {}
+    assert builds == []
+
+
+@pytest.mark.integration
+async def test_event_snapshot_pollers_are_capped(monkeypatch: Any) -> None:
+    """Should read directly when EVENT_SNAPSHOT_MAX_EVENTS events are polled."""
+
+    async def build_event_snapshot(event_id: str) -> EventSnapshot:
+        return EventSnapshot(
+            event=MappingProxyType({"id": event_id}),
+            raceclasses=(),
+            races=(),
+            raceclass_results=MappingProxyType({}),
+        )
+
+    monkeypatch.setattr(event_snapshot, "build_event_snapshot", build_event_snapshot)
+    monkeypatch.setattr(event_snapshot, "EVENT_SNAPSHOT_MAX_EVENTS", 1)
+
+    assert await get_event_snapshot("e1", "") is not None
+    assert await get_event_snapshot("e2", "") is None
+    assert await get_event_snapshot("e1", "") is not None
+    assert list(event_snapshot._pollers) == ["e1"]
+
+
+@pytest.mark.integration
+async def test_build_event_snapshot_with_live_print_lists(monkeypatch: Any) -> None:
+    """Should build start and result lists for print, with one time event read."""
+    start_entries = [
+        {"bib": 2, "starting_position": 2, "club": "Lyn"},
+        {"bib": 1, "starting_position": 1, "club": "Lyn"},
+    ]
+    races = [
+        {
+            "id": "r1",
+            "raceclass": "G16",
+            "order": 1,
+            "round": "Q",
+            "index": "",
+            "heat": 1,
+            "rule": {},
+            "start_time": "2026-01-01T10:00:00",
+            "start_entries": start_entries,
+            "results": {},
+        },
+        {
+            "id": "r2",
+            "raceclass": "J16",
+            "order": 2,
+            "round": "F",
+            "index": "A",
+            "heat": 1,
+            "rule": {},
+            "start_time": "2026-01-01T11:00:00",
+            "start_entries": [],
+            "results": {},
+        },
+    ]
+    time_events = [
+        {"id": "t1", "race_id": "r1", "bib": 1, "timing_point": "DNS", "rank": 0}
+    ]
+
+    async def get_raceclasses(*_args: Any) -> list:
+        return [{"name": "G16"}]
+
+    async def get_all_races(*_args: Any) -> list:
+        return races
+
+    async def get_time_events(*_args: Any) -> list:
+        return time_events
+
+    async def get_all_raceclass_results(*_args: Any) -> list:
+        return []
+
+    async def get_time_events_by_race_id(*_args: Any) -> list:
+        raise AssertionError
+
+    monkeypatch.setattr(RaceclassesAdapter, "get_raceclasses", get_raceclasses)
+    monkeypatch.setattr(RaceplansAdapter, "get_all_races", get_all_races)
+    monkeypatch.setattr(
+        RaceclassResultsAdapter, "get_all_raceclass_results", get_all_raceclass_results
+    )
+    monkeypatch.setattr(
+        TimeEventsAdapter, "get_time_events_by_event_id", get_time_events
+    )
+    monkeypatch.setattr(
+        TimeEventsAdapter, "get_time_events_by_race_id", get_time_events_by_race_id
+    )
+
+    snapshot = await event_snapshot.build_event_snapshot("e1")
+
+    # only races in raceclasses of the event
+    print_races = snapshot.get_print_races()
+    assert [race["id"] for race in print_races] == ["r1"]
+    assert print_races[0]["list_type"] == "start"
+    assert print_races[0]["start_time"] == "10:00:00"
+    assert [entry.get("status") for entry in print_races[0]["startliste"]] == [
+        "DNS",
+        None,
+    ]
+    assert snapshot.get_print_races("G16", "F") == []
+    # the live races are not changed by the print list
+    assert "status" not in snapshot.get_races()[0]["start_entries"][0]
@@ -0,0 +1,46 @@
+"""Integration test cases for assembly of finish timings for a race."""
+
+import pytest
+
+from result_service_gui.views.utils import get_finish_timings_from_time_events
+
+
+def time_event(timing_point: str, rank: int, bib: int = 0) -> dict:
+    """Return a minimal time event."""
+    return {"timing_point": timing_point, "status": "OK", "rank": rank, "bib": bib}
+
+
+@pytest.mark.integration
+def test_finish_timings_filled_with_templates() -> None:
+    """Should return finish events by rank, templates for missing ranks."""
+    race = {"max_no_of_contestants": 4, "round": "Q"}
+    time_events = [
+        time_event("Template", 3),
+        time_event("Finish", 2, bib=12),
+        time_event("Finish", 1, bib=11),
+        time_event("Finish", 1, bib=13),
+        time_event("Template", 4),
+        time_event("Template", 4, bib=99),
+        time_event("Finish", 9, bib=19),
+    ]
+
+    finish_timings = get_finish_timings_from_time_events(race, time_events)
+
+    # same rank twice fills rank 3, template for rank 4, rank 9 is not shown
+    assert [(e["timing_point"], e["rank"], e["bib"]) for e in finish_timings] == [
+        ("Finish", 1, 11),
+        ("Finish", 1, 13),
+        ("Finish", 2, 12),
+        ("Template", 4, 0),
+    ]
+
+
+@pytest.mark.integration
+def test_finish_timings_final_filled_with_dummy_events() -> None:
+    """Should return dummy events for missing ranks in a final."""
+    race = {"max_no_of_contestants": 3, "round": "F"}
+    time_events = [time_event("Finish", 2, bib=12), time_event("Template", 1)]
+
+    finish_timings = get_finish_timings_from_time_events(race, time_events)
+
+    assert finish_timings == [{"rank": 1}, time_events[0], {"rank": 3}]
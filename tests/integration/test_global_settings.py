@@ -0,0 +1,71 @@
+"""Integration test cases for global settings loaded from config file."""
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from result_service_gui.adapters import global_settings
+from result_service_gui.adapters.global_settings import (
+    DEFAULT_DATE_PATTERNS,
+    GLOBAL_SETTINGS_FILE,
+    GlobalSettings,
+    get_global_settings,
+    load_global_settings,
+)
+
+
+@pytest.mark.integration
+def test_load_global_settings_from_file() -> None:
+    """Should load settings once, with pre-parsed values."""
+    values = json.loads(GLOBAL_SETTINGS_FILE.read_text())
+
+    settings = load_global_settings()
+
+    assert get_global_settings() is settings
+    assert settings.get("DATE_PATTERNS") == values["DATE_PATTERNS"]
+    assert settings.date_patterns == tuple(values["DATE_PATTERNS"].split(";"))
+    assert settings.time_zone_offset_g_photos == int(
+        values.get("TIME_ZONE_OFFSET_G_PHOTOS", 0)
+    )
+    with pytest.raises(KeyError):
+        settings.get("NOT_A_SETTING")
+    with pytest.raises(TypeError):
+        settings.values["DATE_PATTERNS"] = ""
+
+
+@pytest.mark.integration
+def test_global_settings_defaults(tmp_path: Path) -> None:
+    """Should use defaults for pre-parsed values missing in file."""
+    config_file = tmp_path / "global_settings.json"
+    config_file.write_text(json.dumps({"EVENT_NAME": "Test"}))
+
+    settings = GlobalSettings.from_file(config_file)
+
+    assert settings.get("EVENT_NAME") == "Test"
+    assert settings.date_patterns == tuple(DEFAULT_DATE_PATTERNS.split(";"))
+    assert settings.time_zone_offset_g_photos == 0
+
+
+@pytest.mark.integration
+def test_load_global_settings_missing_or_invalid_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Should log error and use defaults, not fail at startup."""
+    config_file = tmp_path / "global_settings.json"
+    monkeypatch.setattr(global_settings, "GLOBAL_SETTINGS_FILE", config_file)
+    monkeypatch.setattr(global_settings, "_global_settings", None)
+
+    with caplog.at_level(logging.ERROR):
+        settings = load_global_settings()
+    assert "Error loading global settings" in caplog.text
+    assert get_global_settings() is settings
+    assert settings.date_patterns == tuple(DEFAULT_DATE_PATTERNS.split(";"))
+    assert settings.time_zone_offset_g_photos == 0
+    with pytest.raises(KeyError):
+        settings.get("DATE_PATTERNS")
+
+    config_file.write_text("{not json")
+    monkeypatch.setattr(global_settings, "_global_settings", None)
+    assert get_global_settings().values == {}
@@ -0,0 +1,42 @@
+"""Integration test cases for the shared http client session."""
+
+import asyncio
+import gc
+
+from aiohttp import ClientSession
+import pytest
+
+from result_service_gui.adapters.http_client import (
+    close_client_session,
+    get_client_session,
+)
+
+
+async def get_session() -> ClientSession:
+    """Return shared session in running loop."""
+    return get_client_session()
+
+
+@pytest.mark.integration
+def test_session_is_closed_when_event_loop_changes() -> None:
+    """Should close the session of a previous loop, and not leak it."""
+    first_loop = asyncio.new_event_loop()
+    first = first_loop.run_until_complete(get_session())
+    first_loop.close()
+
+    second_loop = asyncio.new_event_loop()
+    errors = []
+    second_loop.set_exception_handler(lambda _loop, context: errors.append(context))
+    try:
+        second = second_loop.run_until_complete(get_session())
+        second_loop.run_until_complete(asyncio.sleep(0))
+        assert first.closed
+        assert second is not first
+        assert not second.closed
+
+        del first
+        gc.collect()
+        assert errors == []
+        second_loop.run_until_complete(close_client_session())
+    finally:
+        second_loop.close()
@@ -0,0 +1,92 @@
+"""Integration test cases for the live stream resource."""
+
+import json
+from typing import Any
+
+from aiohttp.test_utils import TestClient as _TestClient
+import pytest
+
+from result_service_gui.views import live_stream
+
+
+def race(finish_results: list) -> dict:
+    """Return a minimal race for live view."""
+    return {
+        "id": "r1",
+        "order": 1,
+        "raceclass": "G16",
+        "round": "F",
+        "index": "A",
+        "heat": 1,
+        "start_time": "2026-01-01T10:00:00",
+        "next_race": "",
+        "results": {},
+        "start_entries": [],
+        "finish_results": finish_results,
+    }
+
+
+@pytest.mark.integration
+async def test_live_stream_pushes_changed_race(
+    client: _TestClient, monkeypatch: Any
+) -> None:
+    """Should poll once for all subscribers and push races that changed."""
+    polls = []
+
+    async def get_races(*args: Any) -> list:
+        polls.append(args)
+        if len(polls) == 1:
+            return [race([])]
+        return [race([{"bib": 7, "rank": 1, "name": "Ola", "club": "Lyn"}])]
+
+    monkeypatch.setattr(live_stream, "get_races", get_races)
+    monkeypatch.setattr(live_stream, "LIVE_STREAM_POLL_SECONDS", 0.01)
+
+    resp = await client.get("/live/stream?event_id=e1&klasse=G16")
+    assert resp.status == 200
+    assert resp.headers["Content-Type"] == "text/event-stream"
+
+    # current race first, then the race when changed
+    event, data = await read_event(resp)
+    assert (event, data["id"]) == ("race", "r1")
+    assert "Ola" not in data["html"]
+    event, data = await read_event(resp)
+    assert (event, data["id"]) == ("race", "r1")
+    assert "Ola" in data["html"]
+    assert polls[0] == ("", "e1", "G16", 0, "all")
+    resp.close()
+
+
+@pytest.mark.integration
+async def test_live_stream_reloads_when_semi_results_registered(
+    client: _TestClient, monkeypatch: Any
+) -> None:
+    """Should ask for reload when selection of heats to show changes."""
+    polls = []
+
+    async def get_races(*args: Any) -> list:
+        polls.append(args)
+        semi = race([]) | {"id": "s1", "round": "S", "index": "A"}
+        if len(polls) > 1:
+            semi["results"] = {"Finish": {"ranking_sequence": []}}
+        return [race([]), semi]
+
+    monkeypatch.setattr(live_stream, "get_races", get_races)
+    monkeypatch.setattr(live_stream, "LIVE_STREAM_POLL_SECONDS", 0.01)
+
+    resp = await client.get("/live/stream?event_id=e1&klasse=G16")
+
+    assert [(await read_event(resp))[0] for _ in range(3)] == [
+        "race",
+        "race",
+        "reload",
+    ]
+    resp.close()
+
+
+async def read_event(resp: Any) -> tuple[str, dict]:
+    """Return event name and data of next server-sent event."""
+    event = (await resp.content.readline()).decode()[len("event: ") :].strip()
+    data = json.loads((await resp.content.readline()).decode()[len("data: ") :])
+    await resp.content.readline()
+    return event, data
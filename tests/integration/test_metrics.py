@@ -0,0 +1,46 @@
+"""Integration test cases for the metrics route."""
+
+import json
+from typing import Any
+
+from aiohttp.test_utils import TestClient as _TestClient
+import pytest
+
+from result_service_gui.adapters.metrics import metrics
+
+
+@pytest.mark.integration
+async def test_metrics_are_summed_for_all_workers(
+    client: _TestClient, monkeypatch: Any, tmp_path: Any
+) -> None:
+    """Should return request metrics, including those of other workers."""
+    monkeypatch.setattr(metrics, "metrics_dir", tmp_path)
+    other_worker = {
+        "written": 0,
+        "counters": [
+            [
+                "http_requests_total",
+                [["route", "/live"], ["method", "GET"], ["status", "200"]],
+                5,
+            ]
+        ],
+        "gauges": [["http_requests_in_flight", [], 7]],
+        "histograms": [],
+    }
+    (tmp_path / "worker-1.json").write_text(json.dumps(other_worker))
+
+    await client.get("/live?event_id=")
+    resp = await client.get("/metrics")
+    assert resp.status == 200
+    text = await resp.text()
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    assert 'http_request_duration_seconds_bucket{route="/live",le="+Inf"}' in text
+    live_requests = [
+        line
+        for line in text.splitlines()
+        if line.startswith('http_requests_total{route="/live",method="GET"')
+    ]
+    assert sum(float(line.split()[-1]) for line in live_requests) >= 6
+    # gauges of workers that have not written recently are left out
+    assert "http_requests_in_flight 0" in text
+    assert 'cache_hits_total{cache="races"}' in text
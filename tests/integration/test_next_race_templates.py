@@ -0,0 +1,112 @@
+"""Integration test cases for generation of next race templates."""
+
+from collections.abc import AsyncIterator
+
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from result_service_gui.adapters.http_client import close_client_session
+from result_service_gui.adapters.raceplans_adapter import races_cache
+from result_service_gui.adapters.time_events_adapter import RACE_SERVICE_URL
+from result_service_gui.services import TimeEventsService
+
+EVENT = {"id": "e1", "timezone": "Europe/Oslo"}
+RACES = [
+    {
+        "id": f"q{heat}",
+        "raceclass": "G12",
+        "round": "Q",
+        "index": "",
+        "heat": heat,
+        "max_no_of_contestants": 10,
+        "rule": {"F": {"A": 4, "B": "REST"}},
+        "start_time": "2026-01-01T10:00:00",
+    }
+    for heat in [1, 2]
+] + [
+    {
+        "id": f"f{index}",
+        "raceclass": "G12",
+        "round": "F",
+        "index": index,
+        "heat": 1,
+        "max_no_of_contestants": 10,
+        "rule": {},
+        "start_time": "2026-01-01T11:00:00",
+    }
+    for index in ["A", "B"]
+]
+
+
+@pytest.fixture(autouse=True)
+async def shared_session() -> AsyncIterator[None]:
+    """Close the shared client session after each test."""
+    races_cache.clear()
+    yield
+    await close_client_session()
+
+
+def mock_race_service(m: aioresponses, old_templates: list) -> None:
+    """Mock race-service with old templates and races for event."""
+    m.get(
+        f"{RACE_SERVICE_URL}/time-events?eventId=e1&timingPoint=Template",
+        payload=old_templates,
+    )
+    m.get(f"{RACE_SERVICE_URL}/races?eventId=e1", payload=RACES)
+
+
+@pytest.mark.integration
+async def test_generate_next_race_templates() -> None:
+    """Should delete old templates and create one pr rank in qualifying heats."""
+    with aioresponses() as m:
+        mock_race_service(m, [{"id": "t1"}, {"id": "t2"}])
+        m.delete(f"{RACE_SERVICE_URL}/time-events/t1", status=204)
+        m.delete(f"{RACE_SERVICE_URL}/time-events/t2", status=204)
+        m.post(f"{RACE_SERVICE_URL}/time-events", payload={"status": "OK"}, repeat=True)
+
+        informasjon = await TimeEventsService().generate_next_race_templates(
+            "token", EVENT
+        )
+        posted = [
+            call.kwargs["json"]
+            for call in m.requests[("POST", URL(f"{RACE_SERVICE_URL}/time-events"))]
+        ]
+
+    assert informasjon == "Suksess! Opprettet 20 templates. "
+    by_race_and_rank = {(t["race_id"], t["rank"]): t for t in posted}
+    assert len(by_race_and_rank) == 20
+    # winners of heat 1 and 2 start in position 1 and 2 in final A
+    assert by_race_and_rank[("q1", 1)]["next_race"] == "FA"
+    assert by_race_and_rank[("q1", 1)]["next_race_position"] == 1
+    assert by_race_and_rank[("q2", 1)]["next_race_position"] == 2
+    assert by_race_and_rank[("q1", 5)]["next_race_id"] == "fB"
+
+
+@pytest.mark.integration
+async def test_generate_next_race_templates_collects_errors() -> None:
+    """Should continue after failed items, and report them."""
+    with aioresponses() as m:
+        mock_race_service(m, [{"id": "t1"}, {"id": "t2"}])
+        m.delete(
+            f"{RACE_SERVICE_URL}/time-events/t1",
+            status=404,
+            payload={"detail": "not found"},
+        )
+        m.delete(f"{RACE_SERVICE_URL}/time-events/t2", status=204)
+        m.post(
+            f"{RACE_SERVICE_URL}/time-events",
+            status=400,
+            payload={"detail": "Invalid rank"},
+        )
+        m.post(f"{RACE_SERVICE_URL}/time-events", payload={"status": "OK"}, repeat=True)
+
+        informasjon = await TimeEventsService().generate_next_race_templates(
+            "token", EVENT
+        )
+        posts = m.requests[("POST", URL(f"{RACE_SERVICE_URL}/time-events"))]
+
+    assert len(posts) == 20
+    assert informasjon.startswith("Feil! Opprettet 19 templates. ")
+    assert "1 av 2 gamle templates ble ikke slettet" in informasjon
+    assert "1 av 20 templates feilet: 400 - Invalid rank" in informasjon
@@ -0,0 +1,62 @@
+"""Integration test cases for the rendered page cache for anonymous users."""
+
+import base64
+from typing import Any
+
+from aiohttp import web
+from aiohttp_session import setup
+from aiohttp_session.cookie_storage import EncryptedCookieStorage
+import pytest
+
+from result_service_gui.views.page_cache import page_cache, page_cache_middleware
+
+SECRET_KEY = base64.urlsafe_b64decode("23EHUWpP_tpleR_RjuX5hxndWqyc0vO-cjNUMSzbjN4=")
+
+
+@pytest.fixture
+async def page_client(aiohttp_client: Any) -> Any:
+    """Start an app with a counting /live page, return client and counter."""
+    counter = {"renders": 0}
+
+    async def live(_request: web.Request) -> web.Response:
+        counter["renders"] += 1
+        return web.Response(text=f"live {counter['renders']}", content_type="text/html")
+
+    async def update(_request: web.Request) -> web.Response:
+        return web.Response(text="updated")
+
+    page_cache.clear()
+    app = web.Application()
+    setup(app, EncryptedCookieStorage(SECRET_KEY))
+    app.middlewares.append(page_cache_middleware)
+    app.router.add_get("/live", live)
+    app.router.add_post("/resultat_update", update)
+    return await aiohttp_client(app), counter
+
+
+@pytest.mark.integration
+async def test_page_is_rendered_once_and_revalidated_with_etag(
+    page_client: Any,
+) -> None:
+    """Should render once for same query, return 304 for matching etag."""
+    client, counter = page_client
+
+    first = await client.get("/live?event_id=e1&klasse=G16")
+    assert first.status == 200
+    etag = first.headers["ETag"]
+    second = await client.get("/live?klasse=G16&event_id=e1")
+    assert await second.text() == await first.text()
+    assert second.headers["ETag"] == etag
+    assert counter["renders"] == 1
+
+    not_modified = await client.get(
+        "/live?event_id=e1&klasse=G16", headers={"If-None-Match": etag}
+    )
+    assert not_modified.status == 304
+    assert counter["renders"] == 1
+
+    # writes invalidate cached pages
+    await client.post("/resultat_update")
+    third = await client.get("/live?event_id=e1&klasse=G16")
+    assert await third.text() == "live 2"
+    assert third.headers["ETag"] != etag
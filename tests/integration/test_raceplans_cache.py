@@ -0,0 +1,208 @@
+"""Integration test cases for the raceplans read-through cache."""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+from aioresponses import CallbackResult, aioresponses
+import pytest
+from yarl import URL
+
+from result_service_gui.adapters import RaceplansAdapter, ResultAdapter, StartAdapter
+from result_service_gui.adapters.http_client import close_client_session
+from result_service_gui.adapters.raceplans_adapter import (
+    RaceOrderIndex,
+    RACE_SERVICE_URL,
+    invalidate_races_cache,
+    races_cache,
+)
+from result_service_gui.views.utils import get_race_kpis
+
+RACES = [
+    {"id": "r1", "event_id": "e1", "order": 1, "round": "Q", "index": ""},
+    {"id": "r2", "event_id": "e1", "order": 2, "round": "F", "index": "A"},
+]
+
+
+@pytest.fixture(autouse=True)
+async def shared_session() -> AsyncIterator[None]:
+    """Close the shared client session after each test."""
+    yield
+    await close_client_session()
+
+
+@pytest.mark.integration
+async def test_get_all_races_is_cached_until_update_race() -> None:
+    """Should hit race-service once, and again after update_race."""
+    races_cache.clear()
+    url = f"{RACE_SERVICE_URL}/races?eventId=e1"
+    with aioresponses() as m:
+        m.get(url, payload=RACES, repeat=True)
+        m.put(f"{RACE_SERVICE_URL}/races/r1", status=204)
+
+        first = await RaceplansAdapter().get_all_races("token", "e1")
+        first[0]["order"] = 99  # callers may mutate their copy
+        second = await RaceplansAdapter().get_all_races("token", "e1")
+        assert second == RACES
+        assert len(m.requests[("GET", URL(url))]) == 1
+
+        await RaceplansAdapter().update_race("token", "r1", RACES[0])
+        await RaceplansAdapter().get_all_races("token", "e1")
+        assert len(m.requests[("GET", URL(url))]) == 2
+
+    stats = races_cache.stats()
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 2
+
+
+@pytest.mark.integration
+async def test_writes_pr_race_invalidate_only_its_event() -> None:
+    """Should invalidate cached races of the event of the race, not others."""
+    races_cache.clear()
+    urls = {
+        event_id: f"{RACE_SERVICE_URL}/races?eventId={event_id}"
+        for event_id in ["e1", "e2"]
+    }
+    with aioresponses() as m:
+        m.get(urls["e1"], payload=RACES, repeat=True)
+        m.get(urls["e2"], payload=[{**RACES[0], "id": "x1", "event_id": "e2"}])
+        m.delete(f"{RACE_SERVICE_URL}/races/r1/start-entries/s1", status=204)
+        m.put(f"{RACE_SERVICE_URL}/races/r2/race-results/rr1", status=204)
+
+        for event_id in ["e1", "e2"]:
+            await RaceplansAdapter().get_all_races("token", event_id)
+        await StartAdapter().delete_start_entry("token", "r1", "s1")
+        await ResultAdapter().update_race_results("token", "r2", {"id": "rr1"})
+        for event_id in ["e1", "e2"]:
+            await RaceplansAdapter().get_all_races("token", event_id)
+
+    assert len(m.requests[("GET", URL(urls["e1"]))]) == 2
+    assert len(m.requests[("GET", URL(urls["e2"]))]) == 1
+
+
+@pytest.mark.integration
+async def test_races_read_during_invalidation_are_not_cached() -> None:
+    """Should not store races read before a write to the event completed."""
+    races_cache.clear()
+    url = f"{RACE_SERVICE_URL}/races?eventId=e1"
+
+    def changed_while_read(*_args: Any, **_kwargs: Any) -> CallbackResult:
+        invalidate_races_cache("e1")
+        return CallbackResult(payload=RACES)
+
+    with aioresponses() as m:
+        m.get(url, callback=changed_while_read)
+        m.get(url, payload=RACES)
+
+        await RaceplansAdapter().get_all_races("token", "e1")
+        await RaceplansAdapter().get_all_races("token", "e1")
+        await RaceplansAdapter().get_all_races("token", "e1")
+
+    assert len(m.requests[("GET", URL(url))]) == 2
+
+
+@pytest.mark.integration
+async def test_get_all_races_detailed_keeps_order_and_is_cached() -> None:
+    """Should fetch race details once pr race, in raceplan order."""
+    races_cache.clear()
+    with aioresponses() as m:
+        m.get(f"{RACE_SERVICE_URL}/races?eventId=e1", payload=RACES)
+        for race in RACES:
+            m.get(
+                f"{RACE_SERVICE_URL}/races/{race['id']}",
+                payload={**race, "start_entries": [], "results": {}},
+            )
+
+        first = await RaceplansAdapter().get_all_races_detailed("token", "e1")
+        second = await RaceplansAdapter().get_all_races_detailed("token", "e1")
+
+    assert [race["id"] for race in first] == ["r1", "r2"]
+    assert all("start_entries" in race for race in first)
+    assert second == first
+
+
+@pytest.mark.integration
+async def test_get_all_races_detailed_skips_rounds() -> None:
+    """Should not fetch details for races in skipped rounds."""
+    races_cache.clear()
+    with aioresponses() as m:
+        m.get(f"{RACE_SERVICE_URL}/races?eventId=e1", payload=RACES)
+        m.get(
+            f"{RACE_SERVICE_URL}/races/r2",
+            payload={**RACES[1], "start_entries": [], "results": {}},
+        )
+
+        races = await RaceplansAdapter().get_all_races_detailed(
+            "token", "e1", skip_rounds=("Q",)
+        )
+
+    assert [race["id"] for race in races] == ["r2"]
+    assert ("GET", URL(f"{RACE_SERVICE_URL}/races/r1")) not in m.requests
+
+
+@pytest.mark.integration
+async def test_get_race_kpis_reads_race_list_only() -> None:
+    """Should summarize races from the race list, no race details."""
+    races_cache.clear()
+    races = [
+        {
+            **race,
+            "raceclass": "G12",
+            "heat": 1,
+            "start_time": "2026-01-01T10:00:00",
+            "start_entries": [{"bib": 1}],
+            "results": {},
+        }
+        for race in RACES
+    ]
+    event = {"id": "e1", "timezone": "Europe/Oslo", "competition_format": "X"}
+    raceclasses = [{"name": "G12", "no_of_contestants": 1, "ranking": True}]
+    with aioresponses() as m:
+        m.get(f"{RACE_SERVICE_URL}/races?eventId=e1", payload=races)
+
+        kpis = await get_race_kpis("token", event, raceclasses, "A")
+
+    assert len(m.requests) == 1
+    assert [len(kpis[0]["races_q"]), len(kpis[0]["races_f"])] == [1, 1]
+
+
+@pytest.mark.integration
+async def test_race_order_index_next_race_on_start() -> None:
+    """Should find first race in raceplan order starting after time now."""
+    races = [
+        {
+            "id": "a",
+            "order": 1,
+            "raceclass": "G",
+            "round": "Q",
+            "start_time": "2026-01-01T10:00:00",
+        },
+        {
+            "id": "b",
+            "order": 2,
+            "raceclass": "G",
+            "round": "Q",
+            "start_time": "2026-01-01T10:30:00",
+        },
+        {
+            "id": "c",
+            "order": 3,
+            "raceclass": "J",
+            "round": "Q",
+            "start_time": "2026-01-01T10:10:00",
+        },
+        {
+            "id": "d",
+            "order": 4,
+            "raceclass": "J",
+            "round": "F",
+            "start_time": "2026-01-01T11:00:00",
+        },
+    ]
+    race_index = RaceOrderIndex.from_races(races)
+
+    assert race_index.get_race(3)["id"] == "c"
+    assert race_index.get_race(9) == {}
+    assert race_index.get_next_race_on_start("2026-01-01T09:00:00")["id"] == "a"
+    assert race_index.get_next_race_on_start("2026-01-01T10:05:00")["id"] == "b"
+    assert race_index.get_next_race_on_start("2026-01-01T10:45:00")["id"] == "d"
+    assert race_index.get_next_race_on_start("2026-01-01T12:00:00") == {}
@@ -0,0 +1,71 @@
+"""Integration test cases for request-scoped memoization of adapter reads."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+import pytest
+
+from result_service_gui.adapters import RaceplansAdapter, raceplans_adapter
+from result_service_gui.adapters.http_client import close_client_session
+from result_service_gui.adapters.request_memo import request_memo_middleware
+
+RACE = {"id": "r1", "event_id": "e1", "order": 1, "round": "Q", "index": ""}
+
+
+@pytest.fixture(autouse=True)
+async def shared_session() -> AsyncIterator[None]:
+    """Close the shared client session after each test."""
+    yield
+    await close_client_session()
+
+
+@pytest.fixture
+async def race_service(aiohttp_server: Any, monkeypatch: Any) -> dict:
+    """Start a minimal race-service, return counter of GET requests."""
+    counter = {"get": 0}
+
+    async def get_race(_request: web.Request) -> web.Response:
+        counter["get"] += 1
+        return web.json_response(RACE)
+
+    async def put_race(_request: web.Request) -> web.Response:
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_get("/races/{race_id}", get_race)
+    app.router.add_put("/races/{race_id}", put_race)
+    server = await aiohttp_server(app)
+    monkeypatch.setattr(
+        raceplans_adapter, "RACE_SERVICE_URL", str(server.make_url("")).rstrip("/")
+    )
+    return counter
+
+
+@pytest.mark.integration
+async def test_identical_reads_are_executed_once_per_request(
+    race_service: dict,
+) -> None:
+    """Should share one upstream read per request, and read again after write."""
+
+    async def handler(_request: web.Request) -> web.Response:
+        count_before = race_service["get"]
+        first, second = await asyncio.gather(
+            RaceplansAdapter().get_race_by_id("token", "r1"),
+            RaceplansAdapter().get_race_by_id("token", "r1"),
+        )
+        first["order"] = 99  # callers may mutate their copy
+        assert second == RACE
+        assert race_service["get"] == count_before + 1
+
+        await RaceplansAdapter().update_race("token", "r1", RACE)
+        await RaceplansAdapter().get_race_by_id("token", "r1")
+        assert race_service["get"] == count_before + 2
+        return web.Response()
+
+    await request_memo_middleware(make_mocked_request("GET", "/"), handler)
+    # next request has its own memo
+    await request_memo_middleware(make_mocked_request("GET", "/"), handler)
+    assert race_service["get"] == 4
@@ -0,0 +1,94 @@
+"""Integration test cases for request timing and upstream call accounting."""
+
+from collections.abc import AsyncIterator
+import logging
+from typing import Any
+
+from aiohttp import web
+import pytest
+
+from result_service_gui.adapters import RaceplansAdapter, raceplans_adapter
+from result_service_gui.adapters import request_stats
+from result_service_gui.adapters.http_client import close_client_session
+from result_service_gui.adapters.request_stats import (
+    get_request_stats,
+    request_stats_middleware,
+)
+
+RACE = {"id": "r1", "event_id": "e1", "order": 1, "round": "Q", "index": ""}
+
+
+@pytest.fixture(autouse=True)
+async def shared_session() -> AsyncIterator[None]:
+    """Close the shared client session after each test."""
+    yield
+    await close_client_session()
+
+
+@pytest.mark.integration
+async def test_upstream_calls_are_counted_pr_request(
+    aiohttp_server: Any, aiohttp_client: Any, monkeypatch: Any, caplog: Any
+) -> None:
+    """Should record adapter calls, add Server-Timing and flag many calls."""
+
+    async def get_race(_request: web.Request) -> web.Response:
+        return web.json_response(RACE)
+
+    race_service = web.Application()
+    race_service.router.add_get("/races/{race_id}", get_race)
+    server = await aiohttp_server(race_service)
+    monkeypatch.setattr(
+        raceplans_adapter, "RACE_SERVICE_URL", str(server.make_url("")).rstrip("/")
+    )
+    monkeypatch.setattr(request_stats, "REQUEST_MAX_UPSTREAM_CALLS", 1)
+    calls = []
+
+    async def handler(_request: web.Request) -> web.Response:
+        await RaceplansAdapter().get_race_by_id("token", "r1")
+        await RaceplansAdapter().get_race_by_id("token", "1234")
+        calls.extend(get_request_stats().upstream_calls)
+        return web.Response(text="OK")
+
+    app = web.Application(middlewares=[request_stats_middleware])
+    app.router.add_get("/live", handler)
+    client = await aiohttp_client(app)
+
+    with caplog.at_level(logging.INFO):
+        resp = await client.get("/live")
+    assert resp.status == 200
+    assert "total;dur=" in resp.headers["Server-Timing"]
+    assert "127.0.0.1;dur=" in resp.headers["Server-Timing"]
+    assert [call.adapter_method for call in calls] == [
+        "RaceplansAdapter.get_race_by_id"
+    ] * 2
+    assert [call.path for call in calls] == ["/races/r1", "/races/{id}"]
+    assert all(call.status == 200 for call in calls)
+    assert "Too many upstream calls" in caplog.text
+
+
+@pytest.mark.integration
+async def test_event_stream_is_not_timed(aiohttp_client: Any, caplog: Any) -> None:
+    """Should not time, log or count long-lived event streams in flight."""
+    stats = []
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        stats.append(get_request_stats())
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(b"data: {}\n\n")
+        return response
+
+    app = web.Application(middlewares=[request_stats_middleware])
+    app.router.add_get("/live/stream", handler)
+    client = await aiohttp_client(app)
+
+    with caplog.at_level(logging.INFO):
+        resp = await client.get("/live/stream")
+        await resp.read()
+    assert stats == [None]
+    assert "Server-Timing" not in resp.headers
+    assert not [
+        record
+        for record in caplog.records
+        if record.name != "aiohttp.access" and "/live/stream" in record.message
+    ]
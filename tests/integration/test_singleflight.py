@@ -0,0 +1,35 @@
+"""Integration test cases for coalescing of identical in-flight reads."""
+
+import asyncio
+
+import pytest
+
+from result_service_gui.adapters.singleflight import SingleFlight
+
+
+@pytest.mark.integration
+async def test_concurrent_identical_calls_share_one_call() -> None:
+    """Should execute once for concurrent callers, and again when completed."""
+    single_flight = SingleFlight("test")
+    executed = []
+
+    async def read() -> dict:
+        executed.append(1)
+        await asyncio.sleep(0.01)
+        return {"races": [1, 2]}
+
+    first, second, other = await asyncio.gather(
+        single_flight.do("races", read),
+        single_flight.do("races", read),
+        single_flight.do("other", read),
+    )
+    first["races"].append(3)  # callers may mutate their copy
+    assert second == {"races": [1, 2]}
+    assert other == {"races": [1, 2]}
+    assert len(executed) == 2
+
+    await single_flight.do("races", read)
+    stats = single_flight.stats()
+    assert stats["calls"] == 3
+    assert stats["collapsed"] == 1
+    assert stats["in_flight"] == 0
@@ -0,0 +1,23 @@
+"""Integration test cases for fingerprinted static assets."""
+
+from aiohttp.test_utils import TestClient as _TestClient
+import pytest
+
+from result_service_gui.views.static_assets import static_assets
+
+
+@pytest.mark.integration
+async def test_fingerprinted_static_url_is_cached_as_immutable(
+    client: _TestClient,
+) -> None:
+    """Should cache fingerprinted urls for a year, plain urls as before."""
+    url = static_assets.static_url("styles.css")
+    assert url.startswith("/static/styles.css?v=")
+    assert static_assets.static_url("missing.css") == "/static/missing.css"
+
+    resp = await client.get(url)
+    assert resp.status == 200
+    assert resp.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+    resp = await client.get("/static/styles.css?v=outdated")
+    assert resp.headers["Cache-Control"] == "public, max-age=3600"
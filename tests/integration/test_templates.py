@@ -0,0 +1,14 @@
+"""Integration test cases for template compilation at startup."""
+
+import aiohttp_jinja2
+from aiohttp.test_utils import TestClient as _TestClient
+import pytest
+
+
+@pytest.mark.integration
+async def test_templates_are_compiled_at_startup(client: _TestClient) -> None:
+    """Should have all templates compiled, with bytecode cache and no reload."""
+    env = aiohttp_jinja2.get_env(client.app)
+    assert env.bytecode_cache is not None
+    assert not env.auto_reload
+    assert len(env.cache) == len(env.list_templates(extensions=["html"]))